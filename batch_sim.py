@@ -0,0 +1,144 @@
+"""
+NumPy로 N개의 보드를 한 번에 진행하는 배치 시뮬레이터입니다 (밸런스 조정/통계용).
+
+보드는 bitboard 모듈과 같은 64비트 정수 형식으로 uint64 배열에 저장합니다.
+방향은 bitboard.DIRECTIONS 순서의 정수 코드 (0=left, 1=right, 2=up, 3=down)를 씁니다.
+이동 규칙은 game_core.slide_and_merge_line과 같은 행 테이블을 그대로 사용하고,
+새 타일은 game_core.add_random_tile처럼 빈 칸 중 하나에 2(90%) 또는 4(10%)로 생깁니다.
+"""
+
+import numpy as np
+
+import bitboard
+import game_core
+
+LEFT, RIGHT, UP, DOWN = range(4)
+
+_NIBBLE = np.uint64(0xF)
+_ROW = np.uint64(0xFFFF)
+_ROW_SHIFTS = [np.uint64(16 * i) for i in range(4)]
+_CELL_SHIFTS = np.arange(0, 64, 4, dtype=np.uint64)
+
+# [왼쪽 테이블 | 오른쪽 테이블]을 이어 붙여 방향에 따라 인덱스에 65536을 더해 한 번에 조회합니다.
+_MOVE_TABLE = np.array(bitboard.ROW_LEFT_TABLE + bitboard.ROW_RIGHT_TABLE, dtype=np.uint64)
+_SCORE_TABLE = np.array(bitboard.ROW_SCORE_TABLE + bitboard.ROW_SCORE_RIGHT_TABLE, dtype=np.uint32)
+
+
+def transpose_batch(boards):
+    """bitboard.transpose의 배열 버전입니다."""
+    a1 = boards & np.uint64(0xF0F00F0FF0F00F0F)
+    a2 = boards & np.uint64(0x0000F0F00000F0F0)
+    a3 = boards & np.uint64(0x0F0F00000F0F0000)
+    a = a1 | (a2 << np.uint64(12)) | (a3 >> np.uint64(12))
+    b1 = a & np.uint64(0xFF00FF0000FF00FF)
+    b2 = a & np.uint64(0x00FF00FF00000000)
+    b3 = a & np.uint64(0x00000000FF00FF00)
+    return b1 | (b2 >> np.uint64(24)) | (b3 << np.uint64(24))
+
+
+def move_batch(boards, directions):
+    """
+    각 보드를 대응하는 방향으로 이동합니다.
+    (새 보드 배열, 얻은 점수 배열)을 반환하며, 입력 배열은 바꾸지 않습니다.
+    """
+    directions = np.asarray(directions)
+    vertical = directions >= UP
+    # 위/아래는 전치한 보드에서 왼쪽/오른쪽으로 처리합니다.
+    source = np.where(vertical, transpose_batch(boards), boards)
+    table_offset = ((directions == RIGHT) | (directions == DOWN)).astype(np.intp) << 16
+
+    moved = np.zeros_like(source)
+    scores = np.zeros(source.shape, dtype=np.uint32)
+    for shift in _ROW_SHIFTS:
+        index = ((source >> shift) & _ROW).astype(np.intp) + table_offset
+        moved |= _MOVE_TABLE[index] << shift
+        scores += _SCORE_TABLE[index]
+    return np.where(vertical, transpose_batch(moved), moved), scores
+
+
+def cell_exponents(boards):
+    """(N, 16) 모양의 칸별 지수 배열을 반환합니다 (칸 i = row * 4 + col)."""
+    return ((boards[:, None] >> _CELL_SHIFTS) & _NIBBLE).astype(np.uint8)
+
+
+def empty_counts(boards):
+    """보드마다 빈 칸 수를 반환합니다."""
+    return (cell_exponents(boards) == 0).sum(axis=1)
+
+
+def max_exponents(boards):
+    """보드마다 가장 큰 지수를 반환합니다."""
+    return cell_exponents(boards).max(axis=1)
+
+
+def spawn_batch(boards, rng, mask=None):
+    """
+    mask가 True인 보드 (없으면 전부)의 빈 칸 하나에 새 타일을 놓은 보드 배열을 반환합니다.
+    빈 칸이 없는 보드는 그대로 둡니다.
+    """
+    cells = cell_exponents(boards)
+    empty = cells == 0
+    counts = empty.sum(axis=1)
+    active = counts > 0
+    if mask is not None:
+        active &= mask
+
+    # 보드마다 [0, 빈 칸 수) 중 하나를 고르고, 누적합으로 그 순번의 빈 칸 위치를 찾습니다.
+    pick = (rng.random(len(boards)) * counts).astype(np.int64)
+    position = (np.cumsum(empty, axis=1) > pick[:, None]).argmax(axis=1)
+    exponent = np.where(rng.random(len(boards)) < 1 - game_core.FOUR_PROBABILITY, 1, 2).astype(np.uint64)
+    tile = exponent << (position.astype(np.uint64) * np.uint64(4))
+    return np.where(active, boards | tile, boards)
+
+
+def game_over_mask(boards):
+    """더 이상 움직일 수 없는 보드 (game_core.can_move가 False)를 True로 표시합니다."""
+    cells = cell_exponents(boards).reshape(-1, 4, 4)
+    has_empty = (cells == 0).any(axis=(1, 2))
+    # 최대 지수 (32768) 두 개는 bitboard 행 테이블처럼 합칠 수 없는 쌍으로 봅니다.
+    mergeable = cells < bitboard.MAX_EXPONENT
+    horizontal_pair = ((cells[:, :, 1:] == cells[:, :, :-1]) & mergeable[:, :, 1:]).any(axis=(1, 2))
+    vertical_pair = ((cells[:, 1:, :] == cells[:, :-1, :]) & mergeable[:, 1:, :]).any(axis=(1, 2))
+    return ~(has_empty | horizontal_pair | vertical_pair)
+
+
+def direction_codes(directions):
+    """'left'/'right'/'up'/'down' 문자열 목록을 정수 코드 배열로 변환합니다."""
+    return np.array([bitboard.DIRECTIONS.index(d) for d in directions], dtype=np.int8)
+
+
+class BatchSimulator:
+    """N개의 게임을 함께 진행하는 시뮬레이터입니다."""
+
+    def __init__(self, count, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self.boards = np.zeros(count, dtype=np.uint64)
+        self.scores = np.zeros(count, dtype=np.int64)
+        self.move_counts = np.zeros(count, dtype=np.int64)
+        # 게임 시작 시 타일 두 개
+        self.boards = spawn_batch(self.boards, self.rng)
+        self.boards = spawn_batch(self.boards, self.rng)
+
+    def __len__(self):
+        return len(self.boards)
+
+    def step(self, directions):
+        """
+        모든 보드에 방향 벡터를 적용하고, 실제로 바뀐 보드에만 새 타일을 추가합니다.
+        바뀐 보드를 나타내는 bool 배열을 반환합니다.
+        """
+        moved, gained = move_batch(self.boards, directions)
+        changed = moved != self.boards
+        self.boards = spawn_batch(moved, self.rng, changed)
+        self.scores += gained
+        self.move_counts += changed
+        return changed
+
+    def game_over(self):
+        """게임이 끝난 보드의 mask를 반환합니다."""
+        return game_over_mask(self.boards)
+
+    def max_tiles(self):
+        """보드마다 가장 큰 타일 값을 반환합니다."""
+        exponents = max_exponents(self.boards).astype(np.int64)
+        return np.where(exponents > 0, np.int64(1) << exponents, 0)
@@ -0,0 +1,339 @@
+"""
+게임 엔진과 화면 그리기 비용을 재는 벤치마크 모음입니다. 창 없이 (SDL dummy 드라이버) 실행됩니다.
+
+    python benchmarks.py                         # 모두 실행하고 결과를 표로 출력
+    python benchmarks.py --only engine --json -  # 엔진만, JSON을 표준 출력으로
+    python benchmarks.py --save-baseline         # 결과를 기준값 파일로 저장
+    python benchmarks.py --baseline old.json     # 기준값과 비교 (느려진 항목이 있으면 종료 코드 1)
+
+각 항목은 (이름, 단위, 준비 함수)이며, 준비 함수는 (한 번 호출할 함수, 호출 한 번에 하는 작업 수)를 반환합니다.
+보드는 시드를 고정한 게임에서 뽑으므로 실행할 때마다 같은 입력을 씁니다.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import random
+import sys
+import time
+import timeit
+
+import bitboard
+import game
+import game_core
+import replay
+
+DEFAULT_BASELINE_PATH = 'benchmark_baseline.json'
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.10 # 기준값보다 이 비율 이상 나빠지면 느려진 것으로 표시
+SAMPLE_GAMES = 20 # 대표 보드를 뽑을 게임 수
+SAMPLE_EVERY = 10 # 몇 수마다 보드를 하나씩 뽑을지
+FRAME_SCENARIOS = ((0, 0), (8, 0), (16, 0), (16, 4)) # (움직이는 타일 수, 서브리미널 메시지 수)
+
+
+# --- 입력 보드 ---
+
+def sample_games():
+    """
+    시드를 고정한 corner 정책 게임들에서 (진행 중 보드 목록, 끝난 (가득 찬) 보드 목록)을 만듭니다.
+    """
+    preference = ('down', 'left', 'right', 'up')
+    boards = []
+    full_boards = []
+    for seed in range(SAMPLE_GAMES):
+        board, rng = replay.new_game(seed)
+        moves = 0
+        while True:
+            legal = board.legal_moves()
+            if not legal:
+                break
+            board.move(next(d for d in preference if d in legal))
+            board.add_random_tile(rng)
+            moves += 1
+            if moves % SAMPLE_EVERY == 0:
+                boards.append(board.bits)
+        full_boards.append(board.bits)
+    return boards, full_boards
+
+
+def full_grid_board(size):
+    """합칠 수 있는 이웃이 없도록 2와 4를 체크무늬로 채운 size x size GridBoard를 만듭니다."""
+    board = game_core.GridBoard(size)
+    for i in range(size * size):
+        r, c = divmod(i, size)
+        board._set(i, 2 if (r + c) % 2 == 0 else 4)
+    return board
+
+
+# --- 엔진 벤치마크 ---
+
+def bench_slide_and_merge_line(samples):
+    boards, _ = samples
+    lines = [row for board in boards for row in bitboard.to_values(board)]
+    slide_and_merge_line = game_core.slide_and_merge_line
+
+    def run():
+        for line in lines:
+            slide_and_merge_line(line, False)
+            slide_and_merge_line(line, True)
+    return run, 2 * len(lines)
+
+
+def bench_move_bitboard(samples):
+    boards, _ = samples
+    directions = game_core.DIRECTIONS
+    move = game_core.move
+
+    def run():
+        for board in boards:
+            for direction in directions:
+                move(board, direction)
+    return run, 4 * len(boards)
+
+
+def bench_move_trace(samples):
+    boards, _ = samples
+    directions = game_core.DIRECTIONS
+    move_trace = game_core.move_trace
+
+    def run():
+        for board in boards:
+            for direction in directions:
+                move_trace(board, direction)
+    return run, 4 * len(boards)
+
+
+def bench_move_grid(size):
+    def setup(samples):
+        state = {}
+
+        def restart():
+            state['board'], state['rng'] = replay.new_game(0, size)
+            state['turn'] = 0
+
+        def run():
+            board = state['board']
+            legal = board.legal_moves()
+            if not legal:
+                restart()
+                return
+            state['turn'] += 1
+            board.move(legal[state['turn'] % len(legal)])
+            board.add_random_tile(state['rng'])
+        restart()
+        return run, 1
+    return setup
+
+
+def bench_add_random_tile_full(samples):
+    """가득 찬 보드 (새 타일을 놓을 수 없음)와 빈 칸이 하나뿐인 보드"""
+    _, full_boards = samples
+    one_empty = [bitboard.set_exponent(board, 3, 3, 0) for board in full_boards]
+    rng = random.Random(0)
+    add_random_tile = game_core.add_random_tile
+
+    def run():
+        for board in full_boards:
+            add_random_tile(board, rng)
+        for board in one_empty:
+            add_random_tile(board, rng)
+    return run, 2 * len(full_boards)
+
+
+def bench_can_move_full(samples):
+    _, full_boards = samples
+    can_move = game_core.can_move
+
+    def run():
+        for board in full_boards:
+            can_move(board)
+    return run, len(full_boards)
+
+
+def bench_grid_full(method):
+    def setup(samples):
+        board = full_grid_board(game_core.MAX_BOARD_SIZE)
+        return getattr(board, method), 1
+    return setup
+
+
+# --- 화면 벤치마크 ---
+
+_front_end = None
+
+def load_front_end():
+    """창 없이 게임 모듈을 불러오고 화면을 준비합니다 (처음 한 번만)."""
+    global _front_end
+    if _front_end is None:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        _front_end = importlib.import_module('해커톤')
+        _front_end.init_display()
+    return _front_end
+
+
+def prepare_frame(animating, messages):
+    """
+    4x4 보드를 서로 다른 값의 타일 16개로 채우고, 앞의 animating개에 이동/펄스 트윈을,
+    messages개의 서브리미널 메시지를 띄운 게임 화면 (GameScreen)을 만듭니다.
+    """
+    front_end = load_front_end()
+    view = front_end.GameScreen()
+    view.game = game.Game(front_end.BOARD_SIZE, 0) # 진행 중인 게임 (종료 화면 없음)
+    view.is_game_started = True
+    view.animation_timeline.advance(0.0)
+    size = front_end.BOARD_SIZE
+    tiles = view.tiles
+    for i in range(size * size):
+        r, c = divmod(i, size)
+        slot = view.add_tile(r, c, 2 << (i % 16))
+        if i < animating:
+            # 같은 행의 옆 칸에서 미끄러져 들어오며 펄스
+            tiles.start_cell[slot] = r * size + (c + 1) % size
+            view.animation_timeline.add(slot, tiles.tween_move, front_end.MOVE_ANIMATION_DURATION, front_end.TILE_TWEENS)
+            view.animation_timeline.add(slot, tiles.tween_pulse, front_end.MERGE_ANIMATION_DURATION, front_end.TILE_TWEENS)
+    for i in range(messages):
+        view.show_subliminal_message(i % size, i // size)
+    return front_end, view
+
+
+def bench_frame(draw_name, animating, messages):
+    def setup(samples):
+        front_end, view = prepare_frame(animating, messages)
+        draw = getattr(front_end, draw_name)
+        timeline = view.animation_timeline
+        # 이동 트윈이 끝나지 않도록 이동 시간 안 (0 ~ 거의 1)을 60프레임 주기로 반복합니다.
+        # 펄스는 게임처럼 더 긴 합쳐짐 시간으로 두므로 이동과 함께 진행되는 앞부분만 돕니다.
+        times = [i / 60 * front_end.MOVE_ANIMATION_DURATION * 0.95 for i in range(60)]
+        frame = [0]
+
+        def run():
+            frame[0] = (frame[0] + 1) % 60
+            timeline.advance(times[frame[0]])
+            draw(view)
+        return run, 1
+    return setup
+
+
+def bench_background_text(samples):
+    front_end = load_front_end()
+    surface = front_end.pygame.Surface(front_end.screen.get_size())
+
+    def run():
+        front_end.draw_background_text(surface)
+    return run, 1
+
+
+BENCHMARKS = [
+    ('engine.slide_and_merge_line', 'ops/s', bench_slide_and_merge_line),
+    ('engine.move_bitboard', 'ops/s', bench_move_bitboard),
+    ('engine.move_trace', 'ops/s', bench_move_trace),
+    ('engine.move_grid_8x8', 'ops/s', bench_move_grid(8)),
+    ('engine.move_grid_16x16', 'ops/s', bench_move_grid(16)),
+    ('engine.add_random_tile_full', 'ops/s', bench_add_random_tile_full),
+    ('engine.can_move_full', 'ops/s', bench_can_move_full),
+    ('engine.grid_16x16_add_random_tile_full', 'ops/s', bench_grid_full('add_random_tile')),
+    ('engine.grid_16x16_can_move_full', 'ops/s', bench_grid_full('can_move')),
+]
+for _animating, _messages in FRAME_SCENARIOS:
+    for _draw_name, _label in (('draw_game_board_elements', 'board'), ('draw_game_screen', 'screen')):
+        BENCHMARKS.append(('render.%s.%d_tiles_%d_messages' % (_label, _animating, _messages), 'ms',
+                           bench_frame(_draw_name, _animating, _messages)))
+BENCHMARKS.append(('render.background_text', 'ms', bench_background_text))
+
+
+# --- 실행과 비교 ---
+
+def measure(func, ops, unit, repeat=DEFAULT_REPEAT):
+    """func를 0.2초 이상 걸리도록 반복 호출하는 측정을 repeat번 하고 가장 좋은 값을 반환합니다."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    if unit == 'ms':
+        return best * 1000 / ops
+    return ops / best
+
+
+def run_benchmarks(only=None, repeat=DEFAULT_REPEAT):
+    """선택한 벤치마크를 실행하고 {이름: {'unit', 'value'}}를 반환합니다."""
+    samples = sample_games()
+    results = {}
+    for name, unit, setup in BENCHMARKS:
+        if only and not any(name.startswith(prefix) for prefix in only):
+            continue
+        func, ops = setup(samples)
+        results[name] = {'unit': unit, 'value': measure(func, ops, unit, repeat)}
+    return results
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    각 항목에 기준값 대비 변화를 덧붙이고, 느려진 항목 이름 목록을 반환합니다.
+    speedup은 1보다 크면 빨라진 것입니다 (ops/s는 값이 클수록, ms는 작을수록 좋음).
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base or base['unit'] != result['unit'] or not base['value'] or not result['value']:
+            continue
+        if result['unit'] == 'ms':
+            speedup = base['value'] / result['value']
+        else:
+            speedup = result['value'] / base['value']
+        result['baseline'] = base['value']
+        result['speedup'] = speedup
+        if speedup < 1 - threshold:
+            regressions.append(name)
+    return regressions
+
+
+def environment():
+    info = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+    if _front_end is not None:
+        info['pygame'] = _front_end.pygame.version.ver
+    return info
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="2048 엔진/화면 벤치마크")
+    parser.add_argument('--only', action='append', metavar='PREFIX', help="이름이 PREFIX로 시작하는 항목만 (예: engine, render.board)")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="측정 반복 횟수 (가장 좋은 값을 씀)")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH, help="비교할 기준값 JSON 파일")
+    parser.add_argument('--save-baseline', action='store_true', help="결과를 기준값 파일로 저장")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="느려졌다고 볼 비율 (기본 0.10)")
+    parser.add_argument('--json', metavar='PATH', help="결과를 JSON 파일로 저장 ('-'이면 표준 출력)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.only, args.repeat)
+    regressions = []
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f)['results'], args.threshold)
+    report = {'environment': environment(), 'results': results, 'regressions': regressions}
+
+    if args.json == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+        for name, result in results.items():
+            line = "%-48s %14.4f %s" % (name, result['value'], result['unit'])
+            if 'speedup' in result:
+                line += "  (기준 대비 x%.2f%s)" % (result['speedup'], ", 느려짐" if name in regressions else "")
+            print(line)
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print("기준값 저장: %s" % args.baseline, file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+4x4 2048 보드를 64비트 정수 하나로 다루는 비트보드 엔진입니다.
+
+각 칸은 4비트 지수로 저장됩니다 (0 = 빈 칸, 1 = 2, 2 = 4, ..., 15 = 32768).
+니블 하나에 65536을 담을 수 없으므로 4x4 보드에서는 32768 두 개가 합쳐지지 않습니다 (규칙의 상한, 이동과
+이동 가능 여부 모두 같은 테이블을 따르고 batch_sim.game_over_mask도 같은 상한을 씁니다).
+(row, col) 칸은 비트 4 * (4 * row + col) 위치에 있으므로 한 행이 16비트를 차지하고,
+행 안에서는 가장 낮은 니블이 가장 왼쪽 열입니다.
+이동은 미리 계산한 65536개짜리 행 테이블 조회로 처리하고, 위/아래는 전치 후 같은 테이블을 씁니다.
+"""
+
+ROW_MASK = 0xFFFF
+MAX_EXPONENT = 15 # 니블 하나로 표현 가능한 최대 지수 (32768)
+
+DIRECTIONS = ('left', 'right', 'up', 'down')
+
+
+def _build_row_tables():
+    """
+    65536개 모든 행에 대한 테이블을 만듭니다.
+    왼쪽/오른쪽 이동 결과, 왼쪽/오른쪽 이동 점수, 최대 지수, 빈 칸 수, 이동 가능 방향 (비트 0: 왼쪽, 비트 1: 오른쪽).
+
+    왼쪽 이동은 앞 칸부터 같은 값 두 개를 한 번씩 합치므로, 앞 k칸을 민 결과에 (k + 1)번째 칸을 덧붙이기만 하면
+    k + 1칸을 민 결과가 됩니다. 행마다 따로 밀지 않고 한 칸씩 늘려 가며 만들어 import 시간을 줄입니다.
+    """
+    # 앞 k칸 접두 행마다: 민 결과, 결과 타일 수, 아직 합쳐지지 않은 마지막 타일의 지수 (없으면 0), 점수
+    packed, counts, open_exponents, scores = [0], [0], [0], [0]
+    for k in range(4):
+        next_packed, next_counts, next_open, next_scores = [], [], [], []
+        for e in range(16): # 새 칸이 가장 높은 니블이므로 접두 행 전체를 새 칸 값마다 반복합니다
+            for p, n, o, s in zip(packed, counts, open_exponents, scores):
+                if not e:
+                    next_packed.append(p)
+                    next_counts.append(n)
+                    next_open.append(o)
+                    next_scores.append(s)
+                elif e == o and e < MAX_EXPONENT:
+                    # 마지막 타일과 합쳐집니다. 최대 지수 타일은 니블을 넘치므로 합치지 않습니다.
+                    next_packed.append(p + (1 << (4 * n - 4)))
+                    next_counts.append(n)
+                    next_open.append(0)
+                    next_scores.append(s + (2 << e))
+                else:
+                    next_packed.append(p | (e << (4 * n)))
+                    next_counts.append(n + 1)
+                    next_open.append(e)
+                    next_scores.append(s)
+        packed, counts, open_exponents, scores = next_packed, next_counts, next_open, next_scores
+    left, score = packed, scores
+
+    reverse = [(a << 12) | (b << 8) | (c << 4) | d
+               for d in range(16) for c in range(16) for b in range(16) for a in range(16)]
+    right = [reverse[left[row]] for row in reverse]
+    # 오른쪽 이동 점수는 뒤집은 행을 왼쪽으로 민 점수와 같습니다.
+    score_right = [score[row] for row in reverse]
+    low_max = [max(a, b, c) for c in range(16) for b in range(16) for a in range(16)]
+    max_exponents = [d if d > m else m for d in range(16) for m in low_max]
+    low_empty = [(a == 0) + (b == 0) + (c == 0) for c in range(16) for b in range(16) for a in range(16)]
+    empties = [n + (d == 0) for d in range(16) for n in low_empty]
+    legal = [(l != row) | ((r != row) << 1) for row, l, r in zip(range(65536), left, right)]
+    return left, right, score, score_right, max_exponents, empties, legal
+
+
+(ROW_LEFT_TABLE, ROW_RIGHT_TABLE, ROW_SCORE_TABLE, ROW_SCORE_RIGHT_TABLE,
+ ROW_MAX_TABLE, ROW_EMPTY_TABLE, ROW_LEGAL_TABLE) = _build_row_tables()
+
+
+def transpose(board):
+    """보드를 전치합니다 (행 <-> 열)."""
+    a1 = board & 0xF0F00F0FF0F00F0F
+    a2 = board & 0x0000F0F00000F0F0
+    a3 = board & 0x0F0F00000F0F0000
+    a = a1 | (a2 << 12) | (a3 >> 12)
+    b1 = a & 0xFF00FF0000FF00FF
+    b2 = a & 0x00FF00FF00000000
+    b3 = a & 0x00000000FF00FF00
+    return b1 | (b2 >> 24) | (b3 << 24)
+
+
+def _apply_rows(board, table):
+    """네 행 각각에 행 테이블을 적용합니다."""
+    return (table[board & ROW_MASK]
+            | (table[(board >> 16) & ROW_MASK] << 16)
+            | (table[(board >> 32) & ROW_MASK] << 32)
+            | (table[(board >> 48) & ROW_MASK] << 48))
+
+
+def _rows_score(board, table):
+    """네 행 각각의 테이블 값 (점수, 빈 칸 수 등)을 더합니다."""
+    return (table[board & ROW_MASK]
+            + table[(board >> 16) & ROW_MASK]
+            + table[(board >> 32) & ROW_MASK]
+            + table[(board >> 48) & ROW_MASK])
+
+
+def move_left(board):
+    return _apply_rows(board, ROW_LEFT_TABLE)
+
+
+def move_right(board):
+    return _apply_rows(board, ROW_RIGHT_TABLE)
+
+
+def move_up(board):
+    # 전치하면 열이 행이 되므로 '위'는 전치된 보드에서의 '왼쪽'입니다.
+    return transpose(_apply_rows(transpose(board), ROW_LEFT_TABLE))
+
+
+def move_down(board):
+    return transpose(_apply_rows(transpose(board), ROW_RIGHT_TABLE))
+
+
+MOVE_FUNCTIONS = {
+    'left': move_left,
+    'right': move_right,
+    'up': move_up,
+    'down': move_down,
+}
+
+
+def execute_move(board, direction):
+    """
+    방향에 따라 보드를 이동합니다.
+    (새 보드, 얻은 점수)를 반환하며, 새 보드가 원래 보드와 같으면 이동할 수 없는 방향입니다.
+    """
+    if direction == 'left':
+        return _apply_rows(board, ROW_LEFT_TABLE), _rows_score(board, ROW_SCORE_TABLE)
+    if direction == 'right':
+        return _apply_rows(board, ROW_RIGHT_TABLE), _rows_score(board, ROW_SCORE_RIGHT_TABLE)
+    t = transpose(board)
+    if direction == 'up':
+        return transpose(_apply_rows(t, ROW_LEFT_TABLE)), _rows_score(t, ROW_SCORE_TABLE)
+    if direction == 'down':
+        return transpose(_apply_rows(t, ROW_RIGHT_TABLE)), _rows_score(t, ROW_SCORE_RIGHT_TABLE)
+    raise ValueError("알 수 없는 방향입니다: %r" % (direction,))
+
+
+def get_exponent(board, row, col):
+    """(row, col) 칸의 지수를 반환합니다 (0이면 빈 칸)."""
+    return (board >> (4 * (4 * row + col))) & 0xF
+
+
+def set_exponent(board, row, col, exponent):
+    """(row, col) 칸의 지수를 바꾼 새 보드를 반환합니다."""
+    shift = 4 * (4 * row + col)
+    return (board & ~(0xF << shift)) | (exponent << shift)
+
+
+def value_to_exponent(value):
+    """타일 값 (0, 2, 4, ...)을 지수로 변환합니다."""
+    return value.bit_length() - 1 if value else 0
+
+
+def exponent_to_value(exponent):
+    """지수를 타일 값으로 변환합니다."""
+    return 1 << exponent if exponent else 0
+
+
+def from_values(grid):
+    """4x4 값 리스트 (0은 빈 칸)를 비트보드로 변환합니다."""
+    board = 0
+    for r in range(4):
+        for c in range(4):
+            board |= value_to_exponent(grid[r][c]) << (4 * (4 * r + c))
+    return board
+
+
+def to_values(board):
+    """비트보드를 4x4 값 리스트로 변환합니다."""
+    return [[exponent_to_value((board >> (4 * (4 * r + c))) & 0xF) for c in range(4)] for r in range(4)]
+
+
+def empty_cells(board):
+    """빈 칸의 (row, col) 목록을 반환합니다."""
+    return [(i >> 2, i & 3) for i in range(16) if not (board >> (4 * i)) & 0xF]
+
+
+def count_empty(board):
+    """빈 칸의 개수를 반환합니다."""
+    return _rows_score(board, ROW_EMPTY_TABLE)
+
+
+def max_exponent(board):
+    """보드에서 가장 큰 지수를 반환합니다."""
+    return max(ROW_MAX_TABLE[board & ROW_MASK], ROW_MAX_TABLE[(board >> 16) & ROW_MASK],
+               ROW_MAX_TABLE[(board >> 32) & ROW_MASK], ROW_MAX_TABLE[(board >> 48) & ROW_MASK])
+
+
+def legal_mask(board):
+    """
+    이동 가능한 방향을 비트 마스크로 반환합니다 (DIRECTIONS 순서: 비트 0 왼쪽, 1 오른쪽, 2 위, 3 아래).
+    """
+    t = transpose(board)
+    return ((ROW_LEGAL_TABLE[board & ROW_MASK] | ROW_LEGAL_TABLE[(board >> 16) & ROW_MASK]
+             | ROW_LEGAL_TABLE[(board >> 32) & ROW_MASK] | ROW_LEGAL_TABLE[(board >> 48) & ROW_MASK])
+            | ((ROW_LEGAL_TABLE[t & ROW_MASK] | ROW_LEGAL_TABLE[(t >> 16) & ROW_MASK]
+                | ROW_LEGAL_TABLE[(t >> 32) & ROW_MASK] | ROW_LEGAL_TABLE[(t >> 48) & ROW_MASK]) << 2))
+
+
+def legal_directions(board):
+    """이동 가능한 방향을 DIRECTIONS 순서의 튜플로 반환합니다."""
+    return MASK_DIRECTIONS[legal_mask(board)]
+
+
+# 방향 비트 마스크 -> 방향 튜플
+MASK_DIRECTIONS = tuple(tuple(d for i, d in enumerate(DIRECTIONS) if mask >> i & 1) for mask in range(16))
+
+
+def can_move(board):
+    """어느 방향으로든 이동할 수 있는지 확인합니다."""
+    return legal_mask(board) != 0
@@ -0,0 +1,25 @@
+"""테스트 공용 fixture (pytest가 자동으로 불러옵니다)."""
+
+import pytest
+
+import game_core
+import replay
+
+
+@pytest.fixture
+def record_game():
+    """
+    record_game(seed, size, moves)는 왼쪽 > 아래 > 오른쪽 > 위 순서로 가능한 방향을 두며 리플레이를 기록하고
+    (리플레이, 보드)를 반환합니다.
+    """
+    def record(seed, size=game_core.BOARD_SIZE, moves=200):
+        board, rng = replay.new_game(seed, size)
+        recording = replay.Replay(seed, size)
+        for i in range(moves):
+            direction = next((d for d in ('left', 'down', 'right', 'up') if board.is_legal(d)), None)
+            if direction is None:
+                break
+            gained = board.move(direction)
+            recording.record(direction, gained, rng.spawn(board, i + 2))
+        return recording, board
+    return record
@@ -0,0 +1,516 @@
+"""
+봇 대국과 사람의 게임에서 나온 모든 수를 모으는 열 (column) 단위 말뭉치입니다 (4x4 비트보드).
+
+한 행은 한 수입니다: 이동 전 보드, 방향, 새 타일, 얻은 점수, 게임 번호에 질의용 파생 열 (이동 전 보드의
+최대 지수, 빈 칸 수)이 붙습니다. 열마다 고정 폭 리틀 엔디언 배열 파일 하나 (<열 이름>.col)에 이어 쓰기만 하므로
+np.memmap으로 복사 없이 열리고, 질의는 필요한 열만 CHUNK 단위로 훑습니다 (행 수가 10억이어도 메모리에는
+페이지 캐시만 남습니다). 게임마다 시드와 출처 (SOURCE_NAMES)는 games.<열 이름>.col에 따로 둡니다.
+
+index.bin은 커밋된 행/게임 수와 청크마다 파생 열의 최소/최대 (존 맵)를 담습니다. 쓰는 쪽은 열 파일에 먼저
+덧붙이고 index.bin을 임시 파일로 바꿔 끼워 커밋하므로, 도중에 멈춰도 읽는 쪽은 마지막 커밋까지만 봅니다
+(다시 열 때 커밋되지 않은 꼬리는 잘라 냅니다). 쓰는 쪽은 한 번에 하나만 열 수 있습니다 (writer.lock에 배타적
+잠금 (flock, Windows는 msvcrt.locking)을 잡고, 이미 잡혀 있으면 CorpusError).
+
+    python corpus.py generate games.crp --rows 10000000        # 무작위 봇 (batch_sim)으로 채우기 (측정용)
+    python corpus.py import games.crp a.rpl b.rpl               # 리플레이 파일을 행으로 풀어 넣기
+    python corpus.py query games.crp --min-tile 1024 --limit 5  # 최대 타일이 1024 이상인 보드
+    python corpus.py moves games.crp                            # 빈 칸 수별 방향 분포
+    python 해커톤.py --corpus games.crp                         # 화면 게임을 기록 (자동 진행을 쓴 게임은 봇, game_server.py와 tournament.py도 같은 옵션)
+
+새 타일 열은 (칸 인덱스 << 4) | 지수이고, 0이면 새 타일이 없습니다 (지수는 1 이상이므로 겹치지 않음).
+방향은 game_core.DIRECTIONS 순서의 코드 (replay.DIRECTION_CODES)입니다.
+"""
+
+import argparse
+import os
+import struct
+import sys
+import time
+from array import array
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+    import msvcrt
+
+import batch_sim
+import bitboard
+import game_core
+import replay
+
+MAGIC = b'CRP\x01' # 형식 식별자 + 버전
+INDEX = struct.Struct('<4sIQQ') # MAGIC, 청크 행 수, 커밋된 행 수, 커밋된 게임 수
+INDEX_HEADER_SIZE = 32
+INDEX_NAME = 'index.bin'
+LOCK_NAME = 'writer.lock' # 쓰는 쪽이 열려 있는 동안 배타적 잠금을 잡는 파일
+DEFAULT_CHUNK_ROWS = 1 << 20 # 존 맵 한 칸이자 질의가 한 번에 훑는 행 수
+DEFAULT_FLUSH_ROWS = 1 << 16 # 쓰는 쪽이 이만큼 모이면 파일에 덧붙이고 커밋합니다
+
+ROW_COLUMNS = (
+    ('board', '<u8'), # 이동 전 보드 (bitboard 정수)
+    ('direction', 'u1'),
+    ('spawn', 'u1'), # (칸 인덱스 << 4) | 지수, 없으면 0
+    ('gained', '<u4'), # 이 수로 얻은 점수
+    ('game', '<u4'), # games.* 열의 행 번호
+    ('max_exponent', 'u1'), # 이동 전 보드의 최대 지수 (파생)
+    ('empty', 'u1'), # 이동 전 보드의 빈 칸 수 (파생)
+)
+GAME_COLUMNS = (
+    ('seed', '<u8'), # replay 시드 (replay.new_game과 방향 열로 재현, generate()의 측정용 게임은 일련번호일 뿐)
+    ('source', 'u1'),
+)
+ZONE = np.dtype([('max_low', 'u1'), ('max_high', 'u1'), ('empty_low', 'u1'), ('empty_high', 'u1')])
+
+SOURCE_HUMAN, SOURCE_SERVER, SOURCE_BOT = range(3)
+SOURCE_NAMES = ('human', 'server', 'bot')
+CELLS = game_core.BOARD_SIZE * game_core.BOARD_SIZE
+
+
+class CorpusError(ValueError):
+    """말뭉치 디렉터리가 없거나 형식이 맞지 않을 때 발생합니다."""
+
+
+def spawn_code(spawned):
+    """새 타일 (row, col, value) 또는 None을 새 타일 열의 값으로 바꿉니다."""
+    if spawned is None:
+        return 0
+    r, c, value = spawned
+    return (r * game_core.BOARD_SIZE + c) << 4 | bitboard.value_to_exponent(value)
+
+
+def _column_path(path, name, prefix=''):
+    return os.path.join(path, '%s%s.col' % (prefix, name))
+
+
+def _read_index(path):
+    """(청크 행 수, 행 수, 게임 수, 존 맵 배열)"""
+    try:
+        with open(os.path.join(path, INDEX_NAME), 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        raise CorpusError("말뭉치가 아닙니다 (index.bin 없음): %s" % path) from None
+    if len(data) < INDEX_HEADER_SIZE:
+        raise CorpusError("index.bin이 너무 짧습니다: %s" % path)
+    magic, chunk_rows, rows, games = INDEX.unpack_from(data)
+    chunks = -(-rows // chunk_rows) if chunk_rows else 0
+    if magic != MAGIC or not chunk_rows or len(data) != INDEX_HEADER_SIZE + ZONE.itemsize * chunks:
+        raise CorpusError("말뭉치 형식이 아닙니다: %s" % path)
+    return chunk_rows, rows, games, np.frombuffer(data, ZONE, chunks, INDEX_HEADER_SIZE).copy()
+
+
+def _write_index(path, chunk_rows, rows, games, zones):
+    """임시 파일에 쓰고 바꿔 끼웁니다 (커밋)."""
+    target = os.path.join(path, INDEX_NAME)
+    temporary = target + '.tmp'
+    with open(temporary, 'wb') as f:
+        f.write(INDEX.pack(MAGIC, chunk_rows, rows, games).ljust(INDEX_HEADER_SIZE, b'\0'))
+        f.write(zones.tobytes())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, target)
+
+
+class MoveBuffer:
+    """
+    메모리에 모은 행들입니다 (작업 프로세스가 게임 여러 판의 수를 모아 부모에게 넘길 때도 씁니다).
+    game은 이 버퍼 안의 게임 번호 (begin_game()의 반환값)이고, CorpusWriter.extend()가 말뭉치의 번호로 바꿉니다.
+    """
+
+    __slots__ = ('seeds', 'games', 'boards', 'directions', 'spawns', 'gains')
+
+    def __init__(self):
+        self.seeds = []
+        self.games = array('I')
+        self.boards = array('Q')
+        self.directions = array('B')
+        self.spawns = array('B')
+        self.gains = array('I')
+
+    def __len__(self):
+        return len(self.boards)
+
+    def begin_game(self, seed):
+        self.seeds.append(seed)
+        return len(self.seeds) - 1
+
+    def recorder(self, game_):
+        """
+        game.Game.recorder에 꽂을 함수를 반환합니다. 게임 하나를 이 버퍼에 모았다가 출처가 정해지면
+        CorpusWriter.extend()로 덧붙일 때 씁니다 (되돌린 수도 실제로 둔 수이므로 남깁니다).
+        """
+        game_id = self.begin_game(game_.seed)
+        codes = replay.DIRECTION_CODES
+
+        def record(before, direction, gained, spawned):
+            self.append(game_id, before, codes[direction], spawn_code(spawned), gained)
+        return record
+
+    def append(self, game, board, direction_code, spawn, gained):
+        self.games.append(game)
+        self.boards.append(board)
+        self.directions.append(direction_code)
+        self.spawns.append(spawn)
+        self.gains.append(gained)
+
+
+def _try_lock(f):
+    """f (잠금 파일)에 배타적 잠금을 시도하고, 다른 쪽이 잡고 있으면 False를 반환합니다."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1) # 첫 바이트 (파일보다 길어도 잠글 수 있음)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(f):
+    """_try_lock()으로 잡은 잠금을 풀고 파일을 닫습니다 (flock은 닫으면 풀리지만 msvcrt는 먼저 풀어야 합니다)."""
+    if fcntl is None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    f.close()
+
+
+class CorpusWriter:
+    """
+    말뭉치에 행을 덧붙입니다 (없으면 디렉터리를 만듭니다). 행은 메모리에 모았다가 flush_rows개마다,
+    그리고 flush()/close()에서 열 파일에 덧붙이고 커밋합니다.
+    """
+
+    def __init__(self, path, chunk_rows=DEFAULT_CHUNK_ROWS, flush_rows=DEFAULT_FLUSH_ROWS):
+        self.path = path
+        self.flush_rows = flush_rows
+        os.makedirs(path, exist_ok=True)
+        # 다른 쓰는 쪽이 열려 있으면 꼬리를 자르거나 같은 게임 번호를 내주지 않도록 여기서 멈춥니다.
+        self._lock = open(os.path.join(path, LOCK_NAME), 'a+b')
+        if not _try_lock(self._lock):
+            self._lock.close()
+            raise CorpusError("다른 쓰는 쪽이 이미 이 말뭉치를 열고 있습니다: %s" % path) from None
+        try:
+            if not os.path.exists(os.path.join(path, INDEX_NAME)):
+                _write_index(path, chunk_rows, 0, 0, np.zeros(0, ZONE))
+            self.chunk_rows, self.rows, self.games, self.zones = _read_index(path)
+            # 커밋되지 않은 꼬리 (덧붙이다 멈춘 부분)를 잘라 냅니다.
+            for columns, count, prefix in ((ROW_COLUMNS, self.rows, ''), (GAME_COLUMNS, self.games, 'games.')):
+                for name, dtype in columns:
+                    with open(_column_path(path, name, prefix), 'ab') as f:
+                        f.truncate(count * np.dtype(dtype).itemsize)
+        except BaseException:
+            _unlock(self._lock)
+            raise
+        self.pending = MoveBuffer() # game은 말뭉치의 게임 번호
+        self.pending_sources = array('B')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """남은 행을 커밋하고 쓰기 잠금을 풉니다 (여러 번 불러도 됩니다)."""
+        if self._lock.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            _unlock(self._lock)
+
+    def begin_game(self, seed, source):
+        """새 게임을 등록하고 말뭉치의 게임 번호를 반환합니다."""
+        self.pending_sources.append(source)
+        return self.games + self.pending.begin_game(seed)
+
+    def append_move(self, game, board, direction_code, spawn, gained):
+        self.pending.append(game, board, direction_code, spawn, gained)
+        if len(self.pending) >= self.flush_rows:
+            self.flush()
+
+    def append_rows(self, games, boards, directions, spawns, gains):
+        """여러 행을 배열 (numpy 또는 array)로 한꺼번에 덧붙입니다. games는 말뭉치의 게임 번호입니다."""
+        pending = self.pending
+        pending.games.frombytes(np.asarray(games, np.uint32).tobytes())
+        pending.boards.frombytes(np.asarray(boards, np.uint64).tobytes())
+        pending.directions.frombytes(np.asarray(directions, np.uint8).tobytes())
+        pending.spawns.frombytes(np.asarray(spawns, np.uint8).tobytes())
+        pending.gains.frombytes(np.asarray(gains, np.uint32).tobytes())
+        if len(pending) >= self.flush_rows:
+            self.flush()
+
+    def extend(self, buffer, source):
+        """MoveBuffer 하나 (게임 번호는 버퍼 안의 번호)를 통째로 덧붙입니다."""
+        base = self.games + len(self.pending.seeds)
+        for seed in buffer.seeds:
+            self.begin_game(seed, source)
+        self.append_rows(np.frombuffer(buffer.games, np.uint32) + np.uint32(base),
+                         buffer.boards, buffer.directions, buffer.spawns, buffer.gains)
+
+    def recorder(self, game_, source):
+        """
+        game.Game.recorder에 꽂을 함수를 반환합니다 (4x4가 아니면 None). 게임의 수가 하나씩 바로 행이 됩니다
+        (되돌린 수도 실제로 둔 수이므로 남깁니다).
+        """
+        if game_.size != game_core.BOARD_SIZE:
+            return None
+        game_id = self.begin_game(game_.seed, source)
+        codes = replay.DIRECTION_CODES
+
+        def record(before, direction, gained, spawned):
+            self.append_move(game_id, before, codes[direction], spawn_code(spawned), gained)
+        return record
+
+    def add_replay(self, replay_, source=SOURCE_HUMAN):
+        """리플레이 (replay.Replay)를 다시 두며 행으로 풀어 넣고 수를 반환합니다."""
+        if replay_.size != game_core.BOARD_SIZE:
+            raise CorpusError("말뭉치는 %dx%d 보드만 담습니다 (리플레이: %dx%d)"
+                              % (game_core.BOARD_SIZE, game_core.BOARD_SIZE, replay_.size, replay_.size))
+        board, rng = replay.new_game(replay_.seed, replay_.size)
+        game_id = self.begin_game(replay_.seed, source)
+        count = 0
+        for i, code in enumerate(replay_.moves, 1):
+            before = board.bits
+            gained = board.move(game_core.DIRECTIONS[code])
+            if gained is None:
+                raise replay.ReplayError("%d번째 수 (%s)로 보드가 바뀌지 않습니다" % (i, game_core.DIRECTIONS[code]))
+            self.append_move(game_id, before, code, spawn_code(rng.spawn(board, i + 1)), gained)
+            count += 1
+        return count
+
+    def flush(self):
+        """모은 행과 게임을 열 파일에 덧붙이고 index.bin을 바꿔 끼워 커밋합니다."""
+        pending = self.pending
+        if not len(pending) and not pending.seeds:
+            return
+        boards = np.frombuffer(pending.boards, np.uint64)
+        max_exponents = batch_sim.max_exponents(boards)
+        empty = batch_sim.empty_counts(boards).astype(np.uint8)
+        rows = {
+            'board': boards,
+            'direction': np.frombuffer(pending.directions, np.uint8),
+            'spawn': np.frombuffer(pending.spawns, np.uint8),
+            'gained': np.frombuffer(pending.gains, np.uint32),
+            'game': np.frombuffer(pending.games, np.uint32),
+            'max_exponent': max_exponents,
+            'empty': empty,
+        }
+        games = {'seed': np.array(pending.seeds, np.uint64), 'source': np.frombuffer(self.pending_sources, np.uint8)}
+        for columns, values, prefix in ((ROW_COLUMNS, rows, ''), (GAME_COLUMNS, games, 'games.')):
+            for name, dtype in columns:
+                with open(_column_path(self.path, name, prefix), 'ab') as f:
+                    f.write(values[name].astype(dtype, copy=False).tobytes())
+                    f.flush()
+                    os.fsync(f.fileno())
+
+        # 존 맵: 새 행이 걸친 청크마다 최소/최대를 (이미 일부 찬 청크는 기존 값과) 합칩니다.
+        start, end = self.rows, self.rows + len(boards)
+        chunk_rows = self.chunk_rows
+        zones = self.zones
+        new_chunks = -(-end // chunk_rows) - len(zones)
+        if new_chunks:
+            zones = np.concatenate([zones, np.array([(255, 0, 255, 0)] * new_chunks, ZONE)])
+        for chunk in range(start // chunk_rows, -(-end // chunk_rows) if end > start else 0):
+            low = max(start, chunk * chunk_rows) - start
+            high = min(end, (chunk + 1) * chunk_rows) - start
+            zones['max_low'][chunk] = min(zones['max_low'][chunk], max_exponents[low:high].min())
+            zones['max_high'][chunk] = max(zones['max_high'][chunk], max_exponents[low:high].max())
+            zones['empty_low'][chunk] = min(zones['empty_low'][chunk], empty[low:high].min())
+            zones['empty_high'][chunk] = max(zones['empty_high'][chunk], empty[low:high].max())
+        games_count = self.games + len(pending.seeds)
+        _write_index(self.path, chunk_rows, end, games_count, zones)
+        self.rows, self.games, self.zones = end, games_count, zones
+        self.pending = MoveBuffer()
+        self.pending_sources = array('B')
+
+
+class Corpus:
+    """
+    커밋된 말뭉치를 np.memmap으로 엽니다 (여는 순간의 커밋까지만 보이고, 쓰는 쪽이 덧붙여도 바뀌지 않습니다).
+    column(name)은 행 열, game_column(name)은 게임 열의 memmap이고, 질의 함수는 청크 단위로 훑습니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.chunk_rows, self.rows, self.games, self.zones = _read_index(path)
+        self._columns = {}
+        self._game_columns = {}
+
+    def __len__(self):
+        return self.rows
+
+    def _map(self, cache, columns, prefix, count, name):
+        mapped = cache.get(name)
+        if mapped is None:
+            dtype = dict(columns).get(name)
+            if dtype is None:
+                raise KeyError(name)
+            file_path = _column_path(self.path, name, prefix)
+            if os.path.getsize(file_path) < count * np.dtype(dtype).itemsize:
+                raise CorpusError("열 파일이 index.bin보다 짧습니다: %s" % file_path)
+            if count:
+                mapped = np.memmap(file_path, dtype, mode='r', shape=(count,))
+            else:
+                mapped = np.zeros(0, dtype) # 빈 파일은 mmap할 수 없습니다
+            cache[name] = mapped
+        return mapped
+
+    def column(self, name):
+        return self._map(self._columns, ROW_COLUMNS, '', self.rows, name)
+
+    def game_column(self, name):
+        return self._map(self._game_columns, GAME_COLUMNS, 'games.', self.games, name)
+
+    def chunks(self, *names, zone_filter=None):
+        """
+        (첫 행 번호, [열 조각, ...])를 청크마다 냅니다. 조각은 memmap의 뷰라 복사하지 않습니다.
+        zone_filter(존 맵 한 칸)이 False인 청크는 열을 건드리지 않고 건너뜁니다.
+        """
+        columns = [self.column(name) for name in names]
+        chunk_rows = self.chunk_rows
+        for chunk, zone in enumerate(self.zones):
+            if zone_filter is not None and not zone_filter(zone):
+                continue
+            start = chunk * chunk_rows
+            yield start, [column[start:start + chunk_rows] for column in columns]
+
+    def positions_with_max_tile(self, min_value):
+        """
+        최대 타일이 min_value 이상인 이동 전 보드를 (행 번호 배열, 보드 배열)로 청크마다 냅니다.
+        존 맵으로 해당 타일이 없는 청크는 건너뛰고, 나머지 청크도 1바이트짜리 파생 열만 훑습니다.
+        """
+        exponent = bitboard.value_to_exponent(min_value)
+        boards = self.column('board')
+        for start, (max_exponents,) in self.chunks('max_exponent', zone_filter=lambda zone: zone['max_high'] >= exponent):
+            rows = np.flatnonzero(max_exponents >= exponent)
+            if len(rows):
+                rows += start
+                yield rows, boards[rows]
+
+    def count_positions_with_max_tile(self, min_value):
+        """최대 타일이 min_value 이상인 행 수 (존 맵의 최소가 넘는 청크는 훑지 않고 통째로 셉니다)."""
+        exponent = bitboard.value_to_exponent(min_value)
+        total = 0
+        for start, (max_exponents,) in self.chunks('max_exponent', zone_filter=lambda zone: zone['max_high'] >= exponent):
+            if self.zones[start // self.chunk_rows]['max_low'] >= exponent:
+                total += len(max_exponents)
+            else:
+                total += int(np.count_nonzero(max_exponents >= exponent))
+        return total
+
+    def move_distribution_by_empty(self):
+        """(CELLS + 1, 4) int64 배열: [빈 칸 수, 방향 코드]의 행 수 (이동 전 보드 기준)."""
+        counts = np.zeros((CELLS + 1) * 4, np.int64)
+        for _, (empty, directions) in self.chunks('empty', 'direction'):
+            counts += np.bincount(empty.astype(np.intp) * 4 + directions, minlength=len(counts))
+        return counts.reshape(CELLS + 1, 4)
+
+    def max_tile_distribution(self):
+        """지수별 행 수 (이동 전 보드의 최대 지수 기준, 길이 16)"""
+        counts = np.zeros(16, np.int64)
+        for _, (max_exponents,) in self.chunks('max_exponent'):
+            counts += np.bincount(max_exponents, minlength=16)
+        return counts
+
+
+# --- 명령행 ---
+
+def generate(writer, rows, lanes, seed):
+    """무작위 방향을 두는 봇 lanes판을 batch_sim으로 함께 진행하며 rows행 이상을 채웁니다 (질의 속도 측정용)."""
+    rng = np.random.default_rng(seed)
+    boards = batch_sim.spawn_batch(batch_sim.spawn_batch(np.zeros(lanes, np.uint64), rng), rng)
+    lane_games = np.array([writer.begin_game(seed + i, SOURCE_BOT) for i in range(lanes)], np.uint32)
+    next_seed = seed + lanes
+    written = 0
+    while written < rows:
+        directions = rng.integers(0, 4, lanes).astype(np.uint8)
+        moved, gained = batch_sim.move_batch(boards, directions)
+        changed = moved != boards
+        after = batch_sim.spawn_batch(moved, rng, changed)
+        # 새 타일은 이동 뒤 보드와 다른 니블 하나입니다.
+        spawns = np.zeros(lanes, np.uint8)
+        for cell, exponent in enumerate(batch_sim.cell_exponents(after ^ moved).T):
+            spawns[exponent != 0] = (cell << 4) | exponent[exponent != 0]
+        writer.append_rows(lane_games[changed], boards[changed], directions[changed], spawns[changed], gained[changed])
+        written += int(changed.sum())
+        boards = after
+        over = batch_sim.game_over_mask(boards)
+        for lane in np.flatnonzero(over):
+            lane_games[lane] = writer.begin_game(next_seed, SOURCE_BOT)
+            next_seed += 1
+        if over.any():
+            boards[over] = batch_sim.spawn_batch(batch_sim.spawn_batch(np.zeros(int(over.sum()), np.uint64), rng), rng)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="2048 수 말뭉치 (열 단위, memmap)")
+    commands = parser.add_subparsers(dest='command', required=True)
+    command = commands.add_parser('generate', help="무작위 봇의 수로 채웁니다 (측정용)")
+    command.add_argument('path')
+    command.add_argument('--rows', type=int, default=1000000)
+    command.add_argument('--lanes', type=int, default=4096, help="함께 진행할 게임 수")
+    command.add_argument('--seed', type=int, default=0)
+    command.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS, help="새로 만들 때의 청크 행 수")
+    command = commands.add_parser('import', help="리플레이 파일을 행으로 풀어 넣습니다")
+    command.add_argument('path')
+    command.add_argument('replays', nargs='+', metavar='REPLAY')
+    command.add_argument('--source', choices=SOURCE_NAMES, default='human')
+    command = commands.add_parser('info', help="행/게임 수와 최대 타일 분포")
+    command.add_argument('path')
+    command = commands.add_parser('query', help="최대 타일이 --min-tile 이상인 보드")
+    command.add_argument('path')
+    command.add_argument('--min-tile', type=int, default=1024)
+    command.add_argument('--limit', type=int, default=10, help="출력할 보드 수 (개수는 모두 셉니다)")
+    command = commands.add_parser('moves', help="빈 칸 수별 방향 분포")
+    command.add_argument('path')
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        if args.command == 'generate':
+            with CorpusWriter(args.path, args.chunk_rows) as writer:
+                written = generate(writer, args.rows, args.lanes, args.seed)
+            print("%d행을 썼습니다 (%.2f초)" % (written, time.perf_counter() - started))
+        elif args.command == 'import':
+            with CorpusWriter(args.path) as writer:
+                for replay_path in args.replays:
+                    count = writer.add_replay(replay.Replay.load(replay_path), SOURCE_NAMES.index(args.source))
+                    print("%s: %d수" % (replay_path, count))
+        elif args.command == 'info':
+            corpus = Corpus(args.path)
+            sources = np.bincount(corpus.game_column('source'), minlength=len(SOURCE_NAMES))
+            print("행 %d개, 게임 %d판 (%s), 청크 %d개 (청크당 %d행)"
+                  % (len(corpus), corpus.games, ", ".join("%s %d" % item for item in zip(SOURCE_NAMES, sources)),
+                     len(corpus.zones), corpus.chunk_rows))
+            distribution = corpus.max_tile_distribution()
+            print("최대 타일별 행 수:", ", ".join("%d: %d" % (bitboard.exponent_to_value(e), n)
+                                              for e, n in enumerate(distribution) if n))
+        elif args.command == 'query':
+            corpus = Corpus(args.path)
+            total = 0
+            for rows, boards in corpus.positions_with_max_tile(args.min_tile):
+                for row, board in zip(rows[:max(0, args.limit - total)], boards):
+                    print("행 %d: %s" % (row, bitboard.to_values(int(board))))
+                total += len(rows)
+            print("최대 타일 %d 이상: %d행 / %d행" % (args.min_tile, total, len(corpus)))
+        else:
+            corpus = Corpus(args.path)
+            counts = corpus.move_distribution_by_empty()
+            print("빈 칸  " + "".join("%10s" % d for d in game_core.DIRECTIONS) + "      합계")
+            for empty, row in enumerate(counts):
+                if row.sum():
+                    print("%5d  " % empty + "".join("%9.1f%%" % (100 * n / row.sum()) for n in row) + "%10d" % row.sum())
+    except (OSError, CorpusError, replay.ReplayError) as e:
+        parser.error(str(e))
+    if args.command != 'generate':
+        print("%.3f초" % (time.perf_counter() - started))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
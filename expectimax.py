@@ -0,0 +1,236 @@
+"""
+game_core 규칙 위에서 동작하는 깊이 제한 expectimax 탐색입니다 (자동 진행/힌트용).
+
+- 플레이어 노드는 네 방향 중 최댓값, 확률 노드는 빈 칸마다 2(90%)/4(10%) 기댓값을 계산합니다.
+- 보드 평가 (빈 칸, 단조성, 평탄도, 합칠 수 있는 쌍)는 16비트 행 단위로 미리 계산한 테이블로 캐시합니다.
+- 같은 보드를 다시 평가하지 않도록 크기가 제한된 LRU 전치 테이블을 사용합니다.
+- 시간 예산 안에서 반복 심화로 탐색하고, 끝까지 마친 가장 깊은 결과를 반환합니다.
+"""
+
+import time
+from collections import OrderedDict
+
+import bitboard
+import game_core
+
+# 평가 함수 가중치
+LOST_PENALTY = 200000.0
+EMPTY_WEIGHT = 270.0
+MERGES_WEIGHT = 700.0
+MONOTONICITY_POWER = 4.0
+MONOTONICITY_WEIGHT = 47.0
+SMOOTHNESS_WEIGHT = 10.0
+SUM_POWER = 3.5
+SUM_WEIGHT = 11.0
+
+CPROB_THRESHOLD = 0.0001 # 이보다 일어날 확률이 낮은 분기는 더 깊이 보지 않습니다
+DEFAULT_MAX_DEPTH = 5
+DEFAULT_TIME_BUDGET = 0.016 # 초 (60 FPS 한 프레임)
+DEFAULT_TT_ENTRIES = 200000
+
+_row_heuristic_table = None # 첫 사용 시 생성 (import 시간을 늘리지 않기 위해)
+
+
+class SearchTimeout(Exception):
+    """시간 예산을 다 써서 현재 깊이의 탐색을 중단할 때 사용합니다."""
+
+
+class TranspositionTable:
+    """보드 -> (탐색 깊이, 값)을 저장하는 크기 제한 LRU 전치 테이블입니다."""
+
+    def __init__(self, max_entries=DEFAULT_TT_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, board, depth):
+        """깊이가 depth 이상으로 탐색된 값이 있으면 반환하고, 없으면 None을 반환합니다."""
+        entry = self.entries.get(board)
+        if entry is not None and entry[0] >= depth:
+            self.entries.move_to_end(board)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def put(self, board, depth, value):
+        self.entries[board] = (depth, value)
+        self.entries.move_to_end(board)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False) # 가장 오래 쓰지 않은 항목 제거
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+
+def _score_row(row):
+    """16비트 행 하나의 평가 점수를 계산합니다 (테이블 생성용)."""
+    line = [(row >> (4 * i)) & 0xF for i in range(4)]
+    empty = line.count(0)
+    total = sum(e ** SUM_POWER for e in line)
+
+    merges = 0
+    previous = 0
+    counter = 0
+    for e in line:
+        if e == 0:
+            continue
+        if e == previous:
+            counter += 1
+        elif counter > 0:
+            merges += 1 + counter
+            counter = 0
+        previous = e
+    if counter > 0:
+        merges += 1 + counter
+
+    monotonicity_left = 0.0
+    monotonicity_right = 0.0
+    for i in range(3):
+        a = line[i] ** MONOTONICITY_POWER
+        b = line[i + 1] ** MONOTONICITY_POWER
+        if line[i] > line[i + 1]:
+            monotonicity_left += a - b
+        else:
+            monotonicity_right += b - a
+
+    # 평탄도: 이웃한 (빈 칸이 아닌) 타일끼리 지수 차이가 작을수록 좋습니다.
+    tiles = [e for e in line if e]
+    roughness = sum(abs(tiles[i] - tiles[i + 1]) for i in range(len(tiles) - 1))
+
+    return (LOST_PENALTY
+            + EMPTY_WEIGHT * empty
+            + MERGES_WEIGHT * merges
+            - MONOTONICITY_WEIGHT * min(monotonicity_left, monotonicity_right)
+            - SMOOTHNESS_WEIGHT * roughness
+            - SUM_WEIGHT * total)
+
+
+def _heuristic_table():
+    global _row_heuristic_table
+    if _row_heuristic_table is None:
+        _row_heuristic_table = [_score_row(row) for row in range(65536)]
+    return _row_heuristic_table
+
+
+def evaluate(board):
+    """보드의 휴리스틱 점수를 반환합니다 (행과 열의 테이블 값 합)."""
+    table = _heuristic_table()
+    t = bitboard.transpose(board)
+    return (table[board & 0xFFFF] + table[(board >> 16) & 0xFFFF]
+            + table[(board >> 32) & 0xFFFF] + table[board >> 48]
+            + table[t & 0xFFFF] + table[(t >> 16) & 0xFFFF]
+            + table[(t >> 32) & 0xFFFF] + table[t >> 48])
+
+
+class _Search:
+    """한 번의 탐색에서 공유하는 상태 (전치 테이블, 마감 시각, 방문 노드 수)."""
+
+    def __init__(self, table, deadline):
+        self.table = table
+        self.deadline = deadline
+        self.nodes = 0
+
+    def max_node(self, board, depth, cprob):
+        """플레이어 차례: 가능한 방향 중 최대 기댓값 (움직일 수 없으면 0)."""
+        best = 0.0
+        for direction in bitboard.DIRECTIONS:
+            new_board = bitboard.MOVE_FUNCTIONS[direction](board)
+            if new_board != board:
+                value = self.chance_node(new_board, depth - 1, cprob)
+                if value > best:
+                    best = value
+        return best
+
+    def chance_node(self, board, depth, cprob):
+        """새 타일 차례: 빈 칸마다 2(90%)/4(10%)가 나올 때의 평균 기댓값."""
+        self.nodes += 1
+        if self.nodes & 0x3F == 0 and time.perf_counter() > self.deadline:
+            raise SearchTimeout()
+
+        if depth <= 0 or cprob < CPROB_THRESHOLD:
+            return evaluate(board)
+        cached = self.table.get(board, depth)
+        if cached is not None:
+            return cached
+
+        shifts = [4 * i for i in range(16) if not (board >> (4 * i)) & 0xF]
+        if not shifts:
+            return evaluate(board)
+        cprob /= len(shifts)
+        two_probability = 1 - game_core.FOUR_PROBABILITY
+        total = 0.0
+        for shift in shifts:
+            total += two_probability * self.max_node(board | (1 << shift), depth, cprob * two_probability)
+            total += game_core.FOUR_PROBABILITY * self.max_node(board | (2 << shift), depth, cprob * game_core.FOUR_PROBABILITY)
+        value = total / len(shifts)
+        self.table.put(board, depth, value)
+        return value
+
+
+_shared_table = TranspositionTable()
+
+
+def score_moves(board, depth, table=None, deadline=None):
+    """
+    depth 수 앞까지 탐색한 각 방향의 기댓값을 {방향: 값}으로 반환합니다 (이동 불가 방향 제외).
+    deadline (perf_counter 기준)을 넘기면 SearchTimeout을 발생시킵니다.
+    """
+    search = _Search(table if table is not None else _shared_table,
+                     deadline if deadline is not None else float('inf'))
+    scores = {}
+    for direction in bitboard.DIRECTIONS:
+        new_board = bitboard.MOVE_FUNCTIONS[direction](board)
+        if new_board != board:
+            scores[direction] = search.chance_node(new_board, depth - 1, 1.0)
+    return scores
+
+
+def score_spawns(board, shifts, depth, table=None, deadline=None):
+    """
+    확률 노드 하나를 여러 프로세스에 나누어 계산할 때 쓰는 부분합입니다.
+    board의 빈 칸 중 shifts (니블 시프트 목록)에 2/4가 나오는 경우의 가중 기댓값 합을 반환합니다.
+    board의 모든 빈 칸에 대한 부분합을 더해 빈 칸 수로 나누면 depth + 1 깊이로 탐색한 score_moves()의 값과 같습니다.
+    """
+    search = _Search(table if table is not None else _shared_table,
+                     deadline if deadline is not None else float('inf'))
+    cprob = 1.0 / bitboard.count_empty(board)
+    two_probability = 1 - game_core.FOUR_PROBABILITY
+    total = 0.0
+    for shift in shifts:
+        total += two_probability * search.max_node(board | (1 << shift), depth, cprob * two_probability)
+        total += game_core.FOUR_PROBABILITY * search.max_node(board | (2 << shift), depth, cprob * game_core.FOUR_PROBABILITY)
+    return total
+
+
+def best_move(board, max_depth=DEFAULT_MAX_DEPTH, time_budget=DEFAULT_TIME_BUDGET, table=None):
+    """
+    시간 예산 (초) 안에서 반복 심화로 최선의 방향을 찾습니다.
+    끝까지 탐색한 가장 깊은 결과의 방향을 반환하며, 움직일 수 없으면 None을 반환합니다.
+    """
+    deadline = time.perf_counter() + time_budget
+    best_direction = None
+    for depth in range(1, max_depth + 1):
+        try:
+            scores = score_moves(board, depth, table, deadline)
+        except SearchTimeout:
+            break
+        if not scores:
+            return None
+        best_direction = max(scores, key=scores.get)
+        if time.perf_counter() > deadline:
+            break
+    if best_direction is None:
+        # 깊이 1조차 끝내지 못했다면 평가 함수만으로 고릅니다.
+        best_value = -1.0
+        for direction in bitboard.DIRECTIONS:
+            new_board = bitboard.MOVE_FUNCTIONS[direction](board)
+            if new_board != board and evaluate(new_board) > best_value:
+                best_direction, best_value = direction, evaluate(new_board)
+    return best_direction
@@ -0,0 +1,158 @@
+"""
+프레임을 단계별 (이벤트 처리, 게임 로직, 배경, 타일, 메시지, 화면 전송 등)로 나누어 재는 프로파일러입니다.
+
+메인 루프는 프레임 시작에 begin_frame(), 각 단계가 끝날 때 mark(단계)를, 화면을 보낸 뒤 end_frame()을 부릅니다.
+mark()는 직전 표시 이후 흐른 시간을 그 단계에 더하므로, 단계가 여러 곳에 나뉘어 있어도 합산됩니다.
+꺼져 있을 때 각 호출은 enabled 확인 한 번으로 끝납니다.
+
+최근 WINDOW_FRAMES 프레임의 p50/p95/p99와 처리 시간이 프레임 예산 (1/FPS)을 넘긴 프레임 수를
+오버레이로 보여 주고, 게임 시작부터의 단계별 히스토그램을 JSON 파일로 저장할 수 있습니다.
+"""
+
+import json
+import time
+from collections import deque
+
+import pygame
+
+PHASES = ('events', 'logic', 'background', 'tiles', 'messages', 'overlay', 'present')
+WINDOW_FRAMES = 240 # 오버레이 백분위수를 계산할 최근 프레임 수
+BUCKET_MS = 0.25 # 히스토그램 칸 너비 (밀리초)
+BUCKET_COUNT = 400 # 칸 수 (마지막 칸은 100ms 이상 전부)
+OVERLAY_REFRESH_FRAMES = 15 # 오버레이 글자는 이 프레임마다 다시 렌더링합니다
+OVERLAY_POSITION = (8, 8)
+OVERLAY_BACKGROUND = (0, 0, 0, 170)
+OVERLAY_TEXT_COLOR = (255, 255, 255)
+OVERLAY_WARNING_COLOR = (255, 120, 100)
+
+
+def _percentile(sorted_values, fraction):
+    """정렬된 목록의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def _histogram_percentile(counts, fraction):
+    """히스토그램에서 백분위수가 들어 있는 칸의 위쪽 경계 (밀리초)"""
+    total = sum(counts)
+    if not total:
+        return 0.0
+    target = fraction * total
+    running = 0
+    for i, count in enumerate(counts):
+        running += count
+        if running >= target:
+            return (i + 1) * BUCKET_MS
+    return BUCKET_COUNT * BUCKET_MS
+
+
+class FrameProfiler:
+    """프레임 단계별 시간, 최근 백분위수, 히스토그램, 예산 초과 프레임 수를 모읍니다."""
+
+    def __init__(self, fps, clock=time.perf_counter):
+        self.clock = clock
+        self.budget_ms = 1000.0 / fps
+        self.enabled = False # 측정 여부 (오버레이를 켜거나 저장 경로가 있으면 True)
+        self.visible = False # 오버레이 표시 여부
+        self.frames = 0
+        self.dropped_frames = 0
+        self.current = dict.fromkeys(PHASES, 0.0) # 이번 프레임의 단계별 시간 (초)
+        self.last_mark = 0.0
+        self.recent = {phase: deque(maxlen=WINDOW_FRAMES) for phase in PHASES + ('frame',)}
+        self.histograms = {phase: [0] * BUCKET_COUNT for phase in PHASES + ('frame',)}
+        self.overlay = None # 마지막으로 렌더링한 오버레이 Surface
+        self.overlay_age = 0
+
+    def toggle_overlay(self, keep_enabled=False):
+        """오버레이를 켜고 끕니다. keep_enabled이면 오버레이가 꺼져도 계속 측정합니다 (히스토그램 저장용)."""
+        self.visible = not self.visible
+        self.enabled = self.visible or keep_enabled
+        self.overlay = None
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        for phase in self.current:
+            self.current[phase] = 0.0
+        self.last_mark = self.clock()
+
+    def mark(self, phase):
+        """직전 표시 이후의 시간을 phase에 더합니다."""
+        if not self.enabled:
+            return
+        now = self.clock()
+        self.current[phase] += now - self.last_mark
+        self.last_mark = now
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        total = 0.0
+        for phase, seconds in self.current.items():
+            total += seconds
+            self._record(phase, seconds * 1000)
+        total_ms = total * 1000
+        self._record('frame', total_ms)
+        self.frames += 1
+        if total_ms > self.budget_ms:
+            self.dropped_frames += 1
+        self.overlay_age += 1
+
+    def _record(self, phase, ms):
+        self.recent[phase].append(ms)
+        self.histograms[phase][min(BUCKET_COUNT - 1, int(ms / BUCKET_MS))] += 1
+
+    def percentiles(self, phase):
+        """최근 프레임에서 (p50, p95, p99) 밀리초"""
+        values = sorted(self.recent[phase])
+        return _percentile(values, 0.50), _percentile(values, 0.95), _percentile(values, 0.99)
+
+    def _render_overlay(self, font):
+        lines = [("%-10s %6s %6s %6s" % ('ms', 'p50', 'p95', 'p99'), OVERLAY_TEXT_COLOR)]
+        for phase in PHASES + ('frame',):
+            p50, p95, p99 = self.percentiles(phase)
+            color = OVERLAY_WARNING_COLOR if phase == 'frame' and p95 > self.budget_ms else OVERLAY_TEXT_COLOR
+            lines.append(("%-10s %6.2f %6.2f %6.2f" % (phase, p50, p95, p99), color))
+        lines.append(("dropped %d / %d (> %.1f ms)" % (self.dropped_frames, self.frames, self.budget_ms),
+                      OVERLAY_WARNING_COLOR if self.dropped_frames else OVERLAY_TEXT_COLOR))
+        rendered = [font.render(text, True, color) for text, color in lines]
+        line_height = font.get_linesize()
+        overlay = pygame.Surface((max(s.get_width() for s in rendered) + 12, line_height * len(rendered) + 8),
+                                 pygame.SRCALPHA)
+        overlay.fill(OVERLAY_BACKGROUND)
+        for i, surface in enumerate(rendered):
+            overlay.blit(surface, (6, 4 + i * line_height))
+        return overlay
+
+    def draw(self, surface, font):
+        """오버레이를 그리고 그린 영역을 반환합니다 (꺼져 있으면 None). 글자는 몇 프레임마다만 다시 렌더링합니다."""
+        if not self.visible:
+            return None
+        if self.overlay is None or self.overlay_age >= OVERLAY_REFRESH_FRAMES:
+            self.overlay = self._render_overlay(font)
+            self.overlay_age = 0
+        return surface.blit(self.overlay, OVERLAY_POSITION)
+
+    def report(self):
+        """게임 시작부터의 단계별 히스토그램과 백분위수를 JSON으로 저장할 수 있는 dict로 반환합니다."""
+        phases = {}
+        for phase, counts in self.histograms.items():
+            phases[phase] = {
+                'p50': _histogram_percentile(counts, 0.50),
+                'p95': _histogram_percentile(counts, 0.95),
+                'p99': _histogram_percentile(counts, 0.99),
+                'histogram': counts,
+            }
+        return {
+            'frames': self.frames,
+            'dropped_frames': self.dropped_frames,
+            'budget_ms': self.budget_ms,
+            'bucket_ms': BUCKET_MS,
+            'phases': phases,
+        }
+
+    def dump(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
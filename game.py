@@ -0,0 +1,113 @@
+"""
+한 판의 게임 (규칙 상태)을 담는 Game 클래스입니다. pygame 없이 동작합니다.
+
+보드, 새 타일 난수 (게임 시드), 리플레이 기록, 되돌리기 기록, 승리/패배 상태를 한 객체에 모아
+한 프로세스가 서로 독립된 게임을 수만 개까지 들고 있을 수 있습니다. 모듈 전역 상태를 쓰지 않으므로
+게임마다 잠금만 따로 두면 여러 스레드/태스크에서 동시에 다룰 수 있습니다.
+화면(해커톤.py)은 이 객체 하나를 움직이고, 바뀐 내용 (move_trace 형식의 이동 정보와 새 타일)으로
+애니메이션만 만듭니다.
+"""
+
+import bitboard
+import game_core
+import history
+import replay
+
+
+class Game:
+    """보드, 시드, 리플레이, 되돌리기 기록과 상태 ('win', 'lose' 또는 None)를 가진 한 판입니다."""
+
+    __slots__ = ('board', 'spawn_rng', 'replay', 'history', 'status', 'last_spawn', 'recorder')
+
+    def __init__(self, size=game_core.BOARD_SIZE, seed=None):
+        if seed is None:
+            seed = replay.new_seed()
+        self.replay = replay.Replay(seed, size) # 시드 검사도 여기서 합니다
+        self.board, self.spawn_rng = replay.new_game(seed, size)
+        self.history = history.UndoHistory(self.board.snapshot())
+        self.status = self.board.status()
+        self.last_spawn = None # 마지막 수 뒤에 나온 새 타일 (row, col, value)
+        self.recorder = None # recorder(이동 전 스냅샷, 방향, 얻은 점수, 새 타일): 둔 수마다 부름 (corpus.CorpusWriter.recorder)
+
+    @property
+    def seed(self):
+        return self.replay.seed
+
+    @property
+    def size(self):
+        return self.board.size
+
+    @property
+    def score(self):
+        return self.replay.score
+
+    @property
+    def move_count(self):
+        return len(self.replay)
+
+    def values(self):
+        return self.board.values()
+
+    def legal_moves(self):
+        return self.board.legal_moves()
+
+    def move(self, direction, trace=None):
+        """
+        방향으로 이동하고 새 타일을 놓은 뒤 얻은 점수를 반환합니다. 보드가 바뀌지 않으면 None을 반환합니다.
+        trace 리스트를 넘기면 move_trace() 형식의 타일 이동 정보를 덧붙이고, 새 타일은 last_spawn에 남습니다.
+        """
+        before = self.board.snapshot() if self.recorder is not None else None
+        gained = self.board.move(direction, trace)
+        if gained is None:
+            return None
+        # n번째 수 뒤의 새 타일은 n + 1번 (0, 1번은 처음 두 타일)
+        spawned = self.spawn_rng.spawn(self.board, len(self.replay) + 2)
+        self.replay.record(direction, gained, spawned)
+        self.history.push(self.board.snapshot(), self.replay.score, replay.DIRECTION_CODES[direction])
+        self.last_spawn = spawned
+        self.status = self.board.status()
+        if self.recorder is not None:
+            self.recorder(before, direction, gained, spawned)
+        return gained
+
+    def undo(self):
+        """마지막 수를 되돌립니다. 되돌렸으면 True를 반환합니다."""
+        if not self.history.can_undo():
+            return False
+        snapshot, score = self.history.undo(self.replay.moves[-1])
+        self.replay.truncate(len(self.replay) - 1, score)
+        self.board.restore(snapshot)
+        self.status = self.board.status()
+        self.last_spawn = None
+        return True
+
+    def redo_direction(self):
+        """다시 하기로 둘 방향 (없으면 None)"""
+        code = self.history.next_redo()
+        return None if code is None else game_core.DIRECTIONS[code]
+
+    def redo(self, trace=None):
+        """되돌린 수를 다시 둡니다 (같은 방향으로 이동하면 같은 새 타일이 나옵니다). move()와 같은 값을 반환합니다."""
+        direction = self.redo_direction()
+        if direction is None:
+            return None
+        return self.move(direction, trace)
+
+
+def snapshot_diff(before, after, size):
+    """
+    같은 게임의 두 보드 스냅샷 (board.snapshot())에서 바뀐 칸의 [row, col, value] 목록을 행 우선 순서로 반환합니다.
+    4x4 비트보드는 XOR로 바뀐 니블만 훑습니다 (웹 클라이언트에 보드 전체 대신 보내는 변경분).
+    """
+    diff = []
+    if isinstance(before, int):
+        changed = before ^ after
+        while changed:
+            i = ((changed & -changed).bit_length() - 1) >> 2
+            diff.append([i >> 2, i & 3, bitboard.exponent_to_value((after >> (4 * i)) & 0xF)])
+            changed &= ~(0xF << (4 * i))
+    else:
+        for i in range(len(after)):
+            if before[i] != after[i]:
+                diff.append([i // size, i % size, bitboard.exponent_to_value(after[i])])
+    return diff
@@ -0,0 +1,401 @@
+"""
+pygame 없이 동작하는 2048 게임 규칙 모듈입니다.
+
+4x4 보드는 bitboard 모듈의 64비트 정수로 표현하며, 모듈 수준 함수는 보드를 인자로 받아
+새 보드를 반환하는 순수 함수입니다. 화면(해커톤.py)은 같은 인터페이스를 가진 보드 객체
+(4x4는 BitBoard, 6x6~16x16은 GridBoard) 위에서 애니메이션만 담당합니다.
+"""
+
+import random
+from bisect import bisect_left, insort
+
+import bitboard
+
+BOARD_SIZE = 4
+WIN_VALUE = 2048
+WIN_EXPONENT = 11 # 2048 = 2^11
+FOUR_PROBABILITY = 0.1 # 새 타일이 4일 확률 (나머지는 2)
+
+DIRECTIONS = bitboard.DIRECTIONS
+
+# move_trace()가 돌려주는 타일 이동 종류
+TRACE_SLIDE = 0 # 그대로 미끄러짐
+TRACE_MERGE = 1 # 합쳐진 뒤 남는 타일 (값이 두 배가 됨)
+TRACE_VANISH = 2 # 합쳐지면서 사라지는 타일
+
+
+def slide_and_merge_line(line, is_reverse):
+    """
+    한 줄 (행 또는 열)의 값을 이동하고 합칩니다. 0은 빈 칸입니다.
+    (새 줄, 얻은 점수, 출처 목록)을 반환합니다.
+    출처 목록의 i번째 항목은 새 줄 i번째 칸이 어디서 왔는지를 나타내는 인덱스 튜플이며,
+    합쳐진 칸은 (남는 타일, 사라지는 타일) 순서의 두 인덱스를 가집니다.
+    """
+    size = len(line)
+    filtered = [i for i in range(size) if line[i]]
+    if is_reverse: # 오른쪽 또는 아래로 이동 (줄의 끝 방향)
+        filtered.reverse()
+
+    values = []
+    sources = []
+    score = 0
+    k = 0
+    while k < len(filtered):
+        current = filtered[k]
+        if k + 1 < len(filtered) and line[filtered[k + 1]] == line[current]:
+            merged_value = line[current] * 2
+            values.append(merged_value)
+            score += merged_value
+            # 기존 화면 동작과 같이 역방향에서는 벽에서 먼 타일이 남습니다.
+            if is_reverse:
+                sources.append((filtered[k + 1], current))
+            else:
+                sources.append((current, filtered[k + 1]))
+            k += 2
+        else:
+            values.append(line[current])
+            sources.append((current,))
+            k += 1
+
+    padding = size - len(values)
+    if is_reverse:
+        values.reverse()
+        sources.reverse()
+        return [0] * padding + values, score, [()] * padding + sources
+    return values + [0] * padding, score, sources + [()] * padding
+
+
+def add_random_tile(board, rng=random):
+    """
+    무작위 빈 공간에 새 타일 (2 또는 4)을 추가합니다.
+    (새 보드, (row, col, value))를 반환하며, 빈 칸이 없으면 (보드, None)을 반환합니다.
+    """
+    empty_cells = bitboard.empty_cells(board)
+    if not empty_cells:
+        return board, None
+    r, c = rng.choice(empty_cells)
+    value = 2 if rng.random() < 1 - FOUR_PROBABILITY else 4
+    return bitboard.set_exponent(board, r, c, 1 if value == 2 else 2), (r, c, value)
+
+
+def move(board, direction):
+    """방향에 따라 보드를 이동합니다. (새 보드, 얻은 점수)를 반환합니다."""
+    return bitboard.execute_move(board, direction)
+
+
+def move_trace(board, direction):
+    """
+    이동 시 각 타일이 어디로 가는지 계산합니다 (애니메이션용).
+    (src_row, src_col, dst_row, dst_col, kind) 튜플 목록을 반환합니다.
+    """
+    grid = bitboard.to_values(board)
+    is_reverse = direction in ('right', 'down')
+    is_vertical = direction in ('up', 'down')
+    trace = []
+    for i in range(BOARD_SIZE):
+        if is_vertical:
+            cells = [(r, i) for r in range(BOARD_SIZE)]
+        else:
+            cells = [(i, c) for c in range(BOARD_SIZE)]
+        _, _, sources = slide_and_merge_line([grid[r][c] for r, c in cells], is_reverse)
+        for dst, src in enumerate(sources):
+            if not src:
+                continue
+            dst_r, dst_c = cells[dst]
+            if len(src) == 1:
+                trace.append(cells[src[0]] + (dst_r, dst_c, TRACE_SLIDE))
+            else:
+                trace.append(cells[src[0]] + (dst_r, dst_c, TRACE_MERGE))
+                trace.append(cells[src[1]] + (dst_r, dst_c, TRACE_VANISH))
+    return trace
+
+
+def legal_moves(board):
+    """보드를 바꾸는 방향을 DIRECTIONS 순서의 튜플로 반환합니다 (봇이 헛수를 건너뛰는 용도)."""
+    return bitboard.legal_directions(board)
+
+
+def is_board_full(board):
+    """보드가 완전히 채워졌는지 확인합니다."""
+    return bitboard.count_empty(board) == 0
+
+
+def can_move(board):
+    """이동 가능한 타일이 있는지 확인합니다 (게임 오버 조건)."""
+    return bitboard.can_move(board)
+
+
+def check_game_status(board):
+    """승리/패배 조건을 확인합니다. 'win', 'lose' 또는 None을 반환합니다."""
+    if bitboard.max_exponent(board) >= WIN_EXPONENT:
+        return 'win'
+    if not bitboard.legal_mask(board):
+        return 'lose'
+    return None
+
+
+# --- 보드 객체 (화면이 사용하는 상태를 가진 인터페이스) ---
+
+MIN_BOARD_SIZE = 2
+MAX_BOARD_SIZE = 16
+
+
+class BitBoard:
+    """
+    4x4 보드 (bitboard 정수 하나)를 GridBoard와 같은 인터페이스로 감쌉니다.
+    최대 지수, 빈 칸 수, 이동 가능 방향은 보드가 바뀔 때마다 행 테이블 조회로 갱신해 두므로
+    승리/패배 판정과 legal_moves()는 상수 시간입니다.
+    """
+
+    __slots__ = ('bits', 'max_exponent', 'empty', 'legal')
+
+    size = BOARD_SIZE
+
+    def __init__(self, bits=0):
+        self._set_bits(bits)
+
+    def _set_bits(self, bits):
+        self.bits = bits
+        self.max_exponent = bitboard.max_exponent(bits)
+        self.empty = bitboard.count_empty(bits)
+        self.legal = bitboard.legal_mask(bits) # 비트 i = DIRECTIONS[i] 방향으로 이동 가능
+
+    def get(self, row, col):
+        return bitboard.exponent_to_value(bitboard.get_exponent(self.bits, row, col))
+
+    def values(self):
+        return bitboard.to_values(self.bits)
+
+    def empty_count(self):
+        return self.empty
+
+    def max_value(self):
+        return bitboard.exponent_to_value(self.max_exponent)
+
+    def legal_moves(self):
+        """보드를 바꾸는 방향을 DIRECTIONS 순서의 튜플로 반환합니다."""
+        return bitboard.MASK_DIRECTIONS[self.legal]
+
+    def is_legal(self, direction):
+        return bool(self.legal >> DIRECTIONS.index(direction) & 1)
+
+    def can_move(self):
+        return self.legal != 0
+
+    def status(self):
+        """승리/패배 조건을 확인합니다. 'win', 'lose' 또는 None을 반환합니다."""
+        if self.max_exponent >= WIN_EXPONENT:
+            return 'win'
+        if not self.legal:
+            return 'lose'
+        return None
+
+    def snapshot(self):
+        """보드 상태를 불변 값 (64비트 정수)으로 반환합니다 (되돌리기 기록용)."""
+        return self.bits
+
+    def restore(self, snapshot):
+        self._set_bits(snapshot)
+
+    def add_random_tile(self, rng=random):
+        """빈 칸에 새 타일을 추가하고 (row, col, value)를 반환합니다 (빈 칸이 없으면 None)."""
+        bits, spawned = add_random_tile(self.bits, rng)
+        if spawned is not None:
+            self._set_bits(bits)
+        return spawned
+
+    def move(self, direction, trace=None):
+        """
+        방향에 따라 이동하고 얻은 점수를 반환합니다. 보드가 바뀌지 않으면 None을 반환합니다.
+        trace 리스트를 넘기면 move_trace() 형식의 타일 이동 정보를 덧붙입니다.
+        """
+        if not self.is_legal(direction):
+            return None
+        new_bits, gained = bitboard.execute_move(self.bits, direction)
+        if trace is not None:
+            trace.extend(move_trace(self.bits, direction))
+        self._set_bits(new_bits)
+        return gained
+
+
+_GRID_LINES = {}
+
+def _grid_lines(size):
+    """size x size 보드의 방향별 줄 목록 {방향: [칸 인덱스 목록, ...]} (크기별로 한 번만 만듭니다)"""
+    lines = _GRID_LINES.get(size)
+    if lines is None:
+        rows = tuple(tuple(r * size + c for c in range(size)) for r in range(size))
+        cols = tuple(tuple(r * size + c for r in range(size)) for c in range(size))
+        lines = _GRID_LINES[size] = {'left': rows, 'right': rows, 'up': cols, 'down': cols}
+    return lines
+
+
+class GridBoard:
+    """
+    NxN 보드 (최대 16x16)입니다.
+    칸이 바뀔 때마다 빈 칸 집합, 최대 타일, 그리고 이웃한 두 칸의 관계 (같은 값 쌍, 한쪽만 빈 쌍)를
+    방향별로 센 값을 갱신합니다. 따라서 새 타일 위치 선택, 이동 가능 방향, 승리/패배 판정이
+    보드 전체를 다시 훑지 않고 끝납니다.
+    빈 칸 목록은 칸 번호 순으로 유지하므로 (BitBoard와 같은 순서) 같은 난수에서는 이전 이동 경로나
+    restore()와 관계없이 같은 칸에 새 타일이 나옵니다.
+    """
+
+    __slots__ = ('size', 'cells', 'empty', 'pair_counts', 'slide_counts', 'max_tile', 'lines')
+
+    def __init__(self, size):
+        if not MIN_BOARD_SIZE <= size <= MAX_BOARD_SIZE:
+            raise ValueError("보드 크기는 %d~%d 사이여야 합니다: %r" % (MIN_BOARD_SIZE, MAX_BOARD_SIZE, size))
+        self.size = size
+        self.cells = [0] * (size * size) # 칸 i = row * size + col 의 값 (0은 빈 칸)
+        self.empty = list(range(size * size)) # 빈 칸 인덱스 (오름차순)
+        self.pair_counts = [0, 0] # 값이 같은 [가로, 세로] 이웃 쌍의 수
+        self.slide_counts = [0, 0, 0, 0] # DIRECTIONS 방향 쪽 이웃이 빈 칸인 타일의 수
+        self.max_tile = 0
+        self.lines = _grid_lines(size) # 방향별 줄 목록 (칸 인덱스, 같은 크기의 보드끼리 공유)
+
+    def _count_pair(self, first, second, axis, sign):
+        """
+        이웃 쌍 (first가 왼쪽/위, second가 오른쪽/아래) 하나의 기여를 sign만큼 더합니다.
+        axis는 0이면 가로, 1이면 세로입니다.
+        """
+        a = self.cells[first]
+        b = self.cells[second]
+        if a:
+            if a == b:
+                self.pair_counts[axis] += sign
+            elif not b:
+                self.slide_counts[2 * axis + 1] += sign # 오른쪽/아래로 밀 수 있음
+        elif b:
+            self.slide_counts[2 * axis] += sign # 왼쪽/위로 밀 수 있음
+
+    def _count_around(self, i, sign):
+        size = self.size
+        c = i % size
+        if c > 0:
+            self._count_pair(i - 1, i, 0, sign)
+        if c < size - 1:
+            self._count_pair(i, i + 1, 0, sign)
+        if i >= size:
+            self._count_pair(i - size, i, 1, sign)
+        if i < size * (size - 1):
+            self._count_pair(i, i + size, 1, sign)
+
+    def _set(self, i, value):
+        """칸 하나의 값을 바꾸면서 빈 칸 집합과 이웃 쌍 통계를 갱신합니다."""
+        old = self.cells[i]
+        if old == value:
+            return
+        self._count_around(i, -1)
+        self.cells[i] = value
+        self._count_around(i, 1)
+
+        if not old:
+            # 정렬된 빈 칸 목록에서 이진 탐색으로 제거/삽입 (최대 256칸이라 이동 비용은 무시할 만함)
+            del self.empty[bisect_left(self.empty, i)]
+        elif not value:
+            insort(self.empty, i)
+        if value > self.max_tile:
+            self.max_tile = value
+
+    @property
+    def mergeable_pairs(self):
+        """값이 같은 이웃 쌍의 수 (가로 + 세로)"""
+        return self.pair_counts[0] + self.pair_counts[1]
+
+    def get(self, row, col):
+        return self.cells[row * self.size + col]
+
+    def values(self):
+        size = self.size
+        return [self.cells[r * size:(r + 1) * size] for r in range(size)]
+
+    def empty_count(self):
+        return len(self.empty)
+
+    def max_value(self):
+        return self.max_tile
+
+    def is_legal(self, direction):
+        index = DIRECTIONS.index(direction)
+        return self.slide_counts[index] > 0 or self.pair_counts[index >> 1] > 0
+
+    def legal_moves(self):
+        """보드를 바꾸는 방향을 DIRECTIONS 순서의 튜플로 반환합니다."""
+        return tuple(d for d in DIRECTIONS if self.is_legal(d))
+
+    def can_move(self):
+        # 빈 칸 수가 아니라 legal_moves()와 같은 통계로 판정합니다 (빈 보드는 BitBoard처럼 이동 불가).
+        return self.mergeable_pairs > 0 or any(self.slide_counts)
+
+    def status(self):
+        """승리/패배 조건을 확인합니다. 'win', 'lose' 또는 None을 반환합니다."""
+        if self.max_tile >= WIN_VALUE:
+            return 'win'
+        if not self.can_move():
+            return 'lose'
+        return None
+
+    def snapshot(self):
+        """보드 상태를 불변 값 (칸마다 지수 1바이트)으로 반환합니다 (되돌리기 기록용)."""
+        return bytes(bitboard.value_to_exponent(value) for value in self.cells)
+
+    def restore(self, snapshot):
+        """snapshot()으로 만든 상태로 되돌립니다. 바뀐 칸만 _set()으로 갱신합니다."""
+        for i, exponent in enumerate(snapshot):
+            self._set(i, bitboard.exponent_to_value(exponent))
+        self.max_tile = max(self.cells) # _set()은 최대 타일을 늘리기만 하므로 다시 계산
+
+    def add_random_tile(self, rng=random):
+        """빈 칸에 새 타일을 추가하고 (row, col, value)를 반환합니다 (빈 칸이 없으면 None)."""
+        if not self.empty:
+            return None
+        i = rng.choice(self.empty)
+        value = 2 if rng.random() < 1 - FOUR_PROBABILITY else 4
+        self._set(i, value)
+        r, c = divmod(i, self.size)
+        return r, c, value
+
+    def move(self, direction, trace=None):
+        """
+        방향에 따라 이동하고 얻은 점수를 반환합니다. 보드가 바뀌지 않으면 None을 반환합니다.
+        trace 리스트를 넘기면 move_trace() 형식의 타일 이동 정보를 덧붙입니다.
+        """
+        if not self.is_legal(direction):
+            return None
+        is_reverse = direction in ('right', 'down')
+        size = self.size
+        cells = self.cells
+        moved = False
+        gained = 0
+        line_trace = [] if trace is not None else None
+        for line in self.lines[direction]:
+            line_values = [cells[i] for i in line]
+            new_line, score, sources = slide_and_merge_line(line_values, is_reverse)
+            if new_line != line_values:
+                moved = True
+                gained += score
+                for i, value in zip(line, new_line):
+                    self._set(i, value)
+            if line_trace is not None:
+                # 움직이지 않은 줄의 타일도 화면이 위치를 알 수 있도록 기록합니다.
+                for dst, src in enumerate(sources):
+                    if not src:
+                        continue
+                    dst_r, dst_c = divmod(line[dst], size)
+                    if len(src) == 1:
+                        line_trace.append(divmod(line[src[0]], size) + (dst_r, dst_c, TRACE_SLIDE))
+                    else:
+                        line_trace.append(divmod(line[src[0]], size) + (dst_r, dst_c, TRACE_MERGE))
+                        line_trace.append(divmod(line[src[1]], size) + (dst_r, dst_c, TRACE_VANISH))
+        if not moved:
+            return None
+        if trace is not None:
+            trace.extend(line_trace)
+        return gained
+
+
+def create_board(size=BOARD_SIZE):
+    """크기에 맞는 보드 객체를 만듭니다 (4x4는 비트보드, 그 외는 GridBoard)."""
+    if size == BOARD_SIZE:
+        return BitBoard()
+    return GridBoard(size)
@@ -0,0 +1,525 @@
+"""
+웹 클라이언트용 2048 세션 서버입니다 (asyncio, 표준 라이브러리만 사용).
+
+점수를 클라이언트가 꾸미지 못하도록 규칙은 서버의 game.Game이 진행합니다. 클라이언트는 방향만 보내고,
+서버는 이동과 새 타일을 적용한 뒤 바뀐 칸 목록 (diff)과 점수를 돌려줍니다. Express 서버 (server.js, 3000번)와
+별도 포트에서 돌고, public/*.html에서 부를 수 있도록 CORS를 허용합니다.
+
+    python game_server.py --port 8765
+    python game_server.py --corpus games.crp   # 4x4 세션의 모든 수를 말뭉치 (corpus.py)에 덧붙임
+
+HTTP (JSON, keep-alive):
+    POST   /api/games                {"size": 4}              → 새 세션 (id, 보드 전체)
+    GET    /api/games/<id>                                    → 현재 상태 (보드 전체)
+    POST   /api/games/<id>/move      {"direction": "left"}    → 이동 결과 (diff)
+    GET    /api/games/<id>/replay                             → 끝난 게임의 리플레이 (replay.py 형식, 점수 검증용)
+    DELETE /api/games/<id>                                    → 세션 삭제
+    GET    /api/stats                                         → 세션 수, 처리한 수, 처리 시간 백분위수
+
+WebSocket (/ws, 텍스트 프레임마다 JSON 하나):
+    {"op": "new", "size": 4}  {"op": "move", "id": ..., "direction": "up"}  {"op": "state", "id": ...}
+    응답은 HTTP와 같은 내용에 "status_code"가 붙고, 요청에 "seq"가 있으면 그대로 돌려줍니다.
+
+세션마다 asyncio.Lock을 두어 한 세션에 대한 요청이 (여러 연결에서 와도) 이동 적용부터 응답 전송까지 하나씩 처리되므로,
+응답 순서가 적용 순서와 같습니다. IDLE_TIMEOUT 동안 요청이 없는 세션은 주기적으로 정리합니다.
+부하 측정은 server_load.py를 씁니다.
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import secrets
+import struct
+import time
+from collections import OrderedDict, deque
+
+import game
+import game_core
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+IDLE_TIMEOUT = 600.0 # 이 시간 (초) 동안 요청이 없는 세션은 제거합니다
+EVICT_INTERVAL = 5.0 # 유휴 세션 정리 주기 (초)
+MAX_SESSIONS = 100000 # 동시에 들고 있을 최대 세션 수
+MAX_BODY = 4096 # 요청 본문 / WebSocket 프레임 최대 크기 (바이트)
+LISTEN_BACKLOG = 4096 # 연결이 한꺼번에 몰려도 받을 수 있도록 넉넉하게
+SERVICE_WINDOW = 4096 # 처리 시간 백분위수를 계산할 최근 이동 수
+CORPUS_FLUSH_INTERVAL = 10.0 # 말뭉치에 모아 둔 수를 커밋하는 주기 (초)
+
+WS_GUID = b'258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+WS_TEXT, WS_CLOSE, WS_PING, WS_PONG = 0x1, 0x8, 0x9, 0xA
+
+STATUS_TEXTS = {200: 'OK', 201: 'Created', 204: 'No Content', 400: 'Bad Request', 404: 'Not Found',
+                405: 'Method Not Allowed', 409: 'Conflict', 413: 'Payload Too Large', 503: 'Service Unavailable'}
+CORS_HEADERS = ('Access-Control-Allow-Origin: *\r\n'
+                'Access-Control-Allow-Methods: GET, POST, DELETE, OPTIONS\r\n'
+                'Access-Control-Allow-Headers: Content-Type\r\n')
+
+
+class RequestError(Exception):
+    """클라이언트에 HTTP 상태 코드와 함께 돌려줄 오류입니다."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class ProtocolError(Exception):
+    """HTTP/WebSocket 형식이 잘못되어 연결을 끊어야 할 때 발생합니다."""
+
+
+# --- 세션 ---
+
+class Session:
+    """게임 하나와 그 잠금, 마지막 요청 시각입니다."""
+
+    __slots__ = ('id', 'game', 'lock', 'last_used')
+
+    def __init__(self, session_id, game_, now):
+        self.id = session_id
+        self.game = game_
+        self.lock = asyncio.Lock()
+        self.last_used = now
+
+
+def _percentile(sorted_values, fraction):
+    """정렬된 목록의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+class SessionStore:
+    """
+    세션 id → Session. 마지막 요청 순서로 정렬된 OrderedDict라서 유휴 세션 정리는 앞에서부터 오래된 것만 봅니다
+    (정리 비용이 전체 세션 수가 아니라 제거되는 세션 수에 비례).
+    """
+
+    def __init__(self, idle_timeout=IDLE_TIMEOUT, max_sessions=MAX_SESSIONS, clock=time.monotonic, recorder=None):
+        self.idle_timeout = idle_timeout
+        self.recorder = recorder # recorder(게임): 새 게임의 Game.recorder를 돌려주는 함수 (--corpus)
+        self.max_sessions = max_sessions
+        self.clock = clock
+        self.sessions = OrderedDict()
+        self.moves = 0 # 처리한 이동 수
+        self.evicted = 0 # 유휴로 제거한 세션 수
+        self.service_times = deque(maxlen=SERVICE_WINDOW) # 최근 이동의 처리 시간 (초, 규칙 적용 + diff)
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def create(self, size=game_core.BOARD_SIZE):
+        """새 세션을 만듭니다. 시드는 서버가 정합니다 (클라이언트가 고르면 새 타일을 미리 알 수 있으므로)."""
+        if len(self.sessions) >= self.max_sessions:
+            raise RequestError(503, "세션이 너무 많습니다")
+        if type(size) is not int or not game_core.MIN_BOARD_SIZE <= size <= game_core.MAX_BOARD_SIZE:
+            raise RequestError(400, "보드 크기는 %d~%d 사이의 정수여야 합니다"
+                               % (game_core.MIN_BOARD_SIZE, game_core.MAX_BOARD_SIZE))
+        session = Session(secrets.token_urlsafe(12), game.Game(size), self.clock())
+        if self.recorder is not None:
+            session.game.recorder = self.recorder(session.game)
+        self.sessions[session.id] = session
+        return session
+
+    def get(self, session_id):
+        """세션을 찾고 마지막 요청 시각을 갱신합니다."""
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise RequestError(404, "세션이 없습니다: %s" % (session_id,))
+        session.last_used = self.clock()
+        self.sessions.move_to_end(session_id)
+        return session
+
+    def remove(self, session_id):
+        self.sessions.pop(session_id, None)
+
+    def evict_idle(self):
+        """IDLE_TIMEOUT 동안 쓰이지 않은 세션을 제거하고 제거한 수를 반환합니다 (요청 처리 중인 세션은 남김)."""
+        now = self.clock()
+        deadline = now - self.idle_timeout
+        sessions = self.sessions
+        count = 0
+        while sessions:
+            session = next(iter(sessions.values()))
+            if session.last_used > deadline:
+                break
+            if session.lock.locked():
+                session.last_used = now
+                sessions.move_to_end(session.id)
+                continue
+            del sessions[session.id]
+            count += 1
+        self.evicted += count
+        return count
+
+    def move(self, session, direction):
+        """세션의 게임을 한 수 진행하고 응답 내용을 반환합니다. 잠금은 호출하는 쪽이 잡습니다."""
+        game_ = session.game
+        if direction not in game_core.DIRECTIONS:
+            raise RequestError(400, "방향은 left, right, up, down 중 하나여야 합니다: %r" % (direction,))
+        if game_.status is not None:
+            raise RequestError(409, "게임이 끝났습니다 (%s)" % game_.status)
+        started = time.perf_counter()
+        before = game_.board.snapshot()
+        gained = game_.move(direction)
+        diff = [] if gained is None else game.snapshot_diff(before, game_.board.snapshot(), game_.size)
+        self.service_times.append(time.perf_counter() - started)
+        self.moves += 1
+        return {
+            'id': session.id,
+            'moved': gained is not None,
+            'gained': gained or 0,
+            'score': game_.score,
+            'moves': game_.move_count,
+            'diff': diff,
+            'legal': game_.legal_moves(),
+            'status': game_.status,
+        }
+
+    def stats(self):
+        times = sorted(self.service_times)
+        return {
+            'sessions': len(self.sessions),
+            'moves': self.moves,
+            'evicted': self.evicted,
+            'service_ms': {'p50': _percentile(times, 0.50) * 1000, 'p99': _percentile(times, 0.99) * 1000,
+                           'max': times[-1] * 1000 if times else 0.0},
+        }
+
+
+def game_state(session):
+    """보드 전체를 포함한 세션 상태 (새 세션, 상태 조회 응답). 시드는 새 타일을 미리 알려 주므로 보내지 않습니다."""
+    game_ = session.game
+    return {
+        'id': session.id,
+        'size': game_.size,
+        'board': game_.values(),
+        'score': game_.score,
+        'moves': game_.move_count,
+        'legal': game_.legal_moves(),
+        'status': game_.status,
+    }
+
+
+# --- 요청 처리 (HTTP와 WebSocket 공통) ---
+
+class GameService:
+    """
+    요청 하나를 처리합니다. respond(status, payload)는 응답을 보내는 코루틴 함수로,
+    세션을 바꾸는 요청은 세션 잠금을 잡은 채로 응답까지 보냅니다.
+    """
+
+    def __init__(self, store):
+        self.store = store
+
+    async def handle(self, method, path, body, respond):
+        store = self.store
+        parts = path.strip('/').split('/')
+        if parts[:2] != ['api', 'games'] or len(parts) > 4:
+            if parts == ['api', 'stats'] and method == 'GET':
+                return await respond(200, store.stats())
+            raise RequestError(404, "없는 경로입니다: %s" % path)
+        if len(parts) == 2:
+            if method != 'POST':
+                raise RequestError(405, "POST만 지원합니다")
+            session = store.create(body.get('size', game_core.BOARD_SIZE))
+            return await respond(201, game_state(session))
+
+        session = store.get(parts[2])
+        action = parts[3] if len(parts) == 4 else None
+        async with session.lock:
+            if store.sessions.get(session.id) is not session:
+                # 잠금을 기다리는 동안 다른 요청 (DELETE)이 세션을 지웠습니다.
+                raise RequestError(404, "세션이 없습니다: %s" % (session.id,))
+            if action is None and method == 'GET':
+                return await respond(200, game_state(session))
+            if action is None and method == 'DELETE':
+                store.remove(session.id)
+                return await respond(204, None)
+            if action == 'move' and method == 'POST':
+                return await respond(200, store.move(session, body.get('direction')))
+            if action == 'replay' and method == 'GET':
+                if session.game.status is None:
+                    raise RequestError(409, "리플레이 (시드 포함)는 게임이 끝난 뒤에만 받을 수 있습니다")
+                return await respond(200, session.game.replay.to_bytes())
+        raise RequestError(405, "지원하지 않는 요청입니다: %s %s" % (method, path))
+
+    async def handle_ws(self, message, respond):
+        """WebSocket 메시지 ({"op": ...})를 같은 경로의 요청으로 바꾸어 처리합니다."""
+        op = message.get('op')
+        session_id = message.get('id')
+        if op == 'new':
+            return await self.handle('POST', '/api/games', message, respond)
+        if op == 'move':
+            return await self.handle('POST', '/api/games/%s/move' % session_id, message, respond)
+        if op == 'state':
+            return await self.handle('GET', '/api/games/%s' % session_id, message, respond)
+        if op == 'close':
+            return await self.handle('DELETE', '/api/games/%s' % session_id, message, respond)
+        if op == 'stats':
+            return await self.handle('GET', '/api/stats', message, respond)
+        raise RequestError(400, "알 수 없는 op입니다: %r" % (op,))
+
+
+# --- HTTP ---
+
+async def read_request(reader):
+    """HTTP 요청 하나를 읽어 (메서드, 경로, 헤더 dict, 본문 바이트)를 반환합니다. 연결이 닫혔으면 None."""
+    try:
+        head = await reader.readuntil(b'\r\n\r\n')
+    except asyncio.IncompleteReadError:
+        return None
+    except asyncio.LimitOverrunError:
+        raise ProtocolError("헤더가 너무 깁니다")
+    lines = head.decode('latin-1').split('\r\n')
+    try:
+        method, target, _ = lines[0].split(' ', 2)
+    except ValueError:
+        raise ProtocolError("요청 줄이 잘못되었습니다: %r" % lines[0])
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+    length = int(headers.get('content-length') or 0)
+    if length > MAX_BODY:
+        raise ProtocolError("본문이 너무 깁니다")
+    body = await reader.readexactly(length) if length else b''
+    return method, target.split('?', 1)[0], headers, body
+
+
+def http_response(status, payload, keep_alive=True):
+    """응답 바이트 (JSON, 바이트는 그대로 octet-stream)"""
+    if payload is None:
+        body, content_type = b'', 'application/json'
+    elif isinstance(payload, bytes):
+        body, content_type = payload, 'application/octet-stream'
+    else:
+        body, content_type = json.dumps(payload, separators=(',', ':')).encode(), 'application/json'
+    head = ('HTTP/1.1 %d %s\r\nContent-Type: %s\r\nContent-Length: %d\r\n%sConnection: %s\r\n\r\n'
+            % (status, STATUS_TEXTS.get(status, ''), content_type, len(body), CORS_HEADERS,
+               'keep-alive' if keep_alive else 'close'))
+    return head.encode() + body
+
+
+def parse_json(data):
+    if not data:
+        return {}
+    try:
+        message = json.loads(data)
+    except ValueError:
+        raise RequestError(400, "JSON 형식이 아닙니다")
+    if not isinstance(message, dict):
+        raise RequestError(400, "JSON 객체여야 합니다")
+    return message
+
+
+# --- WebSocket (RFC 6455, 조각나지 않은 텍스트 프레임만) ---
+
+def ws_accept_key(key):
+    return base64.b64encode(hashlib.sha1(key.encode() + WS_GUID).digest()).decode()
+
+
+def _apply_mask(data, mask):
+    length = len(data)
+    if not length:
+        return data
+    repeated = (mask * (length // 4 + 1))[:length]
+    return (int.from_bytes(data, 'big') ^ int.from_bytes(repeated, 'big')).to_bytes(length, 'big')
+
+
+def ws_frame(opcode, payload, mask=None):
+    """프레임 하나를 만듭니다. 클라이언트가 보낼 때는 4바이트 mask를 넘깁니다."""
+    length = len(payload)
+    mask_bit = 0x80 if mask else 0
+    if length < 126:
+        header = struct.pack('!BB', 0x80 | opcode, mask_bit | length)
+    elif length < 65536:
+        header = struct.pack('!BBH', 0x80 | opcode, mask_bit | 126, length)
+    else:
+        header = struct.pack('!BBQ', 0x80 | opcode, mask_bit | 127, length)
+    if mask:
+        return header + mask + _apply_mask(payload, mask)
+    return header + payload
+
+
+async def read_ws_frame(reader, require_mask=True):
+    """프레임 하나를 읽어 (opcode, payload)를 반환합니다. 연결이 닫혔으면 (WS_CLOSE, b'')."""
+    try:
+        first, second = await reader.readexactly(2)
+        if not first & 0x80 or not first & 0x0F:
+            raise ProtocolError("조각난 프레임은 지원하지 않습니다")
+        length = second & 0x7F
+        if length == 126:
+            length, = struct.unpack('!H', await reader.readexactly(2))
+        elif length == 127:
+            length, = struct.unpack('!Q', await reader.readexactly(8))
+        if length > MAX_BODY:
+            raise ProtocolError("프레임이 너무 깁니다")
+        if second & 0x80:
+            mask = await reader.readexactly(4)
+            payload = _apply_mask(await reader.readexactly(length), mask)
+        elif require_mask:
+            raise ProtocolError("클라이언트 프레임은 마스킹되어야 합니다")
+        else:
+            payload = await reader.readexactly(length)
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return WS_CLOSE, b''
+    return first & 0x0F, payload
+
+
+# --- 서버 ---
+
+class GameServer:
+    """연결마다 HTTP 요청을 처리하고, /ws로 업그레이드하면 WebSocket 메시지를 처리합니다."""
+
+    def __init__(self, store=None):
+        self.store = store if store is not None else SessionStore()
+        self.service = GameService(self.store)
+        self.server = None
+        self.evictor = None
+        self.connections = {} # 열려 있는 연결의 writer -> 처리 태스크 (종료할 때 닫고 끝나기를 기다림)
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.server = await asyncio.start_server(self.handle_connection, host, port, backlog=LISTEN_BACKLOG)
+        self.evictor = asyncio.create_task(self.evict_loop())
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        """새 연결을 받지 않고 열려 있는 연결을 모두 닫습니다."""
+        self.evictor.cancel()
+        self.server.close()
+        handlers = list(self.connections.values())
+        for writer in list(self.connections):
+            writer.close()
+        if handlers:
+            await asyncio.wait(handlers)
+        await self.server.wait_closed()
+
+    async def evict_loop(self):
+        while True:
+            await asyncio.sleep(EVICT_INTERVAL)
+            self.store.evict_idle()
+
+    async def handle_connection(self, reader, writer):
+        self.connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                request = await read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                if path == '/ws' and headers.get('upgrade', '').lower() == 'websocket':
+                    await self.handle_websocket(reader, writer, headers)
+                    break
+                keep_alive = headers.get('connection', '').lower() != 'close'
+
+                async def respond(status, payload):
+                    writer.write(http_response(status, payload, keep_alive))
+                    await writer.drain()
+
+                if method == 'OPTIONS':
+                    await respond(204, None)
+                    continue
+                try:
+                    await self.service.handle(method, path, parse_json(body), respond)
+                except RequestError as e:
+                    await respond(e.status, {'error': str(e)})
+                if not keep_alive:
+                    break
+        except (ProtocolError, ValueError):
+            writer.write(http_response(400, {'error': "잘못된 요청입니다"}, keep_alive=False))
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections.pop(writer, None)
+            writer.close()
+
+    async def handle_websocket(self, reader, writer, headers):
+        key = headers.get('sec-websocket-key')
+        if not key:
+            raise ProtocolError("Sec-WebSocket-Key가 없습니다")
+        writer.write(('HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n'
+                      'Sec-WebSocket-Accept: %s\r\n\r\n' % ws_accept_key(key)).encode())
+        await writer.drain()
+        while True:
+            try:
+                opcode, payload = await read_ws_frame(reader)
+            except ProtocolError:
+                writer.write(ws_frame(WS_CLOSE, struct.pack('!H', 1002)))
+                return
+            if opcode == WS_CLOSE:
+                writer.write(ws_frame(WS_CLOSE, payload[:2]))
+                return
+            if opcode == WS_PING:
+                writer.write(ws_frame(WS_PONG, payload))
+                continue
+            if opcode != WS_TEXT:
+                continue
+            seq = None
+
+            async def respond(status, result):
+                message = {'status_code': status}
+                if isinstance(result, dict):
+                    message.update(result)
+                if seq is not None:
+                    message['seq'] = seq
+                writer.write(ws_frame(WS_TEXT, json.dumps(message, separators=(',', ':')).encode()))
+                await writer.drain()
+
+            try:
+                message = parse_json(payload)
+                seq = message.get('seq')
+                await self.service.handle_ws(message, respond)
+            except RequestError as e:
+                await respond(e.status, {'error': str(e)})
+
+
+async def flush_loop(writer):
+    while True:
+        await asyncio.sleep(CORPUS_FLUSH_INTERVAL)
+        writer.flush()
+
+
+async def serve(host, port, idle_timeout, writer=None):
+    """writer (corpus.CorpusWriter)를 넘기면 4x4 세션의 수를 모두 덧붙이고 끝날 때 닫습니다."""
+    recorder = None
+    if writer is not None:
+        import corpus # numpy를 쓰므로 --corpus일 때만 불러옵니다
+        recorder = lambda game_: writer.recorder(game_, corpus.SOURCE_SERVER)
+        flusher = asyncio.ensure_future(flush_loop(writer))
+    server = GameServer(SessionStore(idle_timeout, recorder=recorder))
+    host, port = await server.start(host, port)
+    print("2048 세션 서버: http://%s:%d (WebSocket: ws://%s:%d/ws)" % (host, port, host, port))
+    try:
+        await server.server.serve_forever()
+    finally:
+        if writer is not None:
+            flusher.cancel()
+            writer.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="2048 세션 서버 (HTTP/WebSocket)")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--idle-timeout', type=float, default=IDLE_TIMEOUT, help="유휴 세션을 제거할 시간 (초)")
+    parser.add_argument('--corpus', metavar='DIR', default=None, help="4x4 세션의 모든 수를 이 말뭉치에 덧붙입니다")
+    args = parser.parse_args(argv)
+    writer = None
+    if args.corpus is not None:
+        import corpus
+        try:
+            writer = corpus.CorpusWriter(args.corpus)
+        except (OSError, corpus.CorpusError) as e:
+            parser.error(str(e))
+    try:
+        asyncio.run(serve(args.host, args.port, args.idle_timeout, writer))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
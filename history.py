@@ -0,0 +1,55 @@
+"""
+되돌리기/다시 하기 기록입니다.
+
+시작부터 현재까지 각 수 뒤의 보드 스냅샷 (4x4는 64비트 정수, 그 외는 칸마다 1바이트)과 점수만 저장합니다.
+새 타일은 (게임 시드, 타일 번호)로 정해지므로 (replay.SpawnRandom) 난수 상태는 기록의 위치 자체입니다.
+다시 하기는 되돌린 수의 방향만 쌓아 두었다가 그 방향으로 다시 이동하면 같은 새 타일까지 그대로 재현됩니다.
+4x4 보드는 한 수당 16바이트 (보드 8 + 점수 8)만 씁니다.
+"""
+
+from array import array
+
+
+class UndoHistory:
+    """보드 스냅샷/점수 스택과 다시 하기 방향 코드 스택입니다. 모든 연산이 O(1)입니다."""
+
+    __slots__ = ('boards', 'scores', 'redo_directions')
+
+    def __init__(self, snapshot, score=0):
+        # 4x4 비트보드 스냅샷은 정수이므로 배열에 8바이트씩 바로 담습니다.
+        self.boards = array('Q', (snapshot,)) if isinstance(snapshot, int) else [snapshot]
+        self.scores = array('Q', (score,))
+        self.redo_directions = bytearray() # 마지막 항목이 다음에 다시 할 방향 코드
+
+    def __len__(self):
+        """기록된 수의 개수 (시작 상태 제외)"""
+        return len(self.boards) - 1
+
+    def push(self, snapshot, score, direction_code):
+        """
+        새 수 뒤의 상태를 기록합니다. 다시 하기 스택의 다음 방향과 같은 수이면 그 항목만 소비하고,
+        다른 수를 두었으면 다시 하기 기록을 버립니다.
+        """
+        self.boards.append(snapshot)
+        self.scores.append(score)
+        if self.redo_directions and self.redo_directions[-1] == direction_code:
+            self.redo_directions.pop()
+        else:
+            self.redo_directions.clear()
+
+    def can_undo(self):
+        return len(self.boards) > 1
+
+    def undo(self, direction_code):
+        """
+        마지막 수를 되돌리고 (스냅샷, 점수)를 반환합니다. direction_code는 되돌리는 수의 방향 코드로,
+        다시 하기 스택에 쌓입니다.
+        """
+        self.boards.pop()
+        self.scores.pop()
+        self.redo_directions.append(direction_code)
+        return self.boards[-1], self.scores[-1]
+
+    def next_redo(self):
+        """다시 할 수의 방향 코드 (없으면 None)"""
+        return self.redo_directions[-1] if self.redo_directions else None
@@ -0,0 +1,256 @@
+"""
+n-튜플 네트워크 평가기와 TD(0) 자기 대국 학습기입니다 (4x4 비트보드, 학습된 자동 진행 정책).
+
+보드 값은 6칸짜리 튜플 4종 (PATTERNS)을 보드의 8가지 대칭에 대어 본 32개 가중치의 합입니다.
+튜플의 칸을 비트보드의 연속된 니블로 고르면 인덱스가 시프트/마스크 한두 번이라 파이썬에서도 빠릅니다.
+가중치는 튜플마다 16^6개의 float32를 이어 붙인 평평한 배열 하나 (memoryview 'f')에 둡니다.
+
+학습은 이동 직후 보드 (afterstate)의 가치를 배우는 TD(0)입니다. 자기 대국에서 매 수 (얻는 점수 + 이동 뒤 가치)가
+가장 큰 방향을 두고, 직전 afterstate의 가치를 (이번 점수 + 이번 afterstate의 가치) 쪽으로 옮깁니다.
+규칙은 game_core (move, add_random_tile, can_move)를 그대로 씁니다.
+
+체크포인트는 헤더 (HEADER_SIZE 바이트) 뒤에 가중치를 그대로 붙인 파일이라 mmap으로 바로 열립니다
+(268MB를 읽지 않고, 평가에 필요한 페이지만 운영체제가 불러옵니다).
+
+    python ntuple.py --games 20000 --checkpoint weights.ntw            # 처음부터 학습
+    python ntuple.py --games 20000 --checkpoint weights.ntw --resume   # 이어서 학습
+    python tournament.py --policy ntuple:policy --games 100             # NTUPLE_CHECKPOINT (기본 weights.ntw)로 대국
+    python 해커톤.py --ntuple weights.ntw                                # 자동 진행 (A 키)/힌트에 사용
+"""
+
+import argparse
+import mmap
+import os
+import random
+import struct
+import sys
+import time
+from array import array
+
+import bitboard
+import game_core
+
+MAGIC = b'NTW\x01' # 형식 식별자 + 버전 (PATTERNS가 바뀌면 버전도 바꿉니다)
+HEADER = struct.Struct('<4sIIQ') # MAGIC, 튜플 수, 튜플당 가중치 수, 학습한 게임 수
+HEADER_SIZE = 64 # 가중치가 페이지 안에서 정렬되도록 헤더 영역을 64바이트로 맞춥니다
+PATTERNS = ((0, 1, 2, 3, 4, 5), (4, 5, 6, 7, 8, 9), (0, 1, 2, 4, 5, 6), (4, 5, 6, 8, 9, 10)) # 칸 인덱스 (4 * row + col)
+TUPLE_ENTRIES = 16 ** 6
+SYMMETRIES = 8
+FEATURES = len(PATTERNS) * SYMMETRIES # 보드 하나의 가치에 더해지는 가중치 수
+
+DEFAULT_CHECKPOINT = 'weights.ntw'
+DEFAULT_LEARNING_RATE = 0.1 # 가중치 하나의 학습률은 이 값을 FEATURES로 나눈 값
+DEFAULT_REPORT_EVERY = 100 # 이 판마다 학습 속도와 최근 점수를 출력합니다
+DEFAULT_SAVE_EVERY = 1000 # 이 판마다 체크포인트를 저장합니다
+
+_OFFSETS = tuple(k * TUPLE_ENTRIES for k in range(len(PATTERNS)))
+
+
+def _reverse_row_nibbles(row):
+    return ((row & 0xF) << 12) | ((row & 0xF0) << 4) | ((row >> 4) & 0xF0) | (row >> 12)
+
+
+_ROW_REVERSE = array('Q', (_reverse_row_nibbles(row) for row in range(65536)))
+
+
+def _mirror(board):
+    """좌우 뒤집기"""
+    reverse = _ROW_REVERSE
+    return (reverse[board & 0xFFFF] | (reverse[(board >> 16) & 0xFFFF] << 16)
+            | (reverse[(board >> 32) & 0xFFFF] << 32) | (reverse[board >> 48] << 48))
+
+
+def _flip(board):
+    """위아래 뒤집기"""
+    return (((board & 0xFFFF) << 48) | (((board >> 16) & 0xFFFF) << 32)
+            | (((board >> 32) & 0xFFFF) << 16) | (board >> 48))
+
+
+def symmetries(board):
+    """보드의 8가지 대칭 (회전/뒤집기)을 반환합니다."""
+    mirrored = _mirror(board)
+    transposed = bitboard.transpose(board)
+    rotated = _mirror(transposed)
+    return (board, _flip(board), mirrored, _flip(mirrored),
+            transposed, _flip(transposed), rotated, _flip(rotated))
+
+
+def feature_indices(board):
+    """보드의 FEATURES개 가중치 인덱스 (가중치 배열 전체 기준) 목록을 반환합니다."""
+    o1, o2, o3 = _OFFSETS[1], _OFFSETS[2], _OFFSETS[3]
+    indices = []
+    for b in symmetries(board):
+        indices.append(b & 0xFFFFFF) # 칸 0~5
+        indices.append(o1 + ((b >> 16) & 0xFFFFFF)) # 칸 4~9
+        indices.append(o2 + ((b & 0xFFF) | ((b >> 4) & 0xFFF000))) # 칸 0, 1, 2, 4, 5, 6
+        indices.append(o3 + (((b >> 16) & 0xFFF) | ((b >> 20) & 0xFFF000))) # 칸 4, 5, 6, 8, 9, 10
+    return indices
+
+
+class CheckpointError(ValueError):
+    """체크포인트 파일이 이 형식이 아니거나 PATTERNS와 맞지 않을 때 발생합니다."""
+
+
+class NTupleNetwork:
+    """튜플 가중치 (float32 memoryview)와 학습한 게임 수입니다. load()로 연 네트워크는 close()로 닫습니다."""
+
+    __slots__ = ('weights', 'games', '_mmap')
+
+    def __init__(self, weights=None, games=0):
+        if weights is None:
+            weights = memoryview(bytearray(4 * len(PATTERNS) * TUPLE_ENTRIES)).cast('f')
+        self.weights = weights
+        self.games = games
+        self._mmap = None
+
+    @classmethod
+    def load(cls, path, writable=False):
+        """
+        체크포인트를 mmap으로 엽니다. writable이면 쓰기 시 복사 (ACCESS_COPY)로 열어 이어서 학습할 수 있고,
+        바뀐 가중치는 save()를 불러야 파일에 남습니다.
+        """
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY if writable else mmap.ACCESS_READ)
+        if len(mapped) < HEADER_SIZE:
+            mapped.close()
+            raise CheckpointError("체크포인트가 너무 짧습니다: %s" % path)
+        magic, tuple_count, entries, games = HEADER.unpack_from(mapped)
+        if (magic, tuple_count, entries) != (MAGIC, len(PATTERNS), TUPLE_ENTRIES) \
+                or len(mapped) != HEADER_SIZE + 4 * tuple_count * entries:
+            mapped.close()
+            raise CheckpointError("n-튜플 체크포인트 형식이 아닙니다: %s" % path)
+        network = cls(memoryview(mapped)[HEADER_SIZE:].cast('f'), games)
+        network._mmap = mapped
+        return network
+
+    def save(self, path):
+        """임시 파일에 쓴 뒤 바꿔 끼우므로 저장 중에 멈춰도 이전 체크포인트가 남습니다."""
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, len(PATTERNS), TUPLE_ENTRIES, self.games).ljust(HEADER_SIZE, b'\0'))
+            f.write(self.weights.cast('B'))
+        os.replace(temporary, path)
+
+    def close(self):
+        if self._mmap is not None:
+            self.weights.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def value(self, board):
+        return sum(map(self.weights.__getitem__, feature_indices(board)))
+
+    def update(self, indices, delta):
+        """feature_indices()가 돌려준 가중치들에 delta를 더합니다."""
+        weights = self.weights
+        for index in indices:
+            weights[index] += delta
+
+    def evaluate_moves(self, board):
+        """
+        (얻는 점수 + afterstate 가치)가 가장 큰 수의 (방향, afterstate, 얻는 점수, afterstate 가치, 가중치 인덱스)를
+        반환합니다 (움직일 수 없으면 None). 인덱스는 학습할 때 다시 계산하지 않도록 함께 돌려줍니다.
+        """
+        lookup = self.weights.__getitem__
+        best = None
+        best_total = 0.0
+        for direction in game_core.legal_moves(board):
+            after, reward = game_core.move(board, direction)
+            indices = feature_indices(after)
+            value = sum(map(lookup, indices))
+            if best is None or reward + value > best_total:
+                best = (direction, after, reward, value, indices)
+                best_total = reward + value
+        return best
+
+    def best_move(self, board):
+        """학습된 가치로 고른 방향 (움직일 수 없으면 None)"""
+        best = self.evaluate_moves(board)
+        return best[0] if best is not None else None
+
+
+def train_game(network, rng, learning_rate=DEFAULT_LEARNING_RATE):
+    """자기 대국 한 판을 두며 TD(0)로 학습하고 (점수, 수, 최대 타일)을 반환합니다."""
+    step = learning_rate / FEATURES
+    lookup = network.weights.__getitem__
+    board, _ = game_core.add_random_tile(0, rng)
+    board, _ = game_core.add_random_tile(board, rng)
+    score = 0
+    moves = 0
+    previous = None # 직전 수의 afterstate 가중치 인덱스
+    previous_value = 0.0
+    while game_core.can_move(board):
+        direction, after, reward, value, indices = network.evaluate_moves(board)
+        if previous is not None:
+            network.update(previous, step * (reward + value - previous_value))
+            # 직전 afterstate와 가중치를 공유할 수 있으므로 갱신한 뒤의 값을 다시 읽습니다.
+            value = sum(map(lookup, indices))
+        previous, previous_value = indices, value
+        board, _ = game_core.add_random_tile(after, rng)
+        score += reward
+        moves += 1
+    if previous is not None:
+        network.update(previous, step * -previous_value) # 마지막 afterstate 뒤에는 얻을 것이 없습니다
+    network.games += 1
+    return score, moves, bitboard.exponent_to_value(bitboard.max_exponent(board))
+
+
+_policy_network = None
+
+def policy(board, rng):
+    """
+    tournament.py 정책 (policy(board, rng) -> 방향). NTUPLE_CHECKPOINT 환경 변수 (기본 weights.ntw)의
+    체크포인트를 프로세스마다 처음 한 번 mmap으로 엽니다.
+    """
+    global _policy_network
+    if _policy_network is None:
+        _policy_network = NTupleNetwork.load(os.environ.get('NTUPLE_CHECKPOINT', DEFAULT_CHECKPOINT))
+    return _policy_network.best_move(board)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="n-튜플 네트워크 TD(0) 자기 대국 학습")
+    parser.add_argument('--games', type=int, default=10000, help="학습할 판 수")
+    parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT, help="체크포인트 경로")
+    parser.add_argument('--resume', action='store_true', help="체크포인트에서 이어서 학습합니다")
+    parser.add_argument('--learning-rate', type=float, default=DEFAULT_LEARNING_RATE)
+    parser.add_argument('--seed', type=int, default=None, help="새 타일 난수 시드")
+    parser.add_argument('--report-every', type=int, default=DEFAULT_REPORT_EVERY, help="이 판마다 통계 출력 (0이면 마지막에만)")
+    parser.add_argument('--save-every', type=int, default=DEFAULT_SAVE_EVERY, help="이 판마다 체크포인트 저장 (0이면 마지막에만)")
+    args = parser.parse_args(argv)
+    if args.report_every < 0 or args.save_every < 0:
+        parser.error("--report-every와 --save-every는 0 이상이어야 합니다")
+
+    if args.resume:
+        try:
+            network = NTupleNetwork.load(args.checkpoint, writable=True)
+        except (OSError, CheckpointError) as e:
+            parser.error(str(e))
+    else:
+        network = NTupleNetwork()
+    rng = random.Random(args.seed)
+
+    started = window_started = time.perf_counter()
+    window = []
+    for i in range(1, args.games + 1):
+        window.append(train_game(network, rng, args.learning_rate))
+        if (args.report_every and i % args.report_every == 0) or i == args.games:
+            now = time.perf_counter()
+            scores = [score for score, _, _ in window]
+            moves = sum(m for _, m, _ in window)
+            print("%d판 (누적 %d): %.1f판/초, %.0f수/초, 평균 점수 %.0f, 최고 %d, 2048 도달 %.1f%%"
+                  % (i, network.games, len(window) / (now - window_started), moves / (now - window_started),
+                     sum(scores) / len(scores), max(scores),
+                     100.0 * sum(1 for _, _, tile in window if tile >= game_core.WIN_VALUE) / len(window)))
+            window = []
+            window_started = now
+        if (args.save_every and i % args.save_every == 0) or i == args.games:
+            network.save(args.checkpoint)
+    elapsed = time.perf_counter() - started
+    print("%d판, %.1f초 (%.1f판/초), 체크포인트: %s" % (args.games, elapsed, args.games / elapsed, args.checkpoint))
+    network.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+시간 예산 (밀리초) 안에 최선의 방향을 돌려주는 병렬 반복 심화 탐색입니다 (4x4 비트보드, 봇 대전/힌트용).
+
+루트의 각 방향 (이동 뒤 확률 노드)을 프로세스 풀의 작업으로 나누어 계산합니다. 작업자가 방향 수보다 많으면
+방향마다 빈 칸을 몇 묶음으로 더 나누어 (expectimax.score_spawns) 모든 코어를 씁니다.
+깊이 2부터 한 깊이씩 모든 작업을 맡기고, 모든 방향이 끝난 깊이만 결과로 인정합니다 (깊이 1은 부모가 직접
+계산하므로 항상 답이 있습니다). 작업은 마감 시각에 스스로 멈추고, 부모는 마감 뒤 GRACE_SECONDS까지만
+기다리므로 보드가 복잡해도 응답 시간이 일정합니다.
+
+    with ParallelSearcher() as searcher:
+        direction = searcher.best_move(board.bits, 50)   # 50ms 안의 최선
+
+    python parallel_search.py --budget-ms 50 --moves 100   # 응답 시간과 도달 깊이 측정
+
+작업자마다 전치 테이블을 따로 두고 수 사이에 유지합니다. 마감 시각은 시스템 전체에서 같은 time.monotonic()으로 넘깁니다.
+"""
+
+import argparse
+import concurrent.futures
+import os
+import sys
+import time
+
+import bitboard
+import expectimax
+import replay
+
+DEFAULT_BUDGET_MS = 50
+DEFAULT_MAX_DEPTH = 8
+GRACE_SECONDS = 0.002 # 마감 뒤 작업 결과를 기다리는 시간 (작업자가 마감을 확인하는 간격 + 결과 전달)
+
+
+def _init_worker():
+    """작업자 프로세스를 시작할 때 평가 테이블을 미리 만듭니다 (첫 탐색이 늦어지지 않도록)."""
+    expectimax._heuristic_table()
+
+
+def _warm_up():
+    return os.getpid()
+
+
+def _search_chunk(board, shifts, depth, deadline):
+    """
+    작업자에서 실행: 이동 뒤 보드 board의 빈 칸 shifts에 대한 루트 깊이 depth의 부분합을 반환합니다.
+    deadline (time.monotonic 기준)을 넘기면 탐색을 버리고 None을 반환합니다.
+    """
+    local_deadline = time.perf_counter() + (deadline - time.monotonic())
+    try:
+        return expectimax.score_spawns(board, shifts, depth - 1, deadline=local_deadline)
+    except expectimax.SearchTimeout:
+        return None
+
+
+class SearchResult:
+    """best_move()의 결과: 방향, 모든 방향을 끝까지 탐색한 깊이, 그 깊이의 방향별 값, 걸린 시간 (초)."""
+
+    __slots__ = ('direction', 'depth', 'scores', 'elapsed')
+
+    def __init__(self, direction, depth, scores, elapsed):
+        self.direction = direction
+        self.depth = depth
+        self.scores = scores
+        self.elapsed = elapsed
+
+
+class ParallelSearcher:
+    """작업자 프로세스 풀을 가진 탐색기입니다. 풀을 만드는 비용이 크므로 한 번 만들어 여러 수에 씁니다."""
+
+    def __init__(self, workers=None, max_depth=DEFAULT_MAX_DEPTH):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_depth = max_depth
+        self.pool = concurrent.futures.ProcessPoolExecutor(self.workers, initializer=_init_worker)
+        # 풀은 작업을 받을 때 프로세스를 띄우므로, 작업자 수만큼 미리 띄워 두고 평가 테이블까지 준비합니다.
+        # 부모도 깊이 1을 직접 평가하므로 같은 테이블을 만들어 둡니다.
+        _init_worker()
+        concurrent.futures.wait([self.pool.submit(_warm_up) for _ in range(self.workers)])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+    def search(self, board, budget_ms=DEFAULT_BUDGET_MS):
+        """board (64비트 비트보드)에서 budget_ms 안에 탐색하고 SearchResult를 반환합니다 (움직일 수 없으면 방향이 None)."""
+        started = time.monotonic()
+        deadline = started + budget_ms / 1000.0
+        children = {}
+        for direction in bitboard.DIRECTIONS:
+            new_board = bitboard.MOVE_FUNCTIONS[direction](board)
+            if new_board != board:
+                children[direction] = new_board
+        if not children:
+            return SearchResult(None, 0, {}, time.monotonic() - started)
+
+        # 깊이 1 (이동 직후 평가)은 바로 계산해 두어 작업이 하나도 끝나지 않아도 답이 있게 합니다.
+        scores_by_depth = {1: {direction: expectimax.evaluate(child) for direction, child in children.items()}}
+
+        # 방향마다 빈 칸을 나누어 작업을 만듭니다 (작업자 수를 방향 수로 나눈 만큼, 빈 칸 수 이하).
+        chunks_per_direction = max(1, -(-self.workers // len(children)))
+        chunks = []
+        for direction, child in children.items():
+            shifts = [4 * i for i in range(16) if not (child >> (4 * i)) & 0xF]
+            count = min(chunks_per_direction, len(shifts))
+            chunks.extend((direction, child, shifts[k::count]) for k in range(count))
+
+        # 깊이마다 모든 묶음을 한꺼번에 맡기고, 전부 끝나야 다음 깊이로 내려갑니다 (작업자의 전치 테이블이 이어짐).
+        for depth in range(2, self.max_depth + 1):
+            futures = [self.pool.submit(_search_chunk, child, shifts, depth, deadline) for _, child, shifts in chunks]
+            done, pending = concurrent.futures.wait(
+                futures, timeout=max(0.0, deadline + GRACE_SECONDS - time.monotonic()))
+            if pending:
+                for future in pending:
+                    future.cancel() # 아직 시작하지 않은 작업은 버리고, 실행 중인 작업은 마감에 스스로 멈춥니다
+                break
+            values = [future.result() for future in futures]
+            if None in values:
+                break
+            totals = dict.fromkeys(children, 0.0)
+            for (direction, _, _), value in zip(chunks, values):
+                totals[direction] += value
+            scores_by_depth[depth] = {direction: totals[direction] / bitboard.count_empty(child)
+                                      for direction, child in children.items()}
+
+        depth = max(scores_by_depth)
+        scores = scores_by_depth[depth]
+        return SearchResult(max(scores, key=scores.get), depth, scores, time.monotonic() - started)
+
+    def best_move(self, board, budget_ms=DEFAULT_BUDGET_MS):
+        """budget_ms 안에 끝까지 탐색한 가장 깊은 결과의 방향을 반환합니다 (움직일 수 없으면 None)."""
+        return self.search(board, budget_ms).direction
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="병렬 반복 심화 탐색으로 게임을 진행하며 응답 시간을 잽니다")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS, help="한 수의 시간 예산 (밀리초)")
+    parser.add_argument('--workers', type=int, default=None, help="작업자 프로세스 수 (기본: 코어 수)")
+    parser.add_argument('--max-depth', type=int, default=DEFAULT_MAX_DEPTH)
+    parser.add_argument('--moves', type=int, default=100, help="둘 수의 개수")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    with ParallelSearcher(args.workers, args.max_depth) as searcher:
+        board, rng = replay.new_game(args.seed)
+        elapsed = []
+        depths = []
+        for i in range(args.moves):
+            result = searcher.search(board.bits, args.budget_ms)
+            if result.direction is None:
+                break
+            elapsed.append(result.elapsed * 1000)
+            depths.append(result.depth)
+            board.move(result.direction)
+            rng.spawn(board, i + 2)
+    elapsed.sort()
+    print("작업자 %d개, 예산 %.1f ms, %d수, 최대 타일 %d" % (searcher.workers, args.budget_ms, len(elapsed), board.max_value()))
+    if elapsed:
+        print("응답 시간  p50 %.2f ms  p99 %.2f ms  최대 %.2f ms"
+              % (elapsed[len(elapsed) // 2], elapsed[min(len(elapsed) - 1, int(len(elapsed) * 0.99))], elapsed[-1]))
+        print("도달 깊이  평균 %.2f  최소 %d  최대 %d" % (sum(depths) / len(depths), min(depths), max(depths)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""
+한 판의 게임을 시드와 방향 목록만으로 기록하고 그대로 재현하는 리플레이 형식입니다.
+
+새 타일은 (게임 시드, 타일 번호)만으로 정해지는 SpawnRandom에서만 나오므로, 시드와 둔 방향만 알면
+같은 보드를 다시 만들 수 있습니다 (난수 상태가 타일 번호 하나뿐이라 되돌리기도 난수 상태를 저장하지 않습니다).
+방향은 한 수당 2비트 (DIRECTIONS 순서의 코드)로 묶어 저장하고, 일정 간격마다 새 타일의 위치/값
+(체크포인트)을 함께 저장해 재현이 어긋난 지점을 찾습니다.
+
+    python replay.py game.rpl other.rpl   # 화면 없이 최대 속도로 재생하고 결과를 확인
+
+바이트 형식 (리틀 엔디언):
+    헤더      MAGIC, 보드 크기 (B), 시드 (Q), 수 (I), 최종 점수 (Q), 체크포인트 간격 (H)
+    방향      ceil(수 / 4) 바이트, 바이트마다 낮은 비트부터 2비트씩 네 수
+    체크포인트 (수 // 간격)개, 각각 (칸 인덱스 (H), 지수 (B))
+"""
+
+import argparse
+import random
+import struct
+import sys
+import time
+
+import bitboard
+import game_core
+
+MAGIC = b'R2K\x02' # 형식 식별자 + 버전 (2: 타일 번호별 SpawnRandom)
+HEADER = struct.Struct('<4sBQIQH')
+CHECKPOINT = struct.Struct('<HB')
+DEFAULT_CHECKPOINT_INTERVAL = 32 # 이 수마다 새 타일 정보를 기록합니다 (0이면 기록하지 않음)
+MAX_SEED = (1 << 64) - 1
+MASK64 = (1 << 64) - 1
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15 # splitmix64 증분
+
+DIRECTION_CODES = {direction: code for code, direction in enumerate(game_core.DIRECTIONS)}
+
+
+class ReplayError(ValueError):
+    """리플레이 데이터가 잘못되었거나 재현 결과가 기록과 다를 때 발생합니다."""
+
+
+def new_seed():
+    """새 게임에 쓸 64비트 시드를 만듭니다."""
+    return random.SystemRandom().getrandbits(64)
+
+
+def _mix64(z):
+    """splitmix64 출력 함수"""
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+    return z ^ (z >> 31)
+
+
+class SpawnRandom:
+    """
+    새 타일 전용 splitmix64 난수 생성기입니다. 보드의 add_random_tile()이 쓰는 choice()/random()만 제공합니다.
+    spawn(board, index)는 (게임 시드, 타일 번호)로 상태를 다시 정하므로, 어느 수에서든 타일 번호만 알면
+    같은 새 타일이 나옵니다 (첫 두 타일이 0, 1번이고 n번째 수 뒤의 타일이 n + 1번).
+    """
+
+    __slots__ = ('seed', 'state')
+
+    def __init__(self, seed):
+        self.seed = seed
+        self.state = seed
+
+    def _next(self):
+        self.state = (self.state + GOLDEN_GAMMA) & MASK64
+        return _mix64(self.state)
+
+    def random(self):
+        return (self._next() >> 11) * (1.0 / (1 << 53))
+
+    def choice(self, sequence):
+        return sequence[self._next() % len(sequence)]
+
+    def spawn(self, board, index):
+        """index번 새 타일을 보드에 놓고 (row, col, value)를 반환합니다 (빈 칸이 없으면 None)."""
+        self.state = _mix64((self.seed + index * GOLDEN_GAMMA) & MASK64)
+        return board.add_random_tile(self)
+
+
+def new_game(seed, size=game_core.BOARD_SIZE):
+    """
+    시드로 새 게임을 시작합니다. (보드 객체, 새 타일용 SpawnRandom)을 반환합니다.
+    처음 두 타일 (0, 1번)도 시드로 정해지므로 리플레이에는 기록하지 않습니다.
+    """
+    rng = SpawnRandom(seed)
+    board = game_core.create_board(size)
+    rng.spawn(board, 0)
+    rng.spawn(board, 1)
+    return board, rng
+
+
+class Replay:
+    """시드, 보드 크기, 둔 방향 코드와 체크포인트를 담는 기록입니다."""
+
+    __slots__ = ('seed', 'size', 'moves', 'score', 'checkpoint_interval', 'checkpoints')
+
+    def __init__(self, seed, size=game_core.BOARD_SIZE, checkpoint_interval=DEFAULT_CHECKPOINT_INTERVAL):
+        if not 0 <= seed <= MAX_SEED:
+            raise ReplayError("시드는 0 이상 2^64 미만이어야 합니다: %r" % (seed,))
+        self.seed = seed
+        self.size = size
+        self.moves = bytearray() # 한 수당 방향 코드 하나 (저장할 때 2비트로 묶음)
+        self.score = 0
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoints = [] # (칸 인덱스, 지수)
+
+    def __len__(self):
+        return len(self.moves)
+
+    def truncate(self, count, score):
+        """처음 count수만 남깁니다 (되돌리기). score는 그 시점의 점수입니다."""
+        del self.moves[count:]
+        if self.checkpoint_interval:
+            del self.checkpoints[count // self.checkpoint_interval:]
+        self.score = score
+
+    def record(self, direction, gained, spawned):
+        """보드를 바꾼 한 수와 그 뒤에 나온 새 타일 ((row, col, value) 또는 None)을 기록합니다."""
+        self.moves.append(DIRECTION_CODES[direction])
+        self.score += gained
+        if self.checkpoint_interval and len(self.moves) % self.checkpoint_interval == 0:
+            self.checkpoints.append(_checkpoint(spawned, self.size))
+
+    def to_bytes(self):
+        count = len(self.moves)
+        packed = bytearray((count + 3) // 4)
+        for i, code in enumerate(self.moves):
+            packed[i >> 2] |= code << (2 * (i & 3))
+        parts = [HEADER.pack(MAGIC, self.size, self.seed, count, self.score, self.checkpoint_interval), bytes(packed)]
+        parts.extend(CHECKPOINT.pack(*checkpoint) for checkpoint in self.checkpoints)
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) < HEADER.size:
+            raise ReplayError("리플레이 데이터가 너무 짧습니다")
+        magic, size, seed, count, score, interval = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ReplayError("리플레이 형식이 아닙니다: %r" % (magic,))
+        if not game_core.MIN_BOARD_SIZE <= size <= game_core.MAX_BOARD_SIZE:
+            raise ReplayError("보드 크기가 잘못되었습니다: %d" % size)
+        checkpoint_count = count // interval if interval else 0
+        packed_size = (count + 3) // 4
+        if len(data) != HEADER.size + packed_size + checkpoint_count * CHECKPOINT.size:
+            raise ReplayError("리플레이 데이터 길이가 헤더와 맞지 않습니다")
+        replay = cls(seed, size, interval)
+        replay.score = score
+        offset = HEADER.size
+        replay.moves = bytearray((data[offset + (i >> 2)] >> (2 * (i & 3))) & 3 for i in range(count))
+        offset += packed_size
+        replay.checkpoints = [CHECKPOINT.unpack_from(data, offset + i * CHECKPOINT.size) for i in range(checkpoint_count)]
+        return replay
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+def _checkpoint(spawned, size):
+    if spawned is None:
+        return (0, 0)
+    r, c, value = spawned
+    return (r * size + c, bitboard.value_to_exponent(value))
+
+
+def play(replay, verify=True):
+    """
+    화면 없이 기록된 수를 그대로 다시 두고 (보드 객체, 점수)를 반환합니다.
+    verify가 True이면 둘 수 없는 수, 체크포인트, 최종 점수가 기록과 다를 때 ReplayError를 발생시킵니다.
+    """
+    board, rng = new_game(replay.seed, replay.size)
+    directions = game_core.DIRECTIONS
+    interval = replay.checkpoint_interval if verify else 0
+    size = replay.size
+    score = 0
+    for i, code in enumerate(replay.moves, 1):
+        gained = board.move(directions[code])
+        if gained is None:
+            if verify:
+                raise ReplayError("%d번째 수 (%s)로 보드가 바뀌지 않습니다" % (i, directions[code]))
+            continue
+        score += gained
+        spawned = rng.spawn(board, i + 1)
+        if interval and i % interval == 0 and _checkpoint(spawned, size) != replay.checkpoints[i // interval - 1]:
+            raise ReplayError("%d번째 수 뒤의 새 타일이 기록과 다릅니다" % i)
+    if verify and score != replay.score:
+        raise ReplayError("최종 점수 %d가 기록된 점수 %d와 다릅니다" % (score, replay.score))
+    return board, score
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="2048 리플레이를 화면 없이 재생하고 검증합니다")
+    parser.add_argument('paths', nargs='+', metavar='PATH', help="리플레이 파일")
+    parser.add_argument('--no-verify', action='store_true', help="체크포인트와 점수를 확인하지 않습니다")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    total_moves = 0
+    started = time.perf_counter()
+    for path in args.paths:
+        try:
+            replay = Replay.load(path)
+            board, score = play(replay, verify=not args.no_verify)
+        except (OSError, ReplayError) as e:
+            failures += 1
+            print("%s: 실패 - %s" % (path, e))
+            continue
+        total_moves += len(replay)
+        print("%s: %dx%d, 시드 %d, %d수, 점수 %d, 최대 타일 %d, 상태 %s"
+              % (path, replay.size, replay.size, replay.seed, len(replay), score, board.max_value(), board.status()))
+    elapsed = time.perf_counter() - started
+    print("리플레이 %d개 (실패 %d), %d수, %.2f초 (%.0f수/초)"
+          % (len(args.paths), failures, total_moves, elapsed, total_moves / elapsed if elapsed > 0 else 0.0))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+"""
+game_server.py 부하 생성기입니다. 세션 수천 개를 동시에 열어 두고 각 세션이 사람처럼 띄엄띄엄 수를 두게 하면서
+이동 한 번의 왕복 시간 (요청을 보내고 응답을 받을 때까지)과 서버 안의 처리 시간을 잽니다.
+
+    python server_load.py --sessions 2000 --duration 10            # 같은 프로세스에 서버를 띄워 측정 (코어 하나)
+    python server_load.py --connect 127.0.0.1:8765 --transport http # 따로 띄운 서버에 HTTP keep-alive로 측정
+
+모든 세션은 연결마다 한 번에 요청 하나만 보내고, 세션 하나당 평균 --interval초마다 (0.5~1.5배로 흔들어) 수를 둡니다.
+게임이 끝난 세션은 새 게임을 만듭니다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+import game_server
+
+DEFAULT_SESSIONS = 2000
+DEFAULT_DURATION = 10.0 # 측정 시간 (초, 모든 세션이 연결된 뒤부터)
+DEFAULT_INTERVAL = 1.0 # 세션 하나가 수를 두는 평균 간격 (초)
+CONNECT_CONCURRENCY = 200 # 동시에 여는 연결 수 (접속 대기열이 넘치지 않도록)
+
+
+class WebSocketClient:
+    """WebSocket 연결 하나. call()은 메시지 하나를 보내고 응답 하나를 받습니다."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(('GET /ws HTTP/1.1\r\nHost: %s:%d\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n'
+                      'Sec-WebSocket-Key: %s\r\nSec-WebSocket-Version: 13\r\n\r\n'
+                      % (host, port, 'bG9hZC1nZW5lcmF0b3IxMg==')).encode())
+        head = await reader.readuntil(b'\r\n\r\n')
+        if not head.startswith(b'HTTP/1.1 101'):
+            raise ConnectionError("WebSocket 업그레이드 실패: %r" % head.split(b'\r\n', 1)[0])
+        return cls(reader, writer)
+
+    async def call(self, message):
+        self.writer.write(game_server.ws_frame(game_server.WS_TEXT, json.dumps(message).encode(), os.urandom(4)))
+        opcode, payload = await game_server.read_ws_frame(self.reader, require_mask=False)
+        if opcode != game_server.WS_TEXT:
+            raise ConnectionError("서버가 연결을 닫았습니다")
+        return json.loads(payload)
+
+    async def new_game(self):
+        return await self.call({'op': 'new'})
+
+    async def move(self, session_id, direction):
+        return await self.call({'op': 'move', 'id': session_id, 'direction': direction})
+
+    async def stats(self):
+        return await self.call({'op': 'stats'})
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+class HttpClient:
+    """HTTP keep-alive 연결 하나."""
+
+    def __init__(self, reader, writer, host):
+        self.reader = reader
+        self.writer = writer
+        self.host = host
+
+    @classmethod
+    async def connect(cls, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer, '%s:%d' % (host, port))
+
+    async def request(self, method, path, message=None):
+        body = json.dumps(message).encode() if message is not None else b''
+        self.writer.write(('%s %s HTTP/1.1\r\nHost: %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n'
+                           % (method, path, self.host, len(body))).encode() + body)
+        head = await self.reader.readuntil(b'\r\n\r\n')
+        length = 0
+        for line in head.split(b'\r\n'):
+            if line.lower().startswith(b'content-length:'):
+                length = int(line.split(b':', 1)[1])
+        data = await self.reader.readexactly(length)
+        return json.loads(data) if data else {}
+
+    async def new_game(self):
+        return await self.request('POST', '/api/games', {})
+
+    async def move(self, session_id, direction):
+        return await self.request('POST', '/api/games/%s/move' % session_id, {'direction': direction})
+
+    async def stats(self):
+        return await self.request('GET', '/api/stats')
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+CLIENTS = {'ws': WebSocketClient, 'http': HttpClient}
+
+
+def _percentile_ms(sorted_values, fraction):
+    return game_server._percentile(sorted_values, fraction) * 1000
+
+
+async def run_session(client, state, interval, deadline, latencies, rng):
+    """세션 하나: deadline (루프 시각)까지 합법적인 방향 중 하나를 골라 둡니다."""
+    loop = asyncio.get_running_loop()
+    await asyncio.sleep(rng.uniform(0, interval)) # 모든 세션이 같은 순간에 두지 않도록
+    while loop.time() < deadline:
+        if state['status'] is not None or not state['legal']:
+            state = await client.new_game()
+        sent = time.perf_counter()
+        state = await client.move(state['id'], rng.choice(state['legal']))
+        latencies.append(time.perf_counter() - sent)
+        await asyncio.sleep(interval * rng.uniform(0.5, 1.5))
+
+
+async def run_load(host, port, transport, sessions, duration, interval, seed):
+    client_class = CLIENTS[transport]
+    connect_limit = asyncio.Semaphore(CONNECT_CONCURRENCY)
+
+    async def connect():
+        async with connect_limit:
+            return await client_class.connect(host, port)
+
+    connect_started = time.perf_counter()
+    clients = await asyncio.gather(*(connect() for _ in range(sessions)))
+    states = await asyncio.gather(*(client.new_game() for client in clients))
+    connect_seconds = time.perf_counter() - connect_started
+
+    latencies = []
+    rng = random.Random(seed)
+    measure_started = time.perf_counter()
+    deadline = asyncio.get_running_loop().time() + duration
+    await asyncio.gather(*(run_session(client, state, interval, deadline, latencies, random.Random(rng.random()))
+                           for client, state in zip(clients, states)))
+    elapsed = time.perf_counter() - measure_started
+    stats = await clients[0].stats()
+    await asyncio.gather(*(client.close() for client in clients))
+
+    latencies.sort()
+    print("전송 %s, 세션 %d개 (연결과 새 게임 %.2f초), 측정 %.1f초" % (transport, sessions, connect_seconds, elapsed))
+    print("이동 %d번 (%.0f수/초)" % (len(latencies), len(latencies) / elapsed))
+    print("왕복 시간  p50 %.3f ms  p95 %.3f ms  p99 %.3f ms  최대 %.3f ms"
+          % (_percentile_ms(latencies, 0.50), _percentile_ms(latencies, 0.95), _percentile_ms(latencies, 0.99),
+             latencies[-1] * 1000 if latencies else 0.0))
+    service = stats['service_ms']
+    print("서버 처리  p50 %.3f ms  p99 %.3f ms  최대 %.3f ms (서버 세션 %d개)"
+          % (service['p50'], service['p99'], service['max'], stats['sessions']))
+    return latencies
+
+
+async def run_local(args):
+    """같은 이벤트 루프에 서버를 띄우고 부하를 겁니다."""
+    server = game_server.GameServer()
+    host, port = await server.start('127.0.0.1', 0)
+    try:
+        return await run_load(host, port, args.transport, args.sessions, args.duration, args.interval, args.seed)
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="2048 세션 서버 부하 생성기")
+    parser.add_argument('--sessions', type=int, default=DEFAULT_SESSIONS, help="동시 세션 (연결) 수")
+    parser.add_argument('--duration', type=float, default=DEFAULT_DURATION, help="측정 시간 (초)")
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL, help="세션 하나의 평균 수 간격 (초)")
+    parser.add_argument('--transport', choices=sorted(CLIENTS), default='ws')
+    parser.add_argument('--connect', metavar='HOST:PORT', default=None, help="이미 떠 있는 서버에 연결합니다")
+    parser.add_argument('--seed', type=int, default=0, help="방향 선택 난수 시드")
+    args = parser.parse_args(argv)
+
+    if args.connect:
+        host, _, port = args.connect.rpartition(':')
+        asyncio.run(run_load(host, int(port), args.transport, args.sessions, args.duration, args.interval, args.seed))
+    else:
+        asyncio.run(run_local(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
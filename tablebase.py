@@ -0,0 +1,518 @@
+"""
+작은 보드 (2x2, 2x3, 3x3 등)의 완전 해석기와 엔드게임 테이블베이스입니다 (규칙 분석, 완벽한 힌트용).
+
+game_core의 규칙 (slide_and_merge_line으로 줄을 밀고, add_random_tile처럼 빈 칸 하나에 2(90%)/4(10%))
+그대로, 처음 두 타일에서 도달할 수 있는 모든 보드를 나열하고 최선의 수를 두었을 때 목표 타일에 도달할
+정확한 확률을 계산합니다.
+
+- 보드는 칸마다 4비트 지수를 이어 붙인 정수 하나입니다 (칸 i = row * cols + col 이 니블 i, bitboard와 같은 배치).
+  줄 이동은 길이별로 한 번 만든 줄 테이블 (slide_and_merge_line으로 생성) 조회입니다.
+- 회전/뒤집기로 같은 보드 (정사각형 8가지, 직사각형 4가지) 중 가장 작은 값 하나만 저장합니다.
+- 한 수 (이동 + 새 타일)마다 타일 합이 정확히 2나 4 늘어나므로 상태 그래프에 순환이 없습니다.
+  타일 합이 같은 보드를 한 층으로 묶어 앞에서부터 도달 가능한 보드를 나열하고 (메모리에는 세 층만),
+  가장 큰 합의 층부터 거꾸로 (retrograde) 값을 채웁니다. 한 층의 값은 합이 2, 4 큰 두 층만 참조합니다.
+- 테이블베이스 파일은 층마다 정렬한 보드 (uint64)와 같은 순서의 확률 (float32)이라 상태 하나에 12바이트이고,
+  mmap으로 열어 이진 탐색하므로 수억 개 상태도 파일을 읽지 않고 바로 조회합니다.
+- 해석 중 메모리는 전체 상태 수가 아니라 가장 큰 층의 상태 수 n에 비례합니다. 키는 파이썬 집합 (키당 약 70바이트)
+  대신 array('Q')/numpy uint64 (8바이트)에 덧붙이고 np.unique (정렬 + 중복 제거)로 정리합니다.
+  나열은 층 키 8n + 이동 뒤 키와 그 정렬 사본 최대 64n바이트에, 다음 두 층에 쌓이는 키 (8바이트씩, 정리 뒤 남은 키의
+  두 배나 COMPACT_KEYS를 넘으면 다시 정리)를 더한 정도이고, 값 채우기는 이동 쌍마다 20바이트 (보드 번호 4 + 이동 뒤
+  키 8 + 정렬 사본 8, 최대 4n쌍)와 서로 다른 이동 뒤 보드마다 16바이트 (키 + 값)입니다. 최악 (모든 보드가 네 방향으로
+  움직임)에도 층 상태 하나에 약 150바이트입니다 (3x3 목표 256은 가장 큰 층이 5만 4천 개라 몇 MB).
+  해석에만 numpy가 필요하고, 조회 (Tablebase.load)와 게임은 표준 라이브러리만 씁니다.
+
+    python tablebase.py solve --rows 3 --cols 3 --target 256 --out 3x3_256.tb   # 나열 + 해석
+    python tablebase.py info 3x3_256.tb                                           # 처음 보드의 도달 확률
+    python 해커톤.py --size 3 --tablebase 3x3_256.tb                              # 힌트 (H)/자동 진행 (A)에 사용
+
+확률은 float64로 계산해 float32로 저장합니다 (층을 거치며 상대 오차 1e-6 정도).
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+
+import bitboard
+import game_core
+
+MAGIC = b'TBS\x01' # 형식 식별자 + 버전
+HEADER = struct.Struct('<4sBBBxdQQQ') # MAGIC, 행, 열, 목표 지수, 4가 나올 확률, 상태 수, 층 수, 층 목록 위치
+HEADER_SIZE = 64
+LAYER = struct.Struct('<QQQ') # 타일 합, 첫 상태 번호, 상태 수
+
+MIN_SIDE = 2
+MAX_SIDE = 4
+MIN_TARGET_EXPONENT = 3 # 처음 두 타일 (2, 4)이 바로 목표가 되지 않도록 8 이상
+MAX_TARGET_EXPONENT = bitboard.MAX_EXPONENT # 목표에 닿은 보드는 더 밀지 않으므로 니블을 넘치지 않습니다
+
+DIRECTIONS = game_core.DIRECTIONS
+REPORT_EVERY = 20.0 # 진행 상황을 출력하는 간격 (초)
+COMPACT_KEYS = 1 << 24 # 나열 중 다음 층의 키가 이만큼 (128MB) 쌓이면 정렬 + 중복 제거합니다
+ITERATE_CHUNK = 1 << 16 # numpy 배열을 파이썬 정수로 바꾸거나 이진 탐색할 때 한 번에 다루는 원소 수
+
+
+class TablebaseError(ValueError):
+    """테이블베이스 파일이 이 형식이 아니거나 규칙 (4가 나올 확률)이 다를 때 발생합니다."""
+
+
+def _line_tables(length):
+    """길이 length 줄의 모든 지수 조합에 대해 (왼쪽으로 민 결과, 오른쪽으로 민 결과) 테이블을 만듭니다."""
+    left = array('Q', bytes(8 * 16 ** length))
+    right = array('Q', bytes(8 * 16 ** length))
+    for line in range(16 ** length):
+        values = [bitboard.exponent_to_value((line >> (4 * i)) & 0xF) for i in range(length)]
+        for table, is_reverse in ((left, False), (right, True)):
+            new_line, _, _ = game_core.slide_and_merge_line(values, is_reverse)
+            packed = 0
+            for i, value in enumerate(new_line):
+                packed |= bitboard.value_to_exponent(value) << (4 * i)
+            table[line] = packed
+    return left, right
+
+
+class Shape:
+    """rows x cols 보드의 이동, 대칭, 새 타일 위치 계산 (줄 테이블과 전치 테이블을 가짐)"""
+
+    __slots__ = ('rows', 'cols', 'square', 'row_bits', 'row_mask', 'col_bits', 'col_mask', 'shifts',
+                 'row_left', 'row_right', 'col_left', 'col_right', 'row_max', 'to_columns', 'from_columns',
+                 'symmetry_rows', 'spawn_shifts')
+
+    def __init__(self, rows, cols):
+        if not (MIN_SIDE <= rows <= MAX_SIDE and MIN_SIDE <= cols <= MAX_SIDE):
+            raise ValueError("보드 크기는 %d~%d 사이여야 합니다: %dx%d" % (MIN_SIDE, MAX_SIDE, rows, cols))
+        self.rows = rows
+        self.cols = cols
+        self.square = rows == cols
+        self.row_bits = 4 * cols
+        self.row_mask = (1 << self.row_bits) - 1
+        self.col_bits = 4 * rows
+        self.col_mask = (1 << self.col_bits) - 1
+        self.shifts = tuple(4 * i for i in range(rows * cols))
+        self.row_left, self.row_right = _line_tables(cols)
+        self.col_left, self.col_right = _line_tables(rows) if rows != cols else (self.row_left, self.row_right)
+        self.row_max = bytes(max((row >> (4 * i)) & 0xF for i in range(cols)) for row in range(16 ** cols))
+        # 전치: 행 r (값 row)이 열 우선 배치 (칸 (c, r)이 니블 c * rows + r)에서 차지하는 비트와 그 반대
+        self.to_columns = [array('Q', (sum(((row >> (4 * c)) & 0xF) << (4 * (c * rows + r)) for c in range(cols))
+                                       for row in range(16 ** cols))) for r in range(rows)]
+        self.from_columns = [array('Q', (sum(((col >> (4 * r)) & 0xF) << (4 * (r * cols + c)) for r in range(rows))
+                                         for col in range(16 ** rows))) for c in range(cols)]
+
+        # 대칭 (칸 (r, c)가 옮겨 가는 칸): 정사각형은 회전/뒤집기 8가지, 직사각형은 좌우/위아래 뒤집기 4가지
+        last_r, last_c = rows - 1, cols - 1
+        maps = [lambda r, c: (r, c), lambda r, c: (r, last_c - c),
+                lambda r, c: (last_r - r, c), lambda r, c: (last_r - r, last_c - c)]
+        if self.square:
+            maps += [lambda r, c: (c, r), lambda r, c: (c, last_r - r),
+                     lambda r, c: (last_c - c, r), lambda r, c: (last_c - c, last_r - r)]
+        permutations = [] # 대칭마다 칸 i가 옮겨 가는 니블 위치
+        for f in maps:
+            targets = (f(i // cols, i % cols) for i in range(rows * cols))
+            permutations.append([4 * (r * cols + c) for r, c in targets])
+        # 대칭마다 행 r의 값이 옮겨 간 비트 (보드의 대칭 이미지 = 행마다 한 번씩 조회한 값의 OR)
+        self.symmetry_rows = [[array('Q', (sum(((row >> (4 * c)) & 0xF) << shifts[r * cols + c] for c in range(cols))
+                                           for row in range(16 ** cols))) for r in range(rows)]
+                              for shifts in permutations]
+        # 칸 i에 놓은 새 타일이 대칭마다 옮겨 가는 니블 위치
+        self.spawn_shifts = [tuple(shifts[i] for shifts in permutations) for i in range(rows * cols)]
+
+    def transpose(self, board):
+        """행 우선 보드를 열 우선 배치로 바꿉니다 (정사각형이면 대각선 뒤집기)."""
+        row_bits, row_mask = self.row_bits, self.row_mask
+        result = 0
+        for table in self.to_columns:
+            result |= table[board & row_mask]
+            board >>= row_bits
+        return result
+
+    def _untranspose(self, columns):
+        col_bits, col_mask = self.col_bits, self.col_mask
+        result = 0
+        for table in self.from_columns:
+            result |= table[columns & col_mask]
+            columns >>= col_bits
+        return result
+
+    def _apply(self, board, table, bits, mask, count):
+        result = 0
+        for i in range(count):
+            result |= table[(board >> (bits * i)) & mask] << (bits * i)
+        return result
+
+    def move(self, board, direction):
+        """방향으로 민 보드를 반환합니다 (바뀌지 않으면 같은 값)."""
+        if direction == 'left':
+            return self._apply(board, self.row_left, self.row_bits, self.row_mask, self.rows)
+        if direction == 'right':
+            return self._apply(board, self.row_right, self.row_bits, self.row_mask, self.rows)
+        table = self.col_left if direction == 'up' else self.col_right
+        columns = self._apply(self.transpose(board), table, self.col_bits, self.col_mask, self.cols)
+        return self._untranspose(columns)
+
+    def max_exponent(self, board):
+        row_bits, row_mask, row_max = self.row_bits, self.row_mask, self.row_max
+        best = 0
+        while board:
+            if row_max[board & row_mask] > best:
+                best = row_max[board & row_mask]
+            board >>= row_bits
+        return best
+
+    def tile_sum(self, board):
+        total = 0
+        while board:
+            if board & 0xF:
+                total += 1 << (board & 0xF)
+            board >>= 4
+        return total
+
+    def images(self, board):
+        """보드의 대칭 이미지 목록 (spawn_shifts와 같은 대칭 순서)"""
+        row_bits, row_mask = self.row_bits, self.row_mask
+        images = []
+        for tables in self.symmetry_rows:
+            image = 0
+            rest = board
+            for table in tables:
+                image |= table[rest & row_mask]
+                rest >>= row_bits
+            images.append(image)
+        return images
+
+    def canonical(self, board):
+        """회전/뒤집기로 같은 보드 중 가장 작은 값 (테이블베이스의 키)"""
+        return min(self.images(board))
+
+    def encode(self, grid):
+        """값 격자 (game.Game.values() 형식)를 보드 정수로 바꿉니다."""
+        board = 0
+        for r, row in enumerate(grid):
+            for c, value in enumerate(row):
+                board |= bitboard.value_to_exponent(value) << (4 * (r * self.cols + c))
+        return board
+
+    def initial_boards(self):
+        """처음 두 타일로 만들 수 있는 모든 보드 (대칭 제외 전)와 그 확률"""
+        cells = self.rows * self.cols
+        two = 1 - game_core.FOUR_PROBABILITY
+        boards = []
+        for first in range(cells):
+            for second in range(cells):
+                if first == second:
+                    continue
+                for e1, p1 in ((1, two), (2, game_core.FOUR_PROBABILITY)):
+                    for e2, p2 in ((1, two), (2, game_core.FOUR_PROBABILITY)):
+                        board = (e1 << (4 * first)) | (e2 << (4 * second))
+                        boards.append((board, p1 * p2 / (cells * (cells - 1))))
+        return boards
+
+
+def _spawn_children(shape, after, images=None):
+    """
+    이동 뒤 보드의 빈 칸마다 (2를 놓은 보드, 4를 놓은 보드)를 대칭 제외 키로 돌려줍니다.
+    보드의 대칭 이미지 (images, 없으면 계산)는 한 번만 만들고, 새 타일은 이미지마다 옮겨 간 자리에 OR로 얹습니다.
+    """
+    if images is None:
+        images = shape.images(after)
+    children = []
+    for shift, spawn_shifts in zip(shape.shifts, shape.spawn_shifts):
+        if not (after >> shift) & 0xF:
+            children.append((min([image | (1 << s) for image, s in zip(images, spawn_shifts)]),
+                             min([image | (2 << s) for image, s in zip(images, spawn_shifts)])))
+    return children
+
+
+def _iterate(values):
+    """numpy 배열의 원소를 ITERATE_CHUNK개씩 파이썬 정수로 바꾸며 냅니다 (층 전체를 리스트로 만들지 않음)."""
+    for start in range(0, len(values), ITERATE_CHUNK):
+        yield from values[start:start + ITERATE_CHUNK].tolist()
+
+
+def _unique(np, values):
+    """uint64 배열 (또는 array('Q'))을 정렬하고 중복을 뺀 numpy 배열"""
+    return np.unique(np.frombuffer(values, np.uint64) if isinstance(values, array) else values)
+
+
+def _compact(np, pending, limits, tile_sum):
+    """다음 층의 키 배열을 정렬 + 중복 제거하고 새 배열을 반환합니다 (남은 키가 많으면 다음 정리를 늦춤)."""
+    keys = pending[tile_sum] = array('Q', _unique(np, pending[tile_sum]).tobytes())
+    limits[tile_sum] = max(COMPACT_KEYS, 2 * len(keys))
+    return keys
+
+
+def _enumerate(shape, target, out, report):
+    """
+    도달 가능한 보드 (목표에 닿지 않은 보드)를 타일 합 순서로 나열해 층마다 정렬된 키를 out에 씁니다.
+    [(타일 합, 첫 상태 번호, 상태 수), ...]를 반환합니다.
+    다음 두 층은 키를 array('Q')에 덧붙이기만 하고, 꺼낼 때 (또는 COMPACT_KEYS를 넘을 때) 정렬 + 중복 제거합니다.
+    """
+    import numpy as np # 해석할 때만 씁니다 (게임이 테이블베이스를 열 때는 불러오지 않음)
+    pending = {}
+    limits = {} # 다음 층 키 배열을 정리할 길이 (정리한 뒤 남은 키의 두 배, 최소 COMPACT_KEYS)
+    for board, _ in shape.initial_boards():
+        pending.setdefault(shape.tile_sum(board), array('Q')).append(shape.canonical(board))
+    layers = []
+    total = 0
+    last_report = time.perf_counter()
+    while pending:
+        tile_sum = min(pending)
+        keys = _unique(np, pending.pop(tile_sum))
+        limits.pop(tile_sum, None)
+        two = pending.setdefault(tile_sum + 2, array('Q'))
+        four = pending.setdefault(tile_sum + 4, array('Q'))
+        # 이 층의 이동 뒤 보드 (대칭 제외 키)를 모아 중복을 뺀 뒤 한 번씩만 펼칩니다 (여러 보드가 같은 보드로 밀림).
+        afters = array('Q')
+        for board in _iterate(keys):
+            for direction in DIRECTIONS:
+                after = shape.move(board, direction)
+                if after != board and shape.max_exponent(after) < target:
+                    afters.append(shape.canonical(after))
+        afters = _unique(np, afters)
+        for after in _iterate(afters):
+            for child_two, child_four in _spawn_children(shape, after):
+                two.append(child_two)
+                four.append(child_four)
+            if len(two) > limits.get(tile_sum + 2, COMPACT_KEYS):
+                two = _compact(np, pending, limits, tile_sum + 2)
+            if len(four) > limits.get(tile_sum + 4, COMPACT_KEYS):
+                four = _compact(np, pending, limits, tile_sum + 4)
+        del afters
+        for key in (tile_sum + 2, tile_sum + 4):
+            if not pending[key]:
+                del pending[key]
+        out.write(keys.tobytes())
+        layers.append((tile_sum, total, len(keys)))
+        total += len(keys)
+        if time.perf_counter() - last_report >= REPORT_EVERY:
+            report("나열: 타일 합 %d까지 %d개" % (tile_sum, total))
+            last_report = time.perf_counter()
+    return layers
+
+
+class Tablebase:
+    """
+    mmap으로 연 테이블베이스입니다. value()는 보드에서 최선을 다했을 때 목표 타일에 도달할 확률,
+    best_move()는 그 확률이 가장 큰 방향입니다. 다 쓰면 close()로 닫습니다.
+    """
+
+    __slots__ = ('shape', 'target', 'four_probability', 'keys', 'values', 'layers', '_mmap')
+
+    def __init__(self, shape, target, four_probability, keys, values, layers, mapped=None):
+        self.shape = shape
+        self.target = target # 목표 타일의 지수
+        self.four_probability = four_probability
+        self.keys = keys # memoryview 'Q' (층마다 정렬)
+        self.values = values # memoryview 'f' (keys와 같은 순서)
+        self.layers = layers # {타일 합: (첫 상태 번호, 끝 번호)}
+        self._mmap = mapped
+
+    @classmethod
+    def load(cls, path, writable=False):
+        with open(path, 'r+b' if writable else 'rb') as f:
+            # 빈 파일은 mmap이 ValueError를 내므로 매핑하기 전에 길이를 확인합니다.
+            if os.fstat(f.fileno()).st_size < HEADER_SIZE:
+                raise TablebaseError("테이블베이스가 너무 짧습니다: %s" % path)
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        try:
+            magic, rows, cols, target, four_probability, count, layer_count, directory = HEADER.unpack_from(mapped)
+            if magic != MAGIC or directory + LAYER.size * layer_count != len(mapped):
+                raise TablebaseError("테이블베이스 형식이 아닙니다: %s" % path)
+            if four_probability != game_core.FOUR_PROBABILITY:
+                raise TablebaseError("4가 나올 확률이 다른 규칙으로 만든 테이블베이스입니다 (%g): %s"
+                                     % (four_probability, path))
+            layers = {}
+            for i in range(layer_count):
+                tile_sum, first, size = LAYER.unpack_from(mapped, directory + LAYER.size * i)
+                layers[tile_sum] = (first, first + size)
+        except TablebaseError:
+            mapped.close()
+            raise
+        view = memoryview(mapped)
+        keys = view[HEADER_SIZE:HEADER_SIZE + 8 * count].cast('Q')
+        values = view[HEADER_SIZE + 8 * count:HEADER_SIZE + 12 * count].cast('f')
+        view.release()
+        return cls(Shape(rows, cols), target, four_probability, keys, values, layers, mapped)
+
+    def close(self):
+        if self._mmap is not None:
+            self.keys.release()
+            self.values.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __len__(self):
+        return len(self.keys)
+
+    def fits(self, rows, cols):
+        return (self.shape.rows, self.shape.cols) == (rows, cols)
+
+    def _index(self, tile_sum, key):
+        """키의 상태 번호 (없으면 KeyError: 이 규칙으로는 도달할 수 없는 보드)"""
+        bounds = self.layers.get(tile_sum)
+        if bounds is not None:
+            i = bisect_left(self.keys, key, *bounds)
+            if i < bounds[1] and self.keys[i] == key:
+                return i
+        raise KeyError(key)
+
+    def board_value(self, board, tile_sum=None):
+        """보드 정수 (다음 수를 둘 차례)의 도달 확률. 테이블베이스에 없는 (도달할 수 없는) 보드는 None입니다."""
+        if self.shape.max_exponent(board) >= self.target:
+            return 1.0
+        if tile_sum is None:
+            tile_sum = self.shape.tile_sum(board)
+        try:
+            return self.values[self._index(tile_sum, self.shape.canonical(board))]
+        except KeyError:
+            return None
+
+    def after_value(self, after, tile_sum, images=None):
+        """이동 직후 보드 (새 타일을 놓기 전)의 도달 확률 (새 타일 위치와 값에 대한 기댓값)"""
+        if self.shape.max_exponent(after) >= self.target:
+            return 1.0
+        values, index = self.values, self._index
+        two = 1 - self.four_probability
+        children = _spawn_children(self.shape, after, images)
+        total = 0.0
+        for child_two, child_four in children:
+            total += two * values[index(tile_sum + 2, child_two)] + self.four_probability * values[index(tile_sum + 4, child_four)]
+        return total / len(children)
+
+    def move_values(self, grid):
+        """
+        값 격자에서 보드를 바꾸는 방향마다 {방향: 도달 확률}을 반환합니다.
+        도달할 수 없는 보드 (다른 규칙이나 편집한 보드)에서는 KeyError가 날 수 있습니다.
+        """
+        board = self.shape.encode(grid)
+        tile_sum = self.shape.tile_sum(board)
+        result = {}
+        for direction in DIRECTIONS:
+            after = self.shape.move(board, direction)
+            if after != board:
+                result[direction] = self.after_value(after, tile_sum)
+        return result
+
+    def value(self, grid):
+        """값 격자 (다음 수를 둘 차례)의 도달 확률 (도달할 수 없는 보드는 None)"""
+        return self.board_value(self.shape.encode(grid))
+
+    def best_move(self, grid):
+        """도달 확률이 가장 큰 방향 (움직일 수 없거나 테이블베이스에 없는 보드이면 None)"""
+        try:
+            scores = self.move_values(grid)
+        except KeyError:
+            return None
+        return max(scores, key=scores.get) if scores else None
+
+    def initial_value(self):
+        """처음 두 타일이 놓인 직후 (첫 수를 두기 전)의 도달 확률"""
+        return sum(p * self.board_value(board) for board, p in self.shape.initial_boards())
+
+
+def _solve_values(tablebase, report):
+    """
+    가장 큰 타일 합의 층부터 각 보드의 값 (방향별 after_value()의 최댓값, 움직일 수 없으면 0)을 채웁니다.
+    층마다 (보드 번호, 이동 뒤 키) 쌍을 배열로 모아 이동 뒤 보드의 값을 중복 없이 한 번씩만 계산합니다.
+    """
+    import numpy as np
+    shape, keys, values = tablebase.shape, tablebase.keys, tablebase.values
+    last_report = time.perf_counter()
+    for tile_sum in sorted(tablebase.layers, reverse=True):
+        first, end = tablebase.layers[tile_sum]
+        owners = array('I') # 층 안의 보드 번호 (한 층은 2^32개보다 훨씬 작음)
+        afters = array('Q') # 그 보드를 한 방향으로 민 보드의 대칭 제외 키
+        for i in range(first, end):
+            board = keys[i]
+            for direction in DIRECTIONS:
+                after = shape.move(board, direction)
+                if after != board:
+                    owners.append(i - first)
+                    afters.append(shape.canonical(after))
+        owners = np.frombuffer(owners, np.uint32)
+        afters = np.frombuffer(afters, np.uint64)
+        unique = np.unique(afters)
+        after_values = np.fromiter((tablebase.after_value(after, tile_sum) for after in _iterate(unique)),
+                                   np.float64, len(unique))
+        best = np.zeros(end - first)
+        # 쌍마다 값을 찾는 임시 배열이 층 전체 크기가 되지 않도록 ITERATE_CHUNK개씩 이진 탐색합니다.
+        for start in range(0, len(afters), ITERATE_CHUNK):
+            chunk = slice(start, start + ITERATE_CHUNK)
+            np.maximum.at(best, owners[chunk], after_values[np.searchsorted(unique, afters[chunk])])
+        del owners, afters, unique
+        values[first:end] = array('f', best.astype(np.float32).tobytes())
+        if time.perf_counter() - last_report >= REPORT_EVERY:
+            report("해석: 타일 합 %d까지 (남은 상태 %d개)" % (tile_sum, first))
+            last_report = time.perf_counter()
+
+
+def solve(rows, cols, target_value, path, report=print):
+    """
+    rows x cols 보드에서 target_value 타일에 도달할 확률을 모든 도달 가능한 보드에 대해 계산해 path에 저장하고,
+    저장한 테이블베이스를 열어 반환합니다. 임시 파일에 쓴 뒤 바꿔 끼우므로 중간에 멈춰도 이전 파일이 남습니다.
+    """
+    target = bitboard.value_to_exponent(target_value)
+    if 1 << target != target_value or not MIN_TARGET_EXPONENT <= target <= MAX_TARGET_EXPONENT:
+        raise ValueError("목표 타일은 %d~%d 사이의 2의 거듭제곱이어야 합니다: %r"
+                         % (1 << MIN_TARGET_EXPONENT, 1 << MAX_TARGET_EXPONENT, target_value))
+    shape = Shape(rows, cols)
+    temporary = path + '.tmp'
+    started = time.perf_counter()
+    with open(temporary, 'w+b') as f:
+        f.write(bytes(HEADER_SIZE))
+        layers = _enumerate(shape, target, f, report)
+        count = sum(size for _, _, size in layers)
+        f.write(bytes(4 * count)) # 값 영역 (해석하며 채움)
+        f.write(bytes(-f.tell() % 8))
+        directory = f.tell()
+        for layer in layers:
+            f.write(LAYER.pack(*layer))
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, rows, cols, target, game_core.FOUR_PROBABILITY, count, len(layers), directory))
+    report("%dx%d, 목표 %d: 상태 %d개, 층 %d개 나열 (%.1f초)"
+           % (rows, cols, target_value, count, len(layers), time.perf_counter() - started))
+
+    tablebase = Tablebase.load(temporary, writable=True)
+    try:
+        _solve_values(tablebase, report)
+        tablebase._mmap.flush()
+    finally:
+        tablebase.close()
+    os.replace(temporary, path)
+    report("해석 완료 (%.1f초): %s" % (time.perf_counter() - started, path))
+    return Tablebase.load(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="작은 보드의 완전 해석과 테이블베이스")
+    commands = parser.add_subparsers(dest='command', required=True)
+    solve_parser = commands.add_parser('solve', help="도달 가능한 보드를 나열하고 해석해 테이블베이스를 만듭니다")
+    solve_parser.add_argument('--rows', type=int, default=3)
+    solve_parser.add_argument('--cols', type=int, default=3)
+    solve_parser.add_argument('--target', type=int, default=256, help="목표 타일 값")
+    solve_parser.add_argument('--out', required=True, metavar='PATH', help="테이블베이스 경로")
+    info_parser = commands.add_parser('info', help="테이블베이스의 크기와 처음 보드의 도달 확률을 출력합니다")
+    info_parser.add_argument('path')
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'solve':
+            tablebase = solve(args.rows, args.cols, args.target, args.out)
+        else:
+            tablebase = Tablebase.load(args.path)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    shape = tablebase.shape
+    print("%dx%d, 목표 %d: 상태 %d개, 층 %d개, 파일 %.1f MB"
+          % (shape.rows, shape.cols, 1 << tablebase.target, len(tablebase), len(tablebase.layers),
+             len(tablebase._mmap) / 1e6))
+    print("최선을 다했을 때 목표 도달 확률: %.6f" % tablebase.initial_value())
+    tablebase.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
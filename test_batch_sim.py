@@ -0,0 +1,72 @@
+"""batch_sim의 배열 이동/새 타일/게임 오버 판정이 bitboard 엔진과 같은지 확인합니다."""
+
+import random
+
+import numpy as np
+
+import batch_sim
+import bitboard
+
+
+def random_boards(count, seed, high=15):
+    rng = random.Random(seed)
+    boards = []
+    for _ in range(count):
+        board = 0
+        for i in range(16):
+            if rng.random() < 0.6:
+                board |= rng.randint(1, high) << (4 * i)
+        boards.append(board)
+    return boards
+
+
+def test_move_batch_matches_execute_move():
+    boards = random_boards(2000, 1, high=6) # 작은 지수로 합쳐지는 쌍이 많게
+    codes = np.random.default_rng(1).integers(0, 4, len(boards)).astype(np.int8)
+    moved, scores = batch_sim.move_batch(np.array(boards, np.uint64), codes)
+    for board, code, new_board, score in zip(boards, codes, moved.tolist(), scores.tolist()):
+        assert (new_board, score) == bitboard.execute_move(board, bitboard.DIRECTIONS[code]), (hex(board), code)
+
+
+def test_spawn_batch_adds_one_tile_on_empty_cell():
+    boards = np.array(random_boards(2000, 2) + [0xFFFF_FFFF_FFFF_FFFF], np.uint64)
+    mask = np.arange(len(boards)) % 3 != 0
+    spawned = batch_sim.spawn_batch(boards, np.random.default_rng(2), mask)
+    for board, after, selected in zip(boards.tolist(), spawned.tolist(), mask):
+        if not selected or not bitboard.count_empty(board):
+            assert after == board
+            continue
+        added = after ^ board
+        assert added & board == 0 # 빈 칸에만 놓임
+        cells = [i for i in range(16) if (added >> (4 * i)) & 0xF]
+        assert len(cells) == 1 and (added >> (4 * cells[0])) & 0xF in (1, 2)
+
+
+def test_game_over_mask_matches_can_move():
+    rng = random.Random(7)
+    full = [sum(rng.randint(1, 15) << (4 * i) for i in range(16)) for _ in range(2000)] # 빈 칸 없는 보드
+    boards = full + random_boards(500, 7)
+    over = batch_sim.game_over_mask(np.array(boards, np.uint64))
+    assert [not bitboard.can_move(board) for board in boards] == over.tolist()
+    assert over.any()
+
+
+def test_max_exponent_pair_is_game_over():
+    # 32768 두 개는 bitboard 행 테이블처럼 합칠 수 없는 쌍입니다.
+    full = 0
+    for i in range(16):
+        exponent = bitboard.MAX_EXPONENT if i < 2 else 1 + (i % 2) + 2 * (i // 4)
+        full |= exponent << (4 * i)
+    assert not bitboard.can_move(full)
+    assert batch_sim.game_over_mask(np.array([full], np.uint64))[0]
+
+
+def test_simulator_step_counts_only_changed_boards():
+    sim = batch_sim.BatchSimulator(500, seed=3)
+    before = sim.boards.copy()
+    codes = np.zeros(len(sim), np.int8)
+    changed = sim.step(codes)
+    expected = [bitboard.execute_move(board, 'left')[0] != board for board in before.tolist()]
+    assert changed.tolist() == expected
+    assert sim.move_counts.tolist() == [int(c) for c in expected]
+    assert (batch_sim.empty_counts(sim.boards)[changed] <= batch_sim.empty_counts(before)[changed]).all()
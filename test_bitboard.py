@@ -0,0 +1,66 @@
+"""bitboard 행 테이블 이동이 game_core.slide_and_merge_line (줄 단위 규칙)과 같은지 확인합니다."""
+
+import random
+
+import bitboard
+import game_core
+
+
+def _lines(direction):
+    """방향별 줄의 칸 목록 ((row, col) 튜플)"""
+    if direction in ('left', 'right'):
+        return [[(r, c) for c in range(4)] for r in range(4)]
+    return [[(r, c) for r in range(4)] for c in range(4)]
+
+
+def reference_move(grid, direction):
+    """slide_and_merge_line으로 한 줄씩 밀어 (새 값 격자, 얻은 점수)를 반환합니다."""
+    result = [row[:] for row in grid]
+    total = 0
+    for cells in _lines(direction):
+        line, score, _ = game_core.slide_and_merge_line([grid[r][c] for r, c in cells], direction in ('right', 'down'))
+        for (r, c), value in zip(cells, line):
+            result[r][c] = value
+        total += score
+    return result, total
+
+
+def random_board(rng, max_exponent=14):
+    """빈 칸이 섞인 무작위 보드 (같은 값이 이웃하도록 작은 지수 범위에서 고름)"""
+    low = rng.randrange(0, max_exponent - 3)
+    board = 0
+    for i in range(16):
+        if rng.random() < 0.7:
+            board |= rng.randint(low + 1, low + 4) << (4 * i)
+    return board
+
+
+def test_moves_match_line_rule():
+    rng = random.Random(2048)
+    for _ in range(3000):
+        board = random_board(rng)
+        grid = bitboard.to_values(board)
+        legal = []
+        for direction in bitboard.DIRECTIONS:
+            moved, score = bitboard.execute_move(board, direction)
+            expected_grid, expected_score = reference_move(grid, direction)
+            assert bitboard.to_values(moved) == expected_grid, (hex(board), direction)
+            assert score == expected_score, (hex(board), direction)
+            if expected_grid != grid:
+                legal.append(direction)
+        assert bitboard.legal_directions(board) == tuple(legal)
+
+
+def test_max_exponent_tiles_do_not_merge():
+    # 32768 두 개는 니블을 넘치므로 합치지 않습니다 (규칙의 상한).
+    row = (bitboard.MAX_EXPONENT << 4) | bitboard.MAX_EXPONENT
+    assert bitboard.execute_move(row, 'left') == (row, 0)
+    column = bitboard.MAX_EXPONENT | (bitboard.MAX_EXPONENT << 16)
+    assert bitboard.execute_move(column, 'up') == (column, 0)
+
+
+def test_values_round_trip():
+    rng = random.Random(3)
+    for _ in range(200):
+        board = random_board(rng)
+        assert bitboard.from_values(bitboard.to_values(board)) == board
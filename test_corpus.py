@@ -0,0 +1,101 @@
+"""말뭉치의 커밋/다시 열기 (커밋되지 않은 꼬리 잘라 내기)와 쓰는 쪽 잠금을 확인합니다."""
+
+import os
+
+import numpy as np
+import pytest
+
+import corpus
+import game
+import game_core
+import replay
+
+
+def write_games(writer, count, moves=5):
+    """게임 count개에 가짜 수를 moves개씩 덧붙이고 게임 번호 목록을 반환합니다."""
+    games = []
+    for g in range(count):
+        game_id = writer.begin_game(1000 + g, corpus.SOURCE_BOT)
+        for m in range(moves):
+            writer.append_move(game_id, (m + 1) << (4 * g), m % 4, (g << 4) | 1, 4 * m)
+        games.append(game_id)
+    return games
+
+
+def test_reopen_truncates_uncommitted_tail(tmp_path):
+    path = str(tmp_path / 'c')
+    with corpus.CorpusWriter(path, chunk_rows=4) as writer:
+        write_games(writer, 2)
+    # 덧붙이다 멈춘 상황: 열 파일에 커밋되지 않은 행 조각이 남음 (index.bin은 바뀌지 않음)
+    for name in ('board.col', 'game.col', 'games.seed.col'):
+        with open(os.path.join(path, name), 'ab') as f:
+            f.write(b'\xff' * 5)
+
+    reader = corpus.Corpus(path)
+    assert (len(reader), reader.games) == (10, 2)
+
+    with corpus.CorpusWriter(path) as writer:
+        assert os.path.getsize(os.path.join(path, 'board.col')) == 10 * 8
+        assert os.path.getsize(os.path.join(path, 'games.seed.col')) == 2 * 8
+        assert write_games(writer, 1) == [2] # 커밋된 게임 다음 번호부터
+    reader = corpus.Corpus(path)
+    assert (len(reader), reader.games) == (15, 3)
+    assert reader.game_column('seed').tolist() == [1000, 1001, 1000]
+    assert reader.column('game').tolist() == [0] * 5 + [1] * 5 + [2] * 5
+    assert reader.column('max_exponent').tolist() == [1, 2, 3, 4, 5] * 3
+    # 청크 4행마다 존 맵 한 칸 (마지막 청크는 일부만 참)
+    assert len(reader.zones) == 4
+    assert reader.zones[0]['max_low'] == 1 and reader.zones[0]['max_high'] == 4
+
+
+def test_unflushed_rows_are_not_visible(tmp_path):
+    path = str(tmp_path / 'c')
+    with corpus.CorpusWriter(path, flush_rows=1000) as writer:
+        write_games(writer, 1)
+        writer.flush()
+        write_games(writer, 1)
+        assert len(corpus.Corpus(path)) == 5 # 읽는 쪽은 마지막 커밋까지만 봅니다
+    assert len(corpus.Corpus(path)) == 10
+
+
+def test_second_writer_is_refused(tmp_path):
+    path = str(tmp_path / 'c')
+    with corpus.CorpusWriter(path) as writer:
+        write_games(writer, 1)
+        with pytest.raises(corpus.CorpusError):
+            corpus.CorpusWriter(path)
+    # 닫으면 잠금이 풀려 다시 열 수 있습니다.
+    corpus.CorpusWriter(path).close()
+    assert len(corpus.Corpus(path)) == 5
+
+
+def test_replay_rows_reproduce_boards(record_game, tmp_path):
+    path = str(tmp_path / 'c')
+    recording, _ = record_game(4242)
+    with corpus.CorpusWriter(path) as writer:
+        assert writer.add_replay(recording) == len(recording)
+    reader = corpus.Corpus(path)
+    board, rng = replay.new_game(int(reader.game_column('seed')[0]))
+    for i, (bits, code) in enumerate(zip(reader.column('board'), reader.column('direction')), 1):
+        assert board.bits == int(bits)
+        board.move(game_core.DIRECTIONS[code])
+        rng.spawn(board, i + 1)
+    assert int(np.asarray(reader.column('gained'), np.int64).sum()) == recording.score
+
+
+def test_move_buffer_recorder_and_extend_sources(tmp_path):
+    path = str(tmp_path / 'c')
+    with corpus.CorpusWriter(path) as writer:
+        for source in (corpus.SOURCE_HUMAN, corpus.SOURCE_BOT):
+            game_ = game.Game(game_core.BOARD_SIZE, 31)
+            buffer = corpus.MoveBuffer()
+            game_.recorder = buffer.recorder(game_)
+            for direction in ('left', 'up', 'right', 'down'):
+                game_.move(direction)
+            writer.extend(buffer, source)
+    reader = corpus.Corpus(path)
+    assert reader.game_column('source').tolist() == [corpus.SOURCE_HUMAN, corpus.SOURCE_BOT]
+    assert reader.game_column('seed').tolist() == [31, 31]
+    games = reader.column('game').tolist()
+    assert games == sorted(games) and set(games) == {0, 1}
+    assert games.count(0) == games.count(1)
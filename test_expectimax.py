@@ -0,0 +1,43 @@
+"""expectimax의 전치 테이블이 새로 탐색한 값과 같은 값을 돌려주는지 확인합니다."""
+
+import pytest
+
+import expectimax
+import game
+
+
+def game_boards(seed, moves):
+    """깊이 1 탐색으로 진행한 게임의 보드 목록"""
+    g = game.Game(4, seed)
+    boards = []
+    for _ in range(moves):
+        boards.append(g.board.bits)
+        direction = expectimax.best_move(g.board.bits, max_depth=1, time_budget=1.0)
+        if direction is None or g.move(direction) is None:
+            break
+    return boards
+
+
+@pytest.mark.parametrize('depth', [2, 3])
+def test_warm_table_matches_fresh_search(depth):
+    shared = expectimax.TranspositionTable()
+    small = expectimax.TranspositionTable(max_entries=64) # 자주 내보내도 값은 같아야 함
+    for board in game_boards(8, 40):
+        fresh = expectimax.score_moves(board, depth, expectimax.TranspositionTable())
+        assert expectimax.score_moves(board, depth, shared) == fresh
+        assert expectimax.score_moves(board, depth, shared) == fresh # 루트 자식이 모두 적중
+        assert expectimax.score_moves(board, depth, small) == fresh
+        assert len(small) <= 64
+    assert shared.hits > 0
+
+
+def test_table_returns_only_deep_enough_entries():
+    table = expectimax.TranspositionTable(max_entries=2)
+    table.put(1, 3, 10.0)
+    assert table.get(1, 3) == 10.0 and table.get(1, 2) == 10.0
+    assert table.get(1, 4) is None
+    table.put(2, 1, 20.0)
+    table.get(1, 1) # 1을 최근에 쓴 항목으로
+    table.put(3, 1, 30.0) # 가장 오래 쓰지 않은 2가 빠짐
+    assert table.get(2, 1) is None and table.get(1, 1) == 10.0 and len(table) == 2
+
@@ -0,0 +1,76 @@
+"""Game의 되돌리기/다시 하기가 같은 보드, 점수, 새 타일, 난수 상태를 재현하는지 확인합니다."""
+
+import pytest
+
+import game
+import game_core
+
+
+def play(game_, moves):
+    """왼쪽 > 아래 > 오른쪽 > 위 순서로 둘 수 있는 첫 방향을 moves번 두고 수마다 나온 새 타일 목록을 반환합니다."""
+    spawns = []
+    for _ in range(moves):
+        for direction in ('left', 'down', 'right', 'up'):
+            if game_.move(direction) is not None:
+                spawns.append(game_.last_spawn)
+                break
+        else:
+            break
+    return spawns
+
+
+def state(game_):
+    return (game_.board.snapshot(), game_.score, game_.spawn_rng.state, list(game_.replay.moves),
+            game_.status, game_.legal_moves())
+
+
+@pytest.mark.parametrize('size', [4, 5])
+def test_undo_n_redo_n_restores_identical_state(size):
+    g = game.Game(size, 2024)
+    spawns = play(g, 60)
+    before = state(g)
+    for _ in range(25):
+        assert g.undo()
+    assert g.move_count == len(before[3]) - 25
+    redone = []
+    for _ in range(25):
+        assert g.redo() is not None
+        redone.append(g.last_spawn)
+    assert state(g) == before
+    assert redone == spawns[-25:] # 다시 하면 같은 새 타일이 같은 자리에 나옵니다
+    assert g.redo() is None
+
+
+def test_undo_all_then_replay_matches_fresh_game():
+    g = game.Game(game_core.BOARD_SIZE, 77)
+    start = g.board.snapshot()
+    play(g, 30)
+    while g.undo():
+        pass
+    assert g.board.snapshot() == start and g.score == 0 and g.move_count == 0
+    fresh = game.Game(game_core.BOARD_SIZE, 77)
+    play(fresh, 30)
+    while g.redo() is not None:
+        pass
+    assert state(g) == state(fresh)
+
+
+def test_new_move_after_undo_truncates_redo_branch():
+    g = game.Game(game_core.BOARD_SIZE, 5)
+    play(g, 10)
+    g.undo()
+    g.undo()
+    redo = g.redo_direction()
+    other = next(d for d in g.legal_moves() if d != redo)
+    g.move(other)
+    assert g.redo_direction() is None and g.redo() is None
+    assert g.move_count == 9 and g.replay.moves[-1] == game_core.DIRECTIONS.index(other)
+
+
+def test_games_do_not_share_state():
+    a = game.Game(game_core.BOARD_SIZE, 1)
+    b = game.Game(game_core.BOARD_SIZE, 1)
+    play(a, 20)
+    assert b.move_count == 0 and b.board.snapshot() != a.board.snapshot()
+    play(b, 20)
+    assert state(a) == state(b)
@@ -0,0 +1,137 @@
+"""GridBoard의 칸별 통계와 BitBoard/GridBoard의 이동 가능 방향 판정을 전수 계산과 비교합니다."""
+
+import random
+
+import pytest
+
+import bitboard
+import game_core
+
+
+def recount(board):
+    """board.cells만 보고 빈 칸/이웃 쌍/최대 타일 통계를 처음부터 다시 셉니다."""
+    size = board.size
+    cells = board.cells
+    pair_counts = [0, 0]
+    slide_counts = [0, 0, 0, 0]
+    for axis, step in ((0, 1), (1, size)):
+        for first in range(size * size):
+            if (axis == 0 and first % size == size - 1) or (axis == 1 and first >= size * (size - 1)):
+                continue
+            a, b = cells[first], cells[first + step]
+            if a and a == b:
+                pair_counts[axis] += 1
+            elif a and not b:
+                slide_counts[2 * axis + 1] += 1
+            elif b and not a:
+                slide_counts[2 * axis] += 1
+    empty = [i for i, value in enumerate(cells) if not value]
+    return empty, pair_counts, slide_counts, max(cells)
+
+
+def assert_counters(board):
+    assert (board.empty, board.pair_counts, board.slide_counts, board.max_tile) == recount(board)
+
+
+@pytest.mark.parametrize('size', [3, 5, 16])
+def test_counters_match_full_recount(size):
+    rng = random.Random(size)
+    board = game_core.GridBoard(size)
+    assert_counters(board)
+    snapshots = []
+    for step in range(40 * size):
+        if board.add_random_tile(rng) is None:
+            break
+        assert_counters(board)
+        board.move(rng.choice(game_core.DIRECTIONS))
+        assert_counters(board)
+        if step % 7 == 0:
+            snapshots.append(board.snapshot())
+        elif step % 11 == 0 and snapshots:
+            board.restore(rng.choice(snapshots))
+            assert_counters(board)
+
+
+@pytest.mark.parametrize('size', [3, 5, 16])
+def test_move_matches_line_rule(size):
+    # 줄마다 slide_and_merge_line을 적용한 결과와 같아야 합니다.
+    rng = random.Random(100 + size)
+    board = game_core.GridBoard(size)
+    for _ in range(size * size // 2):
+        board.add_random_tile(rng)
+    for direction in game_core.DIRECTIONS * 3:
+        before = list(board.cells)
+        expected = list(before)
+        expected_score = 0
+        for line in board.lines[direction]:
+            new_line, score, _ = game_core.slide_and_merge_line([before[i] for i in line], direction in ('right', 'down'))
+            expected_score += score
+            for i, value in zip(line, new_line):
+                expected[i] = value
+        gained = board.move(direction)
+        assert board.cells == expected
+        assert gained == (expected_score if expected != before else None)
+        board.add_random_tile(rng)
+
+
+def random_bits(rng, fill, high):
+    bits = 0
+    for i in range(16):
+        if rng.random() < fill:
+            bits |= rng.randint(1, high) << (4 * i)
+    return bits
+
+
+def test_legal_mask_matches_trying_each_direction():
+    rng = random.Random(11)
+    # 빈 칸이 있는 보드, 꽉 찼지만 합칠 수 있는 보드, 32768 쌍이 섞인 보드
+    boards = ([random_bits(rng, 0.5, 6) for _ in range(1000)]
+              + [random_bits(rng, 1.0, 4) for _ in range(1000)]
+              + [random_bits(rng, 0.9, 1) | 0xFF for _ in range(200)]
+              + [random_bits(rng, 1.0, 15) for _ in range(500)])
+    for bits in boards:
+        expected = tuple(d for d in game_core.DIRECTIONS if bitboard.execute_move(bits, d)[0] != bits)
+        assert game_core.legal_moves(bits) == expected, hex(bits)
+        board = game_core.BitBoard(bits)
+        assert board.legal_moves() == expected
+        assert board.can_move() == bool(expected)
+        for d in game_core.DIRECTIONS:
+            assert board.is_legal(d) == (d in expected)
+
+
+def test_max_exponent_pair_is_not_a_legal_merge():
+    # 32768 두 개 (지수 15)가 나란히 있어도 꽉 찬 보드는 더 움직일 수 없습니다.
+    bits = bitboard.MAX_EXPONENT | bitboard.MAX_EXPONENT << 4
+    for i in range(2, 16):
+        bits |= (1 + (i % 2) + 2 * (i // 4)) << (4 * i)
+    board = game_core.BitBoard(bits)
+    assert board.legal_moves() == () and not board.can_move()
+    assert board.status() == game_core.check_game_status(bits) == 'win' # 2048 이상은 승리가 먼저입니다
+
+
+def test_full_but_mergeable_board_is_not_lost():
+    grid = [[2, 4, 2, 4], [4, 2, 4, 2], [2, 4, 2, 4], [8, 8, 16, 2]] # 합칠 수 있는 쌍은 8, 8 하나
+    board = game_core.BitBoard(bitboard.from_values(grid))
+    assert board.empty_count() == 0
+    assert board.legal_moves() == ('left', 'right') and board.status() is None
+    grid[3][1] = 32
+    board.restore(bitboard.from_values(grid))
+    assert board.status() == 'lose'
+
+
+@pytest.mark.parametrize('size', [3, 5, 16])
+def test_grid_legal_moves_match_trying_each_direction(size):
+    rng = random.Random(200 + size)
+    for fill in (0.3, 0.8, 1.0):
+        for _ in range(100):
+            board = game_core.GridBoard(size)
+            snapshot = bytes(rng.randint(1, 3) if rng.random() < fill else 0 for _ in range(size * size))
+            board.restore(snapshot)
+            expected = []
+            for d in game_core.DIRECTIONS:
+                if board.move(d) is not None:
+                    expected.append(d)
+                    board.restore(snapshot)
+            assert board.legal_moves() == tuple(expected)
+            assert board.can_move() == bool(expected)
+            assert (board.status() == 'lose') == (not expected)
@@ -0,0 +1,234 @@
+"""game_server를 같은 프로세스의 클라이언트로 확인합니다 (잘못된 HTTP/WebSocket 입력, 세션 정리, 삭제와 이동의 경쟁)."""
+
+import asyncio
+import json
+import struct
+
+import pytest
+
+import game_server
+
+MASK = b'\x01\x02\x03\x04'
+
+
+def run(test):
+    """test(server, host, port) 코루틴을 임의 포트의 서버와 함께 실행합니다."""
+    async def main():
+        server = game_server.GameServer()
+        host, port = await server.start('127.0.0.1', 0)
+        try:
+            await test(server, host, port)
+        finally:
+            await server.close()
+    asyncio.run(main())
+
+
+async def read_response(reader):
+    head = (await reader.readuntil(b'\r\n\r\n')).decode('latin-1').split('\r\n')
+    status = int(head[0].split(' ')[1])
+    headers = dict(line.lower().split(': ', 1) for line in head[1:] if line)
+    body = await reader.readexactly(int(headers['content-length']))
+    if headers['content-type'] == 'application/json':
+        body = json.loads(body) if body else None
+    return status, body
+
+
+async def request(reader, writer, method, path, body=b''):
+    if isinstance(body, dict):
+        body = json.dumps(body).encode()
+    writer.write(b'%s %s HTTP/1.1\r\nHost: x\r\nContent-Length: %d\r\n\r\n%s'
+                 % (method.encode(), path.encode(), len(body), body))
+    return await read_response(reader)
+
+
+async def raw(host, port, data):
+    """data를 그대로 보내고 서버가 연결을 닫을 때까지 받은 바이트를 반환합니다."""
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(data)
+    received = await reader.read()
+    writer.close()
+    return received
+
+
+def test_http_game_flow():
+    async def test(server, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        status, created = await request(reader, writer, 'POST', '/api/games', {'size': 4})
+        assert status == 201 and created['moves'] == 0 and 'seed' not in created
+        path = '/api/games/%s' % created['id']
+        direction = created['legal'][0]
+        status, moved = await request(reader, writer, 'POST', path + '/move', {'direction': direction})
+        assert status == 200 and moved['moved'] and moved['moves'] == 1 and moved['diff']
+        status, state = await request(reader, writer, 'GET', path)
+        assert status == 200 and state['score'] == moved['score']
+        assert (await request(reader, writer, 'GET', path + '/replay'))[0] == 409 # 끝나지 않은 게임
+        assert (await request(reader, writer, 'DELETE', path))[0] == 204
+        assert (await request(reader, writer, 'GET', path))[0] == 404
+        assert (await request(reader, writer, 'GET', '/api/stats'))[1]['moves'] == 1
+        writer.close()
+    run(test)
+
+
+@pytest.mark.parametrize('size', [1, 17, '4', 4.0, True, None])
+def test_invalid_size_is_rejected(size):
+    async def test(server, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        status, body = await request(reader, writer, 'POST', '/api/games', {'size': size})
+        assert status == 400 and 'error' in body
+        assert len(server.store) == 0
+        writer.close()
+    run(test)
+
+
+def test_invalid_direction_and_body_keep_connection():
+    async def test(server, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        _, created = await request(reader, writer, 'POST', '/api/games', {})
+        path = '/api/games/%s/move' % created['id']
+        for body in ({'direction': 'sideways'}, {'direction': 0}, {}):
+            assert (await request(reader, writer, 'POST', path, body))[0] == 400
+        assert (await request(reader, writer, 'POST', path, b'{not json'))[0] == 400
+        assert (await request(reader, writer, 'POST', path, b'[1, 2]'))[0] == 400
+        assert (await request(reader, writer, 'PUT', path, {'direction': 'left'}))[0] == 405
+        assert (await request(reader, writer, 'GET', '/api/games/a/b/c'))[0] == 404
+        # 오류 응답 뒤에도 같은 연결로 계속 요청할 수 있습니다.
+        status, state = await request(reader, writer, 'GET', '/api/games/%s' % created['id'])
+        assert status == 200 and state['moves'] == 0
+        writer.close()
+    run(test)
+
+
+@pytest.mark.parametrize('data', [
+    b'GARBAGE\r\n\r\n',
+    b'POST /api/games HTTP/1.1\r\nContent-Length: abc\r\n\r\n',
+    b'POST /api/games HTTP/1.1\r\nContent-Length: %d\r\n\r\n' % (game_server.MAX_BODY + 1),
+    b'GET /ws HTTP/1.1\r\nUpgrade: websocket\r\n\r\n', # Sec-WebSocket-Key 없음
+])
+def test_malformed_http_gets_400_and_close(data):
+    async def test(server, host, port):
+        received = await raw(host, port, data)
+        assert received.startswith(b'HTTP/1.1 400 ') and b'Connection: close' in received
+        assert not server.connections
+    run(test)
+
+
+async def open_ws(host, port):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(b'GET /ws HTTP/1.1\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n'
+                 b'Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n\r\n')
+    head = await reader.readuntil(b'\r\n\r\n')
+    assert head.startswith(b'HTTP/1.1 101 ')
+    assert b's3pPLMBiTxaQ9kYGzzhZRbK+xOo=' in head # RFC 6455 예시의 응답 키
+    return reader, writer
+
+
+async def ws_call(reader, writer, message):
+    writer.write(game_server.ws_frame(game_server.WS_TEXT, json.dumps(message).encode(), MASK))
+    opcode, payload = await game_server.read_ws_frame(reader, require_mask=False)
+    assert opcode == game_server.WS_TEXT
+    return json.loads(payload)
+
+
+def test_websocket_messages():
+    async def test(server, host, port):
+        reader, writer = await open_ws(host, port)
+        created = await ws_call(reader, writer, {'op': 'new', 'size': 5, 'seq': 1})
+        assert created['status_code'] == 201 and created['seq'] == 1 and created['size'] == 5
+        moved = await ws_call(reader, writer, {'op': 'move', 'id': created['id'], 'direction': created['legal'][0]})
+        assert moved['status_code'] == 200 and moved['moves'] == 1
+        invalid = await ws_call(reader, writer, {'op': 'move', 'id': created['id'], 'direction': 'x', 'seq': 2})
+        assert (invalid['status_code'], invalid['seq']) == (400, 2) and 'error' in invalid
+        assert (await ws_call(reader, writer, {'op': 'jump'}))['status_code'] == 400
+        assert (await ws_call(reader, writer, {'op': 'new', 'size': 99}))['status_code'] == 400
+        assert (await ws_call(reader, writer, {'op': 'state', 'id': 'missing'}))['status_code'] == 404
+        writer.write(game_server.ws_frame(game_server.WS_TEXT, b'not json', MASK))
+        opcode, payload = await game_server.read_ws_frame(reader, require_mask=False)
+        assert json.loads(payload)['status_code'] == 400
+        writer.write(game_server.ws_frame(game_server.WS_PING, b'hi', MASK))
+        assert await game_server.read_ws_frame(reader, require_mask=False) == (game_server.WS_PONG, b'hi')
+        writer.write(game_server.ws_frame(game_server.WS_CLOSE, struct.pack('!H', 1000), MASK))
+        assert await game_server.read_ws_frame(reader, require_mask=False) \
+            == (game_server.WS_CLOSE, struct.pack('!H', 1000))
+        assert await reader.read() == b''
+        writer.close()
+    run(test)
+
+
+@pytest.mark.parametrize('frame', [
+    game_server.ws_frame(game_server.WS_TEXT, b'{"op": "stats"}'), # 마스킹되지 않음
+    bytes([game_server.WS_TEXT, 0x80 | 2]) + MASK + b'{}', # FIN 없는 조각
+    struct.pack('!BBH', 0x80 | game_server.WS_TEXT, 0x80 | 126, game_server.MAX_BODY + 1) + MASK, # 너무 긺
+])
+def test_malformed_websocket_frame_closes_with_1002(frame):
+    async def test(server, host, port):
+        reader, writer = await open_ws(host, port)
+        writer.write(frame)
+        assert await game_server.read_ws_frame(reader, require_mask=False) \
+            == (game_server.WS_CLOSE, struct.pack('!H', 1002))
+        assert await reader.read() == b''
+        writer.close()
+    run(test)
+
+
+def test_evict_idle_removes_only_old_unlocked_sessions():
+    now = [0.0]
+    store = game_server.SessionStore(idle_timeout=10, clock=lambda: now[0])
+    sessions = []
+    for t in range(5):
+        now[0] = float(t)
+        sessions.append(store.create(4))
+    now[0] = 11.5 # 0, 1초에 만든 세션이 유휴
+    assert store.evict_idle() == 2
+    assert list(store.sessions) == [s.id for s in sessions[2:]]
+
+    store.get(sessions[2].id) # 사용하면 맨 뒤로 감
+    now[0] = 30.0
+
+    async def hold_lock():
+        async with sessions[3].lock:
+            assert store.evict_idle() == 2 # 요청 처리 중인 세션은 남김
+    asyncio.run(hold_lock())
+    assert list(store.sessions) == [sessions[3].id] and store.evicted == 4
+    with pytest.raises(game_server.RequestError) as e:
+        store.get(sessions[0].id)
+    assert e.value.status == 404
+
+
+def test_max_sessions_returns_503():
+    store = game_server.SessionStore(max_sessions=2)
+    store.create(4)
+    store.create(3)
+    with pytest.raises(game_server.RequestError) as e:
+        store.create(4)
+    assert e.value.status == 503
+
+
+def test_delete_while_move_waits_for_lock():
+    async def main():
+        store = game_server.SessionStore()
+        service = game_server.GameService(store)
+        session = store.create(4)
+        path = '/api/games/%s' % session.id
+        responses = []
+
+        def responder(name):
+            async def respond(status, payload):
+                responses.append((name, status))
+            return respond
+
+        async def call(name, method, target, body):
+            try:
+                await service.handle(method, target, body, responder(name))
+            except game_server.RequestError as e:
+                responses.append((name, e.status))
+
+        async with session.lock: # 두 요청 모두 세션을 찾은 뒤 잠금을 기다림
+            delete = asyncio.ensure_future(call('delete', 'DELETE', path, {}))
+            move = asyncio.ensure_future(call('move', 'POST', path + '/move', {'direction': 'left'}))
+            await asyncio.sleep(0)
+            assert not responses
+        await asyncio.gather(delete, move)
+        # 삭제가 먼저 잠금을 얻었으므로 이동은 지워진 세션에 적용되지 않습니다.
+        assert responses == [('delete', 204), ('move', 404)]
+        assert session.game.move_count == 0 and store.moves == 0 and len(store) == 0
+    asyncio.run(main())
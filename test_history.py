@@ -0,0 +1,41 @@
+"""UndoHistory의 되돌리기/다시 하기 스택과 새 수를 두었을 때 다시 하기 기록을 버리는지 확인합니다."""
+
+import history
+
+
+def test_undo_returns_previous_states_in_order():
+    h = history.UndoHistory(0x10)
+    for n in range(1, 6):
+        h.push(0x10 + n, 4 * n, n % 4)
+    assert len(h) == 5
+    for n in range(4, -1, -1):
+        assert h.undo((n + 1) % 4) == (0x10 + n, 4 * n)
+    assert not h.can_undo() and len(h) == 0
+    # 되돌린 순서의 반대로 다시 할 방향이 나옵니다.
+    assert h.next_redo() == 1
+
+
+def test_redo_consumes_matching_direction():
+    h = history.UndoHistory(b'\x00' * 9) # 4x4가 아닌 보드는 바이트 스냅샷
+    h.push(b'\x01' * 9, 2, 0)
+    h.push(b'\x02' * 9, 6, 3)
+    h.undo(3)
+    h.undo(0)
+    assert h.next_redo() == 0
+    h.push(b'\x01' * 9, 2, 0) # 같은 방향으로 다시 두면 다시 하기 항목 하나만 소비
+    assert h.next_redo() == 3
+    h.push(b'\x02' * 9, 6, 3)
+    assert h.next_redo() is None
+    assert list(h.scores) == [0, 2, 6]
+
+
+def test_new_move_truncates_redo_branch():
+    h = history.UndoHistory(1)
+    for n in range(3):
+        h.push(2 + n, n, 2)
+    h.undo(2)
+    h.undo(2)
+    assert h.next_redo() == 2
+    h.push(99, 50, 1) # 다른 방향: 다시 하기 가지를 버림
+    assert h.next_redo() is None
+    assert list(h.boards) == [1, 2, 99] and list(h.scores) == [0, 0, 50]
@@ -0,0 +1,81 @@
+"""n-튜플 네트워크의 TD(0) 갱신 방향, 대칭 불변성, mmap 체크포인트 왕복을 확인합니다."""
+
+import random
+
+import pytest
+
+import bitboard
+import ntuple
+
+
+@pytest.fixture(scope='module')
+def network():
+    """16^6 x 4개 float32 (268MB)라 모듈에서 한 번만 만듭니다."""
+    return ntuple.NTupleNetwork()
+
+
+def test_value_is_symmetric(network):
+    rng = random.Random(20)
+    for index in rng.sample(range(len(network.weights)), 5000):
+        network.weights[index] = rng.uniform(-1, 1)
+    for _ in range(200):
+        board = sum(rng.randint(0, 11) << (4 * i) for i in range(16))
+        values = [network.value(b) for b in ntuple.symmetries(board)]
+        assert values == pytest.approx([values[0]] * 8, abs=1e-4)
+
+
+def test_td_update_moves_value_toward_target(network):
+    after = bitboard.from_values([[2, 4, 8, 16], [0, 2, 0, 4], [0, 0, 32, 0], [2, 0, 0, 0]])
+    indices = ntuple.feature_indices(after)
+    assert len(set(indices)) == ntuple.FEATURES # 대칭이 아닌 보드라 가중치가 겹치지 않음
+    rate = ntuple.DEFAULT_LEARNING_RATE
+    for target in (100.0, -50.0, 3.0):
+        before = network.value(after)
+        network.update(indices, rate / ntuple.FEATURES * (target - before))
+        # 서로 다른 가중치 FEATURES개에 나누어 더했으므로 값은 오차의 rate만큼 목표에 다가갑니다.
+        assert network.value(after) == pytest.approx(before + rate * (target - before), rel=1e-5)
+        assert abs(target - network.value(after)) < abs(target - before)
+
+
+def test_train_and_checkpoint_round_trip(network, tmp_path):
+    path = str(tmp_path / 'w.ntw')
+    rng = random.Random(1)
+    for _ in range(3):
+        ntuple.train_game(network, rng)
+    probes = [bitboard.from_values([[2, 2, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]),
+              bitboard.from_values([[4, 2, 0, 0], [2, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]])]
+    values = [network.value(board) for board in probes]
+    games = network.games
+    network.save(path)
+
+    loaded = ntuple.NTupleNetwork.load(path)
+    try:
+        assert loaded.games == games
+        assert [loaded.value(board) for board in probes] == values
+        assert loaded.weights == network.weights
+        with pytest.raises(TypeError):
+            loaded.weights[0] = 1.0 # 읽기 전용 mmap
+    finally:
+        loaded.close()
+
+    # 쓰기 시 복사로 연 네트워크는 이어서 학습해도 save() 전에는 파일이 바뀌지 않습니다.
+    resumed = ntuple.NTupleNetwork.load(path, writable=True)
+    try:
+        ntuple.train_game(resumed, random.Random(2))
+        assert resumed.games == games + 1
+    finally:
+        resumed.close()
+    reloaded = ntuple.NTupleNetwork.load(path)
+    assert reloaded.games == games and [reloaded.value(board) for board in probes] == values
+    reloaded.close()
+
+
+def test_bad_checkpoint_is_rejected(tmp_path):
+    path = tmp_path / 'bad.ntw'
+    path.write_bytes(b'NTW')
+    with pytest.raises(ntuple.CheckpointError):
+        ntuple.NTupleNetwork.load(str(path))
+    path.write_bytes(ntuple.HEADER.pack(ntuple.MAGIC, len(ntuple.PATTERNS), ntuple.TUPLE_ENTRIES, 0)
+                     .ljust(ntuple.HEADER_SIZE, b'\0') + b'\0' * 16)
+    with pytest.raises(ntuple.CheckpointError):
+        ntuple.NTupleNetwork.load(str(path))
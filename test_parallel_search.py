@@ -0,0 +1,48 @@
+"""병렬 탐색이 같은 깊이의 직렬 탐색 (expectimax.score_moves)과 같은 값을 내는지 확인합니다."""
+
+import pytest
+
+import bitboard
+import expectimax
+import game
+import parallel_search
+
+
+def sample_boards(seed, moves, every):
+    g = game.Game(4, seed)
+    boards = []
+    for step in range(moves):
+        if step % every == 0:
+            boards.append(g.board.bits)
+        if g.status is not None:
+            break
+        g.move(g.legal_moves()[0])
+    return boards
+
+
+def test_score_spawns_partial_sums_match_score_moves():
+    board = sample_boards(4, 12, 12)[-1]
+    table = expectimax.TranspositionTable()
+    for direction, value in expectimax.score_moves(board, 3, expectimax.TranspositionTable()).items():
+        child = bitboard.MOVE_FUNCTIONS[direction](board)
+        shifts = [4 * i for i in range(16) if not (child >> (4 * i)) & 0xF]
+        total = sum(expectimax.score_spawns(child, shifts[k::3], 2, table) for k in range(3))
+        assert total / len(shifts) == pytest.approx(value, rel=1e-12)
+
+
+@pytest.mark.parametrize('workers', [2, 7]) # 7이면 방향마다 빈 칸을 여러 묶음으로 나눔
+def test_parallel_matches_serial_at_fixed_depth(workers):
+    with parallel_search.ParallelSearcher(workers, max_depth=3) as searcher:
+        for board in sample_boards(6, 40, 10):
+            result = searcher.search(board, budget_ms=60000) # 마감에 걸리지 않을 만큼 넉넉하게
+            serial = expectimax.score_moves(board, 3, expectimax.TranspositionTable())
+            assert result.depth == 3
+            assert result.scores == pytest.approx(serial, rel=1e-12)
+            assert result.direction == max(serial, key=serial.get)
+
+
+def test_no_legal_move_returns_none():
+    board = bitboard.from_values([[2, 4, 2, 4], [4, 2, 4, 2], [2, 4, 2, 4], [4, 2, 4, 2]])
+    with parallel_search.ParallelSearcher(1, max_depth=2) as searcher:
+        result = searcher.search(board)
+    assert (result.direction, result.depth, result.scores) == (None, 0, {})
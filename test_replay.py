@@ -0,0 +1,65 @@
+"""리플레이 v2 형식의 왕복 (저장 -> 읽기 -> 재생)과 손상된 데이터 처리를 확인합니다."""
+
+import pytest
+
+import game_core
+import replay
+
+
+@pytest.mark.parametrize('size', [4, 6])
+def test_round_trip_reproduces_game(record_game, size):
+    recording, board = record_game(12345, size)
+    loaded = replay.Replay.from_bytes(recording.to_bytes())
+    assert (loaded.seed, loaded.size, loaded.moves, loaded.score) == (recording.seed, size, recording.moves, recording.score)
+    assert loaded.checkpoints == recording.checkpoints
+    replayed, score = replay.play(loaded)
+    assert replayed.values() == board.values()
+    assert score == recording.score
+
+
+def test_truncated_and_padded_data_are_rejected(record_game):
+    data = record_game(1)[0].to_bytes()
+    with pytest.raises(replay.ReplayError):
+        replay.Replay.from_bytes(data[:replay.HEADER.size - 1])
+    with pytest.raises(replay.ReplayError):
+        replay.Replay.from_bytes(data[:-1])
+    with pytest.raises(replay.ReplayError):
+        replay.Replay.from_bytes(data + b'\0')
+
+
+def test_bad_magic_and_size_are_rejected(record_game):
+    data = bytearray(record_game(1)[0].to_bytes())
+    with pytest.raises(replay.ReplayError):
+        replay.Replay.from_bytes(b'XXXX' + bytes(data[4:]))
+    for size in (0, 1, game_core.MAX_BOARD_SIZE + 1):
+        data[4] = size
+        with pytest.raises(replay.ReplayError):
+            replay.Replay.from_bytes(bytes(data))
+
+
+def test_changed_move_fails_verification(record_game):
+    recording = record_game(99)[0]
+    data = bytearray(recording.to_bytes())
+    data[replay.HEADER.size] ^= 0b01 # 첫 수의 방향을 바꿉니다
+    with pytest.raises(replay.ReplayError):
+        replay.play(replay.Replay.from_bytes(bytes(data)))
+
+
+def test_main_reports_corrupt_file(record_game, tmp_path, capsys):
+    path = tmp_path / 'bad.rpl'
+    data = bytearray(record_game(5)[0].to_bytes())
+    data[4] = 0
+    path.write_bytes(bytes(data))
+    assert replay.main([str(path)]) == 1
+    assert '실패' in capsys.readouterr().out
+
+
+def test_spawn_depends_only_on_seed_and_index():
+    # 타일 번호만 알면 어느 수에서든 같은 새 타일이 나옵니다 (되돌리기가 난수 상태를 저장하지 않는 근거).
+    first, rng = replay.new_game(77)
+    first.move('left')
+    spawned = rng.spawn(first, 2)
+    rng.spawn(first, 3)
+    second, other = replay.new_game(77)
+    second.move('left')
+    assert other.spawn(second, 2) == spawned
@@ -0,0 +1,97 @@
+"""작은 테이블베이스 (2x2, 목표 16)를 값 격자 위의 완전 탐색 (slide_and_merge_line)과 비교합니다."""
+
+from functools import lru_cache
+
+import pytest
+
+import bitboard
+import game_core
+import tablebase
+
+ROWS = COLS = 2
+TARGET = 16
+
+
+def _move(grid, direction):
+    """값 격자 (튜플의 튜플)를 slide_and_merge_line으로 민 결과"""
+    rows = [list(row) for row in grid]
+    if direction in ('up', 'down'):
+        rows = [list(col) for col in zip(*rows)]
+    rows = [game_core.slide_and_merge_line(row, direction in ('right', 'down'))[0] for row in rows]
+    if direction in ('up', 'down'):
+        rows = [list(col) for col in zip(*rows)]
+    return tuple(tuple(row) for row in rows)
+
+
+@lru_cache(maxsize=None)
+def brute_value(grid):
+    """최선의 수를 두었을 때 TARGET 타일에 도달할 확률 (대칭 제외나 층 나누기 없이 그대로 탐색)"""
+    if max(max(row) for row in grid) >= TARGET:
+        return 1.0
+    best = 0.0
+    four = game_core.FOUR_PROBABILITY
+    for direction in game_core.DIRECTIONS:
+        after = _move(grid, direction)
+        if after == grid:
+            continue
+        if max(max(row) for row in after) >= TARGET:
+            return 1.0
+        empty = [(r, c) for r in range(ROWS) for c in range(COLS) if not after[r][c]]
+        total = 0.0
+        for r, c in empty:
+            for value, p in ((2, 1 - four), (4, four)):
+                child = [list(row) for row in after]
+                child[r][c] = value
+                total += p * brute_value(tuple(tuple(row) for row in child))
+        best = max(best, total / len(empty))
+    return best
+
+
+def _grid(board):
+    """보드 정수 (칸 i = row * COLS + col 니블)를 값 격자로 바꿉니다."""
+    return tuple(tuple(bitboard.exponent_to_value((board >> (4 * (r * COLS + c))) & 0xF) for c in range(COLS))
+                 for r in range(ROWS))
+
+
+@pytest.fixture(scope='module')
+def solved(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('tb') / '2x2_16.tb')
+    result = tablebase.solve(ROWS, COLS, TARGET, path, report=lambda message: None)
+    yield result
+    result.close()
+
+
+def test_every_state_matches_brute_force(solved):
+    assert len(solved)
+    for key, value in zip(solved.keys, solved.values):
+        assert value == pytest.approx(brute_value(_grid(key)), abs=1e-6), hex(key)
+
+
+def test_initial_value_and_best_move(solved):
+    shape = solved.shape
+    expected = sum(p * brute_value(_grid(board)) for board, p in shape.initial_boards())
+    assert solved.initial_value() == pytest.approx(expected, abs=1e-6)
+    for board, _ in shape.initial_boards():
+        grid = _grid(board)
+        scores = solved.move_values([list(row) for row in grid])
+        assert max(scores.values()) == pytest.approx(brute_value(grid), abs=1e-6)
+        assert scores[solved.best_move([list(row) for row in grid])] == max(scores.values())
+
+
+@pytest.mark.parametrize('data', [b'', b'\0' * 10, b'XXXX' + b'\0' * 100])
+def test_bad_files_raise_tablebase_error(tmp_path, data):
+    path = tmp_path / 'bad.tb'
+    path.write_bytes(data)
+    with pytest.raises(tablebase.TablebaseError):
+        tablebase.Tablebase.load(str(path))
+
+
+def test_compacting_pending_keys_does_not_change_result(tmp_path, monkeypatch):
+    # 다음 층의 키를 자주 정렬 + 중복 제거해도 (COMPACT_KEYS) 같은 테이블베이스가 나와야 합니다.
+    paths = [str(tmp_path / 'default.tb'), str(tmp_path / 'compact.tb')]
+    tablebase.solve(2, 3, 32, paths[0], report=lambda message: None).close()
+    monkeypatch.setattr(tablebase, 'COMPACT_KEYS', 8)
+    monkeypatch.setattr(tablebase, 'ITERATE_CHUNK', 5)
+    tablebase.solve(2, 3, 32, paths[1], report=lambda message: None).close()
+    with open(paths[0], 'rb') as a, open(paths[1], 'rb') as b:
+        assert a.read() == b.read()
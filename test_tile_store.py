@@ -0,0 +1,87 @@
+"""TileStore의 빈 슬롯 재사용과 제거 뒤에도 평행 배열 (SoA)이 서로 맞는지 확인합니다."""
+
+import random
+
+import tile_store
+
+SIZE = 4
+CELL_X = [10 + 100 * (i % SIZE) for i in range(SIZE * SIZE)]
+CELL_Y = [20 + 100 * (i // SIZE) for i in range(SIZE * SIZE)]
+FADE = list(range(8))
+PULSE = list(range(8, 13))
+
+
+def new_store():
+    return tile_store.TileStore(CELL_X, CELL_Y, FADE, PULSE)
+
+
+def assert_consistent(store, expected):
+    """expected: 슬롯 -> (값, 칸). 모든 배열의 길이와 쓰는 슬롯/빈 슬롯 목록이 맞아야 합니다."""
+    length = len(store.value)
+    for column in (store.cell, store.start_cell, store.x, store.y, store.frame, store.layer):
+        assert len(column) == length
+    assert store.slots() == sorted(expected)
+    assert len(store) == len(expected)
+    assert sorted(store.free) == sorted(set(range(length)) - set(expected))
+    for slot, (value, cell) in expected.items():
+        assert (store.value[slot], store.cell[slot]) == (value, cell)
+
+
+def test_free_slots_are_reused_before_growing():
+    rng = random.Random(25)
+    store = new_store()
+    expected = {}
+    peak = 0
+    for _ in range(3000):
+        if expected and (rng.random() < 0.45 or len(expected) == SIZE * SIZE):
+            slot = rng.choice(list(expected))
+            store.remove(slot)
+            store.remove(slot) # 두 번 지워도 빈 슬롯 목록이 중복되지 않음
+            del expected[slot]
+        else:
+            free_before = list(store.free)
+            value, cell = 2 ** rng.randint(1, 11), rng.randrange(SIZE * SIZE)
+            slot = store.add(value, cell, FADE[-1])
+            if free_before:
+                assert slot == free_before[-1] # 마지막에 돌려받은 슬롯부터 다시 씀
+            else:
+                assert slot == len(store.value) - 1
+            # 다시 쓴 슬롯에 이전 타일의 상태가 남지 않습니다.
+            assert (store.start_cell[slot], store.x[slot], store.y[slot]) == (cell, CELL_X[cell], CELL_Y[cell])
+            assert store.layer[slot] == tile_store.LAYER_RESTING
+            expected[slot] = (value, cell)
+        peak = max(peak, len(expected))
+        assert_consistent(store, expected)
+    assert len(store.value) == peak # 동시에 있었던 최대 타일 수까지만 자람
+
+
+def test_clear_keeps_capacity_and_reuses_from_slot_zero():
+    store = new_store()
+    for cell in range(6):
+        store.add(2, cell, 0)
+    store.remove(3)
+    store.clear()
+    assert_consistent(store, {})
+    assert len(store.value) == 6
+    assert [store.add(4, cell, 0) for cell in range(7)] == list(range(7))
+
+
+def test_tweens_update_only_their_slot():
+    store = new_store()
+    a = store.add(2, 0, FADE[-1])
+    b = store.add(4, 5, FADE[-1])
+    store.settle()
+    store.cell[a] = 3
+    store.tween_move(a, 0.5)
+    assert (store.x[a], store.y[a]) == ((CELL_X[0] + CELL_X[3]) / 2, CELL_Y[0])
+    assert (store.x[b], store.y[b]) == (CELL_X[5], CELL_Y[5])
+    store.tween_fade_out(b, 0.0)
+    assert (store.frame[b], store.layer[b]) == (FADE[-1], tile_store.LAYER_VANISHING)
+    store.tween_fade_out(b, 1.0)
+    assert store.frame[b] == FADE[0]
+    store.tween_fade_in(a, 0.0)
+    assert (store.frame[a], store.layer[a]) == (FADE[0], tile_store.LAYER_APPEARING)
+    store.tween_fade_in(a, 1.0)
+    assert (store.frame[a], store.layer[a]) == (FADE[-1], tile_store.LAYER_RESTING)
+    store.tween_pulse(a, 1.0)
+    assert store.frame[a] == PULSE[-1]
@@ -0,0 +1,67 @@
+"""Timeline의 O(1) 제거 (자리 바꾸기)가 목록과 트윈의 index를 맞게 유지하는지, 그룹 끝내기가 맞는지 확인합니다."""
+
+import random
+
+import timeline
+
+
+def assert_indexes(line):
+    for i, tween in enumerate(line.tweens):
+        assert tween.index == i
+
+
+def test_random_add_cancel_advance_keeps_indexes():
+    rng = random.Random(9)
+    line = timeline.Timeline(clock=lambda: 0.0)
+    progress = {}
+    finished = []
+    cancelled = set()
+    tweens = []
+    for step in range(2000):
+        action = rng.random()
+        if action < 0.5:
+            name = len(tweens)
+            tweens.append(line.add(name, progress.__setitem__, rng.choice([0, 0.5, 1.0, 3.0]),
+                                   group=name % 3, on_finish=finished.append))
+        elif action < 0.7 and line.tweens:
+            tween = rng.choice(line.tweens)
+            line.cancel(tween)
+            line.cancel(tween) # 두 번 취소해도 다른 트윈에 영향 없음
+            cancelled.add(tween.target)
+        else:
+            line.advance(line.now + rng.random())
+            assert all(t.index == -1 and progress[t.target] == 1.0 for t in line.finished)
+        assert_indexes(line)
+        assert len(line) == len([t for t in tweens if t.index >= 0])
+    # 끝난 트윈은 on_finish가 정확히 한 번, 취소한 트윈은 한 번도 불리지 않습니다.
+    assert len(finished) == len(set(finished))
+    assert not cancelled & set(finished)
+    assert set(finished) | cancelled | {t.target for t in line.tweens} == set(range(len(tweens)))
+
+
+def test_advance_applies_progress_and_finishes_in_time():
+    line = timeline.Timeline(clock=lambda: 10.0)
+    seen = {}
+    short = line.add('short', seen.__setitem__, 1.0)
+    line.add('long', seen.__setitem__, 4.0)
+    assert seen == {'short': 0.0, 'long': 0.0}
+    line.advance(11.0)
+    assert seen == {'short': 1.0, 'long': 0.25}
+    assert line.finished == [short] and len(line) == 1
+    line.advance(14.0)
+    assert seen['long'] == 1.0 and not line.is_active()
+
+
+def test_finish_group_only_finishes_that_group():
+    line = timeline.Timeline(clock=lambda: 0.0)
+    seen = {}
+    finished = []
+    tiles = [line.add(i, seen.__setitem__, 1.0, 'tiles', finished.append) for i in range(5)]
+    other = line.add('message', seen.__setitem__, 1.0, 'message')
+    # on_finish가 같은 그룹의 다른 트윈을 취소해도 그 트윈은 끝내지 않습니다.
+    tiles[0].on_finish = lambda target: (finished.append(target), line.cancel(tiles[4]))
+    line.finish_group('tiles')
+    assert finished == [0, 1, 2, 3] and all(seen[i] == 1.0 for i in range(4)) and seen[4] == 0.0
+    assert line.tweens == [other] and other.index == 0
+    line.clear()
+    assert not line.is_active() and other.index == -1
@@ -0,0 +1,169 @@
+"""
+타일 값별로 미리 합성한 스프라이트 (둥근 사각형 + 숫자)를 보관하는 캐시입니다.
+
+매 프레임 타일마다 Surface를 만들고 숫자를 렌더링하는 대신, 값/투명도/크기 조합별로
+한 번 만든 Surface를 재사용합니다. 캐시는 LRU로 크기가 제한되어 큰 값이 계속 나와도
+메모리가 끝없이 늘지 않습니다.
+
+애니메이션 (페이드, 합쳐짐 펄스)은 값마다 모든 프레임 (투명도, 크기)을 미리 구운 스프라이트 시트 하나로 그립니다.
+프레임 목록은 캐시를 만들 때 정하고, 그리기는 프레임 번호로 시트의 영역을 찾아 blit 한 번만 합니다.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+DEFAULT_MAX_SPRITES = 512
+DEFAULT_MAX_SHEETS = 32 # 값 32가지 (2 ~ 2^32)의 시트
+ALPHA_STEP = 15 # 투명도를 이 단위로 양자화하여 변형 수를 제한합니다 (0-255 -> 18단계)
+TILE_RADIUS = 8
+TILE_BORDER_COLOR = (0, 0, 0, 30)
+TEXT_MAX_WIDTH_RATIO = 0.9 # 숫자가 차지할 수 있는 최대 너비 (타일 너비 대비)
+
+
+class TileSheet:
+    """
+    값 하나의 애니메이션 프레임을 가로로 이어 붙인 Surface입니다.
+    frames[i]는 i번 프레임의 (시트 안 영역, 왼쪽 위 보정 픽셀)이고, 완전히 투명한 프레임은 None입니다.
+    크기가 다른 프레임은 타일 중심에 맞도록 (x - 보정, y - 보정)에 그립니다.
+    """
+
+    __slots__ = ('surface', 'frames')
+
+    def __init__(self, surface, frames):
+        self.surface = surface
+        self.frames = frames
+
+    def blit(self, target, frame, x, y):
+        """frame번 프레임을 타일 왼쪽 위 (x, y) 기준으로 target에 그립니다."""
+        entry = self.frames[frame]
+        if entry is not None:
+            area, offset = entry
+            target.blit(self.surface, (x - offset, y - offset), area)
+
+
+class TileSpriteCache:
+    """
+    (값, 투명도, 크기)별 타일 스프라이트 LRU 캐시입니다.
+    frames는 시트에 구울 (투명도, 크기 배율) 목록이며, 0번은 보통 원래 모습 (255, 1.0)입니다.
+    """
+
+    def __init__(self, font, tile_size, color_for_value, text_color, frames=((255, 1.0),),
+                 max_sprites=DEFAULT_MAX_SPRITES, max_sheets=DEFAULT_MAX_SHEETS):
+        self.font = font
+        self.tile_size = tile_size
+        self.color_for_value = color_for_value
+        self.text_color = text_color
+        self.frames = tuple(frames)
+        self.max_sprites = max_sprites
+        self.max_sheets = max_sheets
+        self.sprites = OrderedDict()
+        self.sheets = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """폰트나 색상이 바뀌었을 때 모든 스프라이트와 시트를 버립니다."""
+        self.sprites.clear()
+        self.sheets.clear()
+
+    def _remember(self, key, surface):
+        self.sprites[key] = surface
+        if len(self.sprites) > self.max_sprites:
+            self.sprites.popitem(last=False) # 가장 오래 쓰지 않은 스프라이트 제거
+        return surface
+
+    def _lookup(self, key):
+        surface = self.sprites.get(key)
+        if surface is not None:
+            self.sprites.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+        return surface
+
+    def _render_base(self, value):
+        """불투명, 원래 크기의 타일에 숫자까지 합성한 Surface를 만듭니다."""
+        surface = pygame.Surface((self.tile_size, self.tile_size), pygame.SRCALPHA)
+        rect = surface.get_rect()
+        pygame.draw.rect(surface, self.color_for_value(value), rect, border_radius=TILE_RADIUS)
+        pygame.draw.rect(surface, TILE_BORDER_COLOR, rect, 1, border_radius=TILE_RADIUS)
+        text_surface = self.font.render(str(value), True, self.text_color)
+        max_text_width = int(self.tile_size * TEXT_MAX_WIDTH_RATIO)
+        if text_surface.get_width() > max_text_width:
+            # 자릿수가 많아 타일을 넘치는 숫자는 비율을 유지한 채 줄입니다 (큰 보드의 작은 타일).
+            height = text_surface.get_height() * max_text_width // text_surface.get_width()
+            text_surface = pygame.transform.smoothscale(text_surface, (max_text_width, max(1, height)))
+        surface.blit(text_surface, text_surface.get_rect(center=rect.center))
+        return surface
+
+    def get(self, value, alpha=255, scale=1.0):
+        """
+        값에 해당하는 스프라이트를 반환합니다.
+        alpha (0-255)는 ALPHA_STEP 단위로, scale은 픽셀 크기 단위로 양자화됩니다.
+        """
+        alpha, size = self._quantize(alpha, scale)
+        key = (value, alpha, size)
+        surface = self._lookup(key)
+        if surface is not None:
+            return surface
+
+        if alpha == 255 and size == self.tile_size:
+            return self._remember(key, self._render_base(value))
+
+        # 변형은 기본 스프라이트에서 필요할 때 만들어 냅니다.
+        surface = self.get(value)
+        if size != self.tile_size:
+            surface = pygame.transform.smoothscale(surface, (size, size))
+        else:
+            surface = surface.copy()
+        if alpha != 255:
+            surface.set_alpha(alpha)
+        return self._remember(key, surface)
+
+    def _quantize(self, alpha, scale):
+        alpha = min(255, int(round(alpha / ALPHA_STEP)) * ALPHA_STEP)
+        return alpha, int(self.tile_size * scale)
+
+    def _render_sheet(self, value):
+        """frames의 서로 다른 (투명도, 크기) 조합을 한 번씩 구워 시트 하나에 이어 붙입니다."""
+        base = self.get(value)
+        variants = [] # 시트에 들어갈 서로 다른 (투명도, 크기)
+        variant_index = {}
+        frame_variants = []
+        for alpha, scale in self.frames:
+            key = self._quantize(alpha, scale)
+            if key[0] == 0:
+                frame_variants.append(None) # 보이지 않는 프레임은 그리지 않습니다
+                continue
+            if key not in variant_index:
+                variant_index[key] = len(variants)
+                variants.append(key)
+            frame_variants.append(variant_index[key])
+
+        width = sum(size for _, size in variants)
+        height = max((size for _, size in variants), default=1)
+        surface = pygame.Surface((max(1, width), height), pygame.SRCALPHA)
+        areas = []
+        x = 0
+        for alpha, size in variants:
+            frame = base if size == self.tile_size else pygame.transform.smoothscale(base, (size, size))
+            # 빈 (투명한) 시트에 덮어쓰도록 RGBA 최댓값으로 그린 뒤, 투명도는 픽셀 알파에 곱해 구워 넣습니다.
+            surface.blit(frame, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            area = pygame.Rect(x, 0, size, size)
+            if alpha != 255:
+                surface.fill((255, 255, 255, alpha), area, special_flags=pygame.BLEND_RGBA_MULT)
+            areas.append((area, size // 2 - self.tile_size // 2))
+            x += size
+        return TileSheet(surface, [None if i is None else areas[i] for i in frame_variants])
+
+    def sheet(self, value):
+        """값에 해당하는 애니메이션 시트를 반환합니다 (처음 쓸 때 모든 프레임을 굽습니다)."""
+        sheet = self.sheets.get(value)
+        if sheet is not None:
+            self.sheets.move_to_end(value)
+            return sheet
+        sheet = self.sheets[value] = self._render_sheet(value)
+        if len(self.sheets) > self.max_sheets:
+            self.sheets.popitem(last=False)
+        return sheet
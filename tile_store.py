@@ -0,0 +1,114 @@
+"""
+애니메이션 화면의 타일을 타일마다 객체로 만들지 않고 슬롯 번호로 나눈 평행 배열 (struct-of-arrays)에 두는 저장소입니다.
+
+타일 하나는 슬롯 번호 (정수) 하나이고, 값/칸/시작 칸/그릴 위치/스프라이트 프레임/그리는 층은
+같은 번호의 array 원소입니다. 사라진 타일의 슬롯은 빈 슬롯 목록 (스택)에 돌려주었다가 새 타일에 다시 쓰므로,
+배열은 화면에 동시에 있었던 최대 타일 수까지만 자라고 수를 둘 때마다 객체를 만들지 않습니다 (GC 대상 없음).
+그리기는 배열을 zip으로 나란히 훑고, 빈 슬롯은 값이 0이라 건너뜁니다. 슬롯 순서는 생긴 순서가 아니므로 겹칠 때의
+앞뒤는 층 (LAYERS 순서로 그림)으로 정합니다: 사라지는 타일이 맨 아래, 페이드인 중인 새 타일이 맨 위입니다.
+
+위치는 칸 번호 (row * 한 변 + col)로만 저장하고 픽셀 좌표는 칸별 표 (cell_x, cell_y)에서 찾습니다.
+트윈 함수 (tween_*)는 timeline.Timeline.add()에 슬롯 번호를 대상으로 넘깁니다.
+"""
+
+from array import array
+
+LAYER_VANISHING, LAYER_RESTING, LAYER_APPEARING = LAYERS = range(3) # 그리는 순서
+
+
+class TileStore:
+    """
+    슬롯별 타일 상태 배열입니다. fade_frames[k]는 투명도 k / (len - 1)의 스프라이트 프레임 번호 (마지막은 원래 모습),
+    pulse_frames[j]는 합쳐짐 펄스 진행 j / (len - 1)의 프레임 번호 (마지막은 원래 모습)입니다.
+    """
+
+    __slots__ = ('value', 'cell', 'start_cell', 'x', 'y', 'frame', 'layer', 'free', 'count',
+                 'cell_x', 'cell_y', 'fade_frames', 'pulse_frames')
+
+    def __init__(self, cell_x, cell_y, fade_frames, pulse_frames):
+        self.cell_x = cell_x # 칸 번호 -> 타일 왼쪽 위 픽셀 x
+        self.cell_y = cell_y
+        self.fade_frames = fade_frames
+        self.pulse_frames = pulse_frames
+        self.value = array('I') # 타일 값 (0이면 빈 슬롯)
+        self.cell = array('H') # 현재 (이동이 끝나는) 칸
+        self.start_cell = array('H') # 이동 애니메이션이 시작하는 칸
+        self.x = array('d') # 이번 프레임에 그릴 픽셀 위치 (트윈이 갱신, float32는 blit 때 버림 결과가 1픽셀 달라질 수 있음)
+        self.y = array('d')
+        self.frame = array('B') # 스프라이트 시트의 프레임 번호 (페이드/펄스 단계)
+        self.layer = array('B') # LAYER_* (페이드 트윈이 바꿈)
+        self.free = [] # 빈 슬롯 번호 (나중에 돌려받은 슬롯부터 다시 씀)
+        self.count = 0 # 쓰고 있는 슬롯 수
+
+    def __len__(self):
+        return self.count
+
+    def add(self, value, cell, frame):
+        """cell에 멈춰 있는 타일을 추가하고 슬롯 번호를 반환합니다."""
+        x, y = self.cell_x[cell], self.cell_y[cell]
+        if self.free:
+            slot = self.free.pop()
+            self.value[slot] = value
+            self.cell[slot] = self.start_cell[slot] = cell
+            self.x[slot], self.y[slot] = x, y
+            self.frame[slot] = frame
+            self.layer[slot] = LAYER_RESTING
+        else:
+            slot = len(self.value)
+            self.value.append(value)
+            self.cell.append(cell)
+            self.start_cell.append(cell)
+            self.x.append(x)
+            self.y.append(y)
+            self.frame.append(frame)
+            self.layer.append(LAYER_RESTING)
+        self.count += 1
+        return slot
+
+    def remove(self, slot):
+        """슬롯을 비우고 빈 슬롯 목록에 돌려줍니다 (timeline의 on_finish로도 씁니다)."""
+        if self.value[slot]:
+            self.value[slot] = 0
+            self.free.append(slot)
+            self.count -= 1
+
+    def clear(self):
+        """모든 슬롯을 비웁니다 (배열 크기는 유지해 다음 게임에 다시 씁니다)."""
+        size = len(self.value)
+        self.value = array('I', bytes(4 * size))
+        self.free = list(range(size - 1, -1, -1)) # 0번 슬롯부터 다시 씀
+        self.count = 0
+
+    def slots(self):
+        """쓰고 있는 슬롯 번호 목록"""
+        return [slot for slot, value in enumerate(self.value) if value]
+
+    def settle(self):
+        """모든 타일의 이동 시작 칸을 현재 칸으로 옮깁니다 (새 이동을 시작하기 전)."""
+        self.start_cell[:] = self.cell
+
+    # --- 트윈 갱신 함수 (대상은 슬롯 번호) ---
+
+    def tween_move(self, slot, progress):
+        """시작 칸에서 현재 칸으로 이동"""
+        start, end = self.start_cell[slot], self.cell[slot]
+        cell_x, cell_y = self.cell_x, self.cell_y
+        self.x[slot] = cell_x[start] + (cell_x[end] - cell_x[start]) * progress
+        self.y[slot] = cell_y[start] + (cell_y[end] - cell_y[start]) * progress
+
+    def tween_fade_in(self, slot, progress):
+        """새로 생긴 타일 페이드인 (끝날 때까지 다른 타일 위에 그림)"""
+        frames = self.fade_frames
+        self.frame[slot] = frames[round(progress * (len(frames) - 1))]
+        self.layer[slot] = LAYER_APPEARING if progress < 1.0 else LAYER_RESTING
+
+    def tween_fade_out(self, slot, progress):
+        """합쳐져서 사라지는 타일 페이드아웃 (제자리에서, 다른 타일 아래에 그림)"""
+        frames = self.fade_frames
+        self.frame[slot] = frames[len(frames) - 1 - round(progress * (len(frames) - 1))]
+        self.layer[slot] = LAYER_VANISHING
+
+    def tween_pulse(self, slot, progress):
+        """합쳐진 타일 크기 펄스"""
+        frames = self.pulse_frames
+        self.frame[slot] = frames[round(progress * (len(frames) - 1))]
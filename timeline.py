@@ -0,0 +1,103 @@
+"""
+모든 애니메이션 (트윈)을 한곳에서 관리하는 타임라인입니다.
+
+매 프레임 advance()를 한 번 호출하면 그 프레임의 단조 시각 하나로 모든 트윈을 진행합니다.
+트윈은 update(target, progress) 함수로 대상의 속성 (위치, 투명도, 크기 등)을 직접 바꾸고,
+끝난 트윈은 목록의 마지막 항목과 자리를 바꿔 O(1)에 제거합니다.
+"""
+
+import time
+
+
+class Tween:
+    """대상 하나에 대한 진행률 0 -> 1 애니메이션입니다."""
+
+    __slots__ = ('target', 'update', 'start_time', 'duration', 'group', 'on_finish', 'index')
+
+    def __init__(self, target, update, start_time, duration, group, on_finish):
+        self.target = target
+        self.update = update
+        self.start_time = start_time
+        self.duration = duration
+        self.group = group
+        self.on_finish = on_finish
+        self.index = -1 # Timeline.tweens 안의 위치 (-1이면 끝났거나 취소됨)
+
+    def progress(self, now):
+        if self.duration <= 0:
+            return 1.0
+        return min(1.0, max(0.0, (now - self.start_time) / self.duration))
+
+
+class Timeline:
+    """활성 트윈 목록과 현재 프레임 시각을 가진 스케줄러입니다."""
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.now = clock()
+        self.tweens = [] # 활성 트윈 (순서 없음)
+        self.finished = [] # 마지막 advance()에서 끝난 트윈 (화면 갱신 영역 계산용)
+
+    def add(self, target, update, duration, group=None, on_finish=None):
+        """현재 프레임 시각에 시작하는 트윈을 추가하고, 진행률 0 상태를 바로 적용합니다."""
+        tween = Tween(target, update, self.now, duration, group, on_finish)
+        tween.index = len(self.tweens)
+        self.tweens.append(tween)
+        update(target, 0.0)
+        return tween
+
+    def _remove(self, tween):
+        """트윈을 마지막 항목과 자리를 바꾼 뒤 pop하여 O(1)에 제거합니다."""
+        last = self.tweens.pop()
+        if last is not tween:
+            last.index = tween.index
+            self.tweens[tween.index] = last
+        tween.index = -1
+
+    def _finish(self, tween):
+        self._remove(tween)
+        tween.update(tween.target, 1.0)
+        self.finished.append(tween)
+        if tween.on_finish is not None:
+            tween.on_finish(tween.target)
+
+    def cancel(self, tween):
+        """트윈을 현재 상태 그대로 멈추고 제거합니다 (on_finish는 호출하지 않습니다)."""
+        if tween.index >= 0:
+            self._remove(tween)
+
+    def advance(self, now=None):
+        """프레임 시각을 갱신하고 모든 활성 트윈을 그 시각으로 진행합니다."""
+        self.now = self.clock() if now is None else now
+        self.finished = []
+        # 뒤에서부터 순회하면 제거할 때 자리를 바꿔 들어오는 항목은 이미 처리한 항목입니다.
+        i = len(self.tweens) - 1
+        while i >= 0:
+            if i < len(self.tweens):
+                tween = self.tweens[i]
+                progress = tween.progress(self.now)
+                if progress >= 1.0:
+                    self._finish(tween)
+                else:
+                    tween.update(tween.target, progress)
+            i -= 1
+
+    def finish_group(self, group):
+        """그룹에 속한 트윈을 모두 마지막 상태로 즉시 끝냅니다."""
+        for tween in [t for t in self.tweens if t.group == group]:
+            if tween.index >= 0:
+                self._finish(tween)
+
+    def clear(self):
+        """모든 트윈을 on_finish 없이 버립니다."""
+        for tween in self.tweens:
+            tween.index = -1
+        self.tweens = []
+        self.finished = []
+
+    def is_active(self):
+        """진행 중인 애니메이션이 하나라도 있는지 확인합니다."""
+        return bool(self.tweens)
+
+    def __len__(self):
+        return len(self.tweens)
@@ -0,0 +1,246 @@
+"""
+시드를 고정한 M판의 게임을 프로세스 풀에서 돌리고 통계를 모으는 명령행 도구입니다.
+
+    python tournament.py --games 10000 --policy corner --workers 8
+    python tournament.py --games 200 --policy mypolicies:smart --json result.json
+    python tournament.py --games 1000 --policy corner --corpus games.crp   # 모든 수를 말뭉치 (corpus.py)에 덧붙임
+
+정책은 policy(board, rng) -> 방향 (또는 None) 형태의 함수이며, board는 bitboard 정수입니다.
+작업 프로세스는 게임마다 작은 요약 튜플만 돌려주고, 부모 프로세스가 집계합니다.
+--corpus를 주면 작업 프로세스가 묶음마다 수를 corpus.MoveBuffer에 모아 함께 돌려주고, 부모가 말뭉치에 덧붙입니다.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import bitboard
+import game_core
+import replay
+
+DEFAULT_MAX_MOVES = 100000 # 끝나지 않는 정책을 막기 위한 한 판의 최대 수
+
+
+def legal_moves(board):
+    """(방향, 새 보드, 얻은 점수) 목록 중 보드가 실제로 바뀌는 것만 반환합니다."""
+    return [(direction,) + game_core.move(board, direction) for direction in game_core.legal_moves(board)]
+
+
+def random_policy(board, rng):
+    """가능한 방향 중 하나를 무작위로 고릅니다."""
+    moves = legal_moves(board)
+    return rng.choice(moves)[0] if moves else None
+
+
+def greedy_policy(board, rng):
+    """바로 얻는 점수가 가장 큰 방향을 고르고, 같으면 빈 칸이 많이 남는 쪽을 고릅니다."""
+    moves = legal_moves(board)
+    if not moves:
+        return None
+    return max(moves, key=lambda m: (m[2], bitboard.count_empty(m[1])))[0]
+
+
+CORNER_PREFERENCE = ('down', 'left', 'right', 'up')
+
+def corner_policy(board, rng):
+    """큰 타일을 왼쪽 아래 구석에 모으도록 아래 > 왼쪽 > 오른쪽 > 위 순서로 시도합니다."""
+    legal = game_core.legal_moves(board)
+    for direction in CORNER_PREFERENCE:
+        if direction in legal:
+            return direction
+    return None
+
+
+def expectimax_policy(board, rng):
+    """expectimax 탐색 (한 수당 한 프레임 예산)으로 고릅니다."""
+    import expectimax
+    return expectimax.best_move(board)
+
+
+POLICIES = {
+    'random': random_policy,
+    'greedy': greedy_policy,
+    'corner': corner_policy,
+    'expectimax': expectimax_policy,
+}
+
+
+def resolve_policy(name):
+    """정책 이름 또는 'module:function' 형식의 경로를 함수로 바꿉니다."""
+    if name in POLICIES:
+        return POLICIES[name]
+    module_name, sep, attribute = name.partition(':')
+    if not sep:
+        raise ValueError("알 수 없는 정책입니다: %r (%s 또는 module:function)" % (name, ", ".join(POLICIES)))
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def play_game(policy, seed, max_moves=DEFAULT_MAX_MOVES, buffer=None):
+    """
+    한 판을 끝까지 진행하고 요약 튜플을 반환합니다.
+    (seed, 점수, 수, 최대 타일, 2048까지 걸린 수 (도달 못 하면 -1))
+    새 타일은 replay.new_game()과 같은 SpawnRandom에서 나오므로 시드와 둔 방향만으로 replay.py에서 재현됩니다.
+    정책의 난수는 random.Random(seed)로 따로 둡니다.
+    buffer (corpus.MoveBuffer)를 넘기면 둔 수를 모두 덧붙입니다.
+    """
+    board, spawn_rng = replay.new_game(seed)
+    rng = random.Random(seed)
+    if buffer is not None:
+        import corpus # 작업 프로세스에서도 --corpus일 때만 numpy를 불러옵니다
+        game_id = buffer.begin_game(seed)
+    score = 0
+    moves = 0
+    moves_to_win = -1
+    while moves < max_moves:
+        before = board.bits
+        direction = policy(before, rng)
+        if direction is None:
+            break
+        gained = board.move(direction)
+        if gained is None:
+            break # 보드를 바꾸지 못하는 정책은 더 진행할 수 없음
+        moves += 1
+        spawned = spawn_rng.spawn(board, moves + 1)
+        if buffer is not None:
+            buffer.append(game_id, before, replay.DIRECTION_CODES[direction], corpus.spawn_code(spawned), gained)
+        score += gained
+        if moves_to_win < 0 and board.max_exponent >= game_core.WIN_EXPONENT:
+            moves_to_win = moves
+    return seed, score, moves, board.max_value(), moves_to_win
+
+
+def _play_chunk(args):
+    """작업 프로세스: 정책을 한 번만 찾고 여러 시드를 연속으로 진행합니다. (요약 목록, MoveBuffer 또는 None)"""
+    policy_name, seeds, max_moves, record = args
+    policy = resolve_policy(policy_name)
+    buffer = None
+    if record:
+        import corpus
+        buffer = corpus.MoveBuffer()
+    return [play_game(policy, seed, max_moves, buffer) for seed in seeds], buffer
+
+
+def run_tournament(policy_name, games, seed=0, workers=None, max_moves=DEFAULT_MAX_MOVES, chunk_size=None,
+                   writer=None):
+    """M판을 프로세스 풀에 나누어 실행하고 요약 튜플 목록을 반환합니다. writer (corpus.CorpusWriter)에 수를 덧붙입니다."""
+    resolve_policy(policy_name) # 작업을 나누기 전에 잘못된 정책 이름을 걸러냅니다
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        # 프로세스당 여러 묶음으로 나누어 빨리 끝난 프로세스가 남은 일을 가져가게 합니다.
+        chunk_size = max(1, games // (workers * 8))
+    seeds = list(range(seed, seed + games))
+    chunks = [(policy_name, seeds[i:i + chunk_size], max_moves, writer is not None) for i in range(0, games, chunk_size)]
+    results = []
+    if writer is not None:
+        import corpus
+
+    def collect(chunk_results):
+        for summaries, buffer in chunk_results:
+            results.extend(summaries)
+            if writer is not None:
+                writer.extend(buffer, corpus.SOURCE_BOT)
+
+    if workers == 1:
+        collect(map(_play_chunk, chunks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            collect(pool.map(_play_chunk, chunks))
+    return results
+
+
+def _describe(values):
+    if not values:
+        return None
+    return {
+        'mean': statistics.fmean(values),
+        'median': statistics.median(values),
+        'min': min(values),
+        'max': max(values),
+    }
+
+
+def aggregate(summaries):
+    """요약 튜플 목록에서 점수, 수, 최대 타일 분포, 2048 도달 시간 통계를 계산합니다."""
+    scores = [s[1] for s in summaries]
+    moves = [s[2] for s in summaries]
+    wins = [s[4] for s in summaries if s[4] >= 0]
+    max_tiles = Counter(s[3] for s in summaries)
+    return {
+        'games': len(summaries),
+        'score': _describe(scores),
+        'moves': _describe(moves),
+        'max_tile_distribution': {str(tile): max_tiles[tile] for tile in sorted(max_tiles)},
+        'win_rate': len(wins) / len(summaries) if summaries else 0.0,
+        'moves_to_2048': _describe(wins),
+    }
+
+
+def positive_int(text):
+    """argparse 형식: 1 이상의 정수"""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError("1 이상이어야 합니다: %s" % text)
+    return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="2048 몬테카를로 토너먼트")
+    parser.add_argument('--games', type=int, default=1000, help="진행할 게임 수")
+    parser.add_argument('--policy', default='random', help="%s 또는 module:function" % ", ".join(POLICIES))
+    parser.add_argument('--seed', type=int, default=0, help="첫 게임의 시드 (게임 i는 seed + i)")
+    parser.add_argument('--workers', type=positive_int, default=None, help="프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument('--max-moves', type=int, default=DEFAULT_MAX_MOVES, help="한 판의 최대 수")
+    parser.add_argument('--json', metavar='PATH', help="집계 결과를 JSON 파일로 저장 ('-'이면 표준 출력)")
+    parser.add_argument('--corpus', metavar='DIR', help="모든 수를 이 말뭉치에 덧붙입니다")
+    args = parser.parse_args(argv)
+    try:
+        resolve_policy(args.policy)
+    except (ValueError, ImportError, AttributeError) as e:
+        parser.error(str(e))
+    if not 0 <= args.seed <= replay.MAX_SEED - max(args.games, 0):
+        parser.error("시드는 0 이상 2^64 미만이어야 합니다: %d" % args.seed)
+
+    writer = None
+    if args.corpus:
+        import corpus # numpy를 쓰므로 --corpus일 때만 불러옵니다
+        try:
+            writer = corpus.CorpusWriter(args.corpus)
+        except (OSError, corpus.CorpusError) as e:
+            parser.error(str(e))
+
+    started = time.perf_counter()
+    summaries = run_tournament(args.policy, args.games, args.seed, args.workers, args.max_moves, writer=writer)
+    if writer is not None:
+        writer.close()
+    elapsed = time.perf_counter() - started
+    report = aggregate(summaries)
+    report['policy'] = args.policy
+    report['elapsed_seconds'] = elapsed
+    report['games_per_second'] = len(summaries) / elapsed if elapsed > 0 else 0.0
+
+    if args.json == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+        print("정책: %s, 게임 %d판, %.2f초 (%.1f판/초)" % (args.policy, report['games'], elapsed, report['games_per_second']))
+        if report['score']: # 진행한 게임이 없으면 통계가 None
+            print("점수: 평균 %(mean).1f, 중앙값 %(median)s, 최소 %(min)d, 최대 %(max)d" % report['score'])
+            print("수: 평균 %(mean).1f, 중앙값 %(median)s, 최소 %(min)d, 최대 %(max)d" % report['moves'])
+        print("최대 타일 분포:", ", ".join("%s: %d" % item for item in report['max_tile_distribution'].items()))
+        print("2048 도달률: %.2f%%" % (100 * report['win_rate']))
+        if report['moves_to_2048']:
+            print("2048까지 걸린 수: 평균 %(mean).1f, 중앙값 %(median)s" % report['moves_to_2048'])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,24 @@
+import time
+startup_times = {'launch': time.perf_counter()} # 시작 단계별 시각 (--measure-startup, 모듈 실행 시작부터)
+
 import pygame
 import random
 import sys
-import time # 애니메이션 타이밍을 위해
+
+import game_core # pygame 없이 동작하는 게임 규칙
+import game # 한 판의 규칙 상태 (보드, 시드, 리플레이, 되돌리기 기록)
+import replay # 시드 + 방향 기록 (게임 재현용)
+import expectimax # 자동 진행/힌트용 탐색
+import tile_sprites # 타일 스프라이트 캐시
+import tile_store # 타일 상태 배열 (슬롯 번호)
+import timeline # 애니메이션 타임라인
+import frame_profiler # 프레임 단계별 시간 측정 (F3 오버레이)
+# parallel_search (--search-workers)와 ntuple (--ntuple)은 옵션을 줄 때만 불러옵니다 (시작 시간).
+startup_times['imports'] = time.perf_counter()
 
 # --- 상수 설정 ---
-BOARD_SIZE = 4
+BOARD_SIZE = game_core.BOARD_SIZE # 한 변의 칸 수 (configure_board()로 6, 8, 16 등으로 변경 가능)
+BOARD_PIXELS = 450 # 보드 크기와 관계없이 보드가 차지하는 픽셀 크기
 TILE_SIZE = 100 # 타일 하나의 픽셀 크기
 GAP = 10 # 타일 간 간격
 BOARD_WIDTH = BOARD_HEIGHT = BOARD_SIZE * TILE_SIZE + (BOARD_SIZE + 1) * GAP
@@ -54,49 +68,171 @@ MERGE_ANIMATION_DURATION = 0.3 # 타일 합쳐짐 애니메이션 지속 시간
 SUBLIMINAL_MESSAGE_DURATION = 0.7 # 서브리미널 메시지 지속 시간 (초)
 MOVE_ANIMATION_DURATION = 0.15 # 타일 이동 애니메이션 지속 시간 (초)
 
-# --- Tile 클래스 정의 (타일 애니메이션을 위해) ---
-class Tile:
-    def __init__(self, value, row, col, tile_id):
-        self.value = value
-        self.id = tile_id
-        self.current_row = row # 현재 논리적 행
-        self.current_col = col # 현재 논리적 열
-        # 애니메이션 시작 픽셀 위치는 타일이 생성될 때의 위치
-        self.start_x, self.start_y = get_tile_pixel_pos(row, col) 
-        # 애니메이션 끝 픽셀 위치는 처음에는 시작 위치와 동일
-        self.end_x, self.end_y = get_tile_pixel_pos(row, col) 
-        self.animation_start_time = time.time() # 애니메이션 시작 시간
-        self.is_new = True # 새로 생성된 타일 (페이드인 애니메이션용)
-        self.is_merged_result = False # 합쳐짐의 결과로 생성된 타일 (펄스 애니메이션용)
-        self.is_disappearing = False # 합쳐져서 사라지는 타일 (페이드아웃 애니메이션용)
-        self.alpha = 255 # 투명도 (0-255)
-
-# --- 게임 상태 변수 ---
-game_board_state = [] # 게임 보드 (Tile 객체 또는 None 저장)
-next_tile_id = 0 # 다음 타일에 할당할 고유 ID
-all_active_tiles = [] # 현재 화면에 그려져야 할 모든 Tile 객체 (이동 중이거나 고정된 타일 포함)
-active_subliminal_messages = [] # 활성화된 서브리미널 메시지 리스트
-
-# --- Pygame 초기 설정 ---
-pygame.init()
-pygame.display.set_caption("2048 게임") # 창 제목
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT)) # 화면 크기 설정
-clock = pygame.time.Clock() # 프레임 속도 제어를 위한 Clock 객체
-
-# 폰트 로드 (Jua.ttf 파일이 없으면 기본 폰트 사용)
-try:
-    font_jua_large = pygame.font.Font("Jua.ttf", 60)
-    font_jua_medium = pygame.font.Font("Jua.ttf", 36)
-    font_jua_small = pygame.font.Font("Jua.ttf", 24)
-    font_jua_subliminal = pygame.font.Font("Jua.ttf", 28) # 문구 크기 28로 변경
-    font_jua_title = pygame.font.Font("Jua.ttf", 80)
-except:
-    print("Jua.ttf 폰트를 찾을 수 없습니다. Pygame 기본 폰트를 사용합니다.")
-    font_jua_large = pygame.font.Font(None, 60)
-    font_jua_medium = pygame.font.Font(None, 36)
-    font_jua_small = pygame.font.Font(None, 24)
-    font_jua_subliminal = pygame.font.Font(None, 28) # 문구 크기 28로 변경
-    font_jua_title = pygame.font.Font(None, 80)
+# 자동 진행/힌트 설정
+AI_TIME_BUDGET = 0.016 # 한 수를 고르는 데 쓰는 시간 (초, 한 프레임)
+AI_MAX_DEPTH = 5 # 최대 탐색 깊이
+AUTOPLAY_MOVE_INTERVAL = MOVE_ANIMATION_DURATION # 자동 진행 시 수 사이 간격 (초)
+DIRECTION_LABELS = {'left': 'LEFT', 'right': 'RIGHT', 'up': 'UP', 'down': 'DOWN'}
+
+# 렌더링 설정
+FPS = 60
+DIRTY_RECT_RENDERING = True # True: 바뀐 영역만 display.update()하고, 애니메이션이 없으면 이벤트를 기다리며 쉽니다
+MERGE_PULSE_MARGIN = TILE_SIZE // 10 # 합쳐짐 펄스로 커지는 타일이 차지하는 여유 공간 (픽셀)
+WARM_UP_SLICE = 0.008 # 시작 화면을 띄운 뒤 한 프레임에 자원 미리 준비에 쓰는 시간 (초)
+
+# 폰트 설정 (처음 쓸 때 불러옵니다)
+FONT_PATH = "Jua.ttf"
+FONT_SIZES = {'large': 60, 'medium': 36, 'small': 24, 'subliminal': 28, 'title': 80} # 'tile'은 타일 크기에 비례
+
+def configure_board(size):
+    """
+    보드 한 변의 칸 수를 바꾸고 그에 맞게 타일/화면 크기를 다시 계산합니다.
+    보드 전체 크기는 BOARD_PIXELS로 유지되므로 칸이 많을수록 타일이 작아집니다. init_display() 전에 호출합니다.
+    """
+    global BOARD_SIZE, TILE_SIZE, GAP, BOARD_WIDTH, BOARD_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT, MERGE_PULSE_MARGIN
+    if not game_core.MIN_BOARD_SIZE <= size <= game_core.MAX_BOARD_SIZE:
+        raise ValueError("보드 크기는 %d~%d 사이여야 합니다: %r" % (game_core.MIN_BOARD_SIZE, game_core.MAX_BOARD_SIZE, size))
+    BOARD_SIZE = size
+    GAP = max(2, 40 // size) # 4x4에서 10
+    TILE_SIZE = (BOARD_PIXELS - (size + 1) * GAP) // size # 4x4에서 100
+    BOARD_WIDTH = BOARD_HEIGHT = BOARD_SIZE * TILE_SIZE + (BOARD_SIZE + 1) * GAP
+    SCREEN_WIDTH = BOARD_WIDTH + 100
+    SCREEN_HEIGHT = BOARD_HEIGHT + 150
+    MERGE_PULSE_MARGIN = TILE_SIZE // 10
+
+
+SUBLIMINAL_MESSAGE_RISE = 50 # 서브리미널 메시지가 위로 떠오르는 거리 (픽셀)
+TILE_TWEENS = 'tiles' # 타일 애니메이션 트윈 그룹 (다음 이동 때 한꺼번에 끝냄)
+
+# 타일 애니메이션 프레임: 페이드와 합쳐짐 펄스를 프레임 속도에 맞춰 나눈 단계를 스프라이트 시트에 미리 굽습니다.
+FADE_STEPS = max(1, round(MOVE_ANIMATION_DURATION * FPS)) # 페이드 단계 수 (60 FPS에서 9)
+PULSE_STEPS = max(1, round(MERGE_ANIMATION_DURATION * FPS)) # 펄스 단계 수 (60 FPS에서 18)
+TILE_FRAME_FULL = 0 # 원래 모습
+TILE_FRAME_FADE = 1 # 투명도 k / FADE_STEPS 프레임은 TILE_FRAME_FADE + k (k = 0 .. FADE_STEPS - 1)
+TILE_FRAME_PULSE = TILE_FRAME_FADE + FADE_STEPS # 펄스 진행 j / PULSE_STEPS 프레임은 TILE_FRAME_PULSE + j (j < PULSE_STEPS)
+
+def pulse_scale(progress):
+    """합쳐짐 펄스의 크기 배율 (1.0 -> 1.1 -> 1.0)"""
+    if progress < 0.5:
+        return 1.0 + 0.2 * progress # 커짐
+    return 1.1 - 0.2 * (progress - 0.5) # 작아짐
+
+# 시트에 구울 (투명도, 크기 배율) 목록 (프레임 번호 순서)
+TILE_FRAMES = ([(255, 1.0)]
+               + [(255 * k / FADE_STEPS, 1.0) for k in range(FADE_STEPS)]
+               + [(255, pulse_scale(j / PULSE_STEPS)) for j in range(PULSE_STEPS)])
+
+# 트윈이 진행률에 따라 고르는 프레임 번호 (마지막은 원래 모습, tile_store.TileStore의 fade_frames/pulse_frames)
+FADE_FRAMES = tuple(TILE_FRAME_FADE + k for k in range(FADE_STEPS)) + (TILE_FRAME_FULL,)
+PULSE_FRAMES = tuple(TILE_FRAME_PULSE + j for j in range(PULSE_STEPS)) + (TILE_FRAME_FULL,)
+
+# --- 트윈 갱신 함수 (timeline.Timeline.add()에 전달, 타일 트윈은 tile_store.TileStore.tween_*) ---
+
+def tween_subliminal_message(msg, progress):
+    """서브리미널 메시지가 위로 떠오르며 사라짐"""
+    msg['alpha'] = max(0, int(255 * (1 - progress)))
+    msg['y'] = msg['initial_y'] - progress * SUBLIMINAL_MESSAGE_RISE
+
+# --- 실행 설정 (명령줄 인수) ---
+fixed_seed = None # 지정하면 모든 게임을 이 시드로 시작합니다 (--seed, 보고된 게임 재현용)
+replay_path = None # 지정하면 게임이 끝나거나 창을 닫을 때 리플레이를 이 파일에 저장합니다 (--record)
+profiler = frame_profiler.FrameProfiler(FPS) # 프레임 프로파일러 (F3로 오버레이 표시, 꺼져 있으면 측정하지 않음)
+profile_dump_path = None # 지정하면 처음부터 측정하고 종료할 때 히스토그램을 이 파일에 저장합니다 (--profile-dump)
+ai_searcher = None # 지정하면 자동 진행/힌트를 이 병렬 탐색기 (작업자 프로세스)로 고릅니다 (--search-workers)
+ai_network = None # 지정하면 자동 진행/힌트를 학습된 n-튜플 네트워크로 고릅니다 (--ntuple, 탐색보다 우선)
+ai_tablebase = None # 지정하면 작은 보드의 자동 진행/힌트를 테이블베이스의 최선 수로 고릅니다 (--tablebase)
+corpus_writer = None # 지정하면 4x4 게임의 모든 수를 이 말뭉치에 덧붙입니다 (--corpus)
+
+
+# --- Pygame 화면 및 폰트 (init_display()에서 초기화, 폰트와 스프라이트는 처음 쓸 때 생성) ---
+screen = None
+clock = None
+fonts = {} # 불러온 폰트 {이름: Font} (get_font())
+font_path = FONT_PATH # Jua.ttf를 열 수 없으면 None (Pygame 기본 폰트 사용)
+font_profiler = None # 프로파일러 오버레이용 고정폭 폰트 (오버레이를 처음 그릴 때 생성)
+tile_sprite_cache = None # 타일 값별로 합성해 둔 스프라이트 (get_tile_sprites())
+background_layers = {} # 미리 그려 둔 정적 배경 레이어 {(종류, 화면 크기): Surface}
+end_overlays = {} # 미리 합성해 둔 게임 종료 화면 {(상태, 화면 크기): Surface}
+measure_startup = False # True이면 첫 프레임과 자원 준비까지 걸린 시간을 출력하고 종료합니다 (--measure-startup)
+
+def init_display():
+    """
+    화면과 폰트 모듈만 초기화하고 창을 엽니다 (소리/조이스틱은 쓰지 않으므로 초기화하지 않음).
+    모듈 import만으로는 창이 열리지 않습니다. 폰트는 get_font()가 처음 쓸 때 불러옵니다.
+    """
+    global screen, clock
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_caption("2048 게임") # 창 제목
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT)) # 화면 크기 설정
+    clock = pygame.time.Clock() # 프레임 속도 제어를 위한 Clock 객체
+    startup_times['display'] = time.perf_counter()
+
+def get_font(name):
+    """
+    이름 ('large', 'tile', 'medium', 'small', 'subliminal', 'title')에 해당하는 폰트를 반환합니다.
+    처음 쓸 때 Jua.ttf에서 불러오고, 파일이 없으면 Pygame 기본 폰트를 씁니다.
+    """
+    global font_path
+    font = fonts.get(name)
+    if font is not None:
+        return font
+    size = TILE_SIZE * 3 // 5 if name == 'tile' else FONT_SIZES[name] # 4x4에서 타일 숫자는 'large'와 같은 크기
+    if font_path is not None:
+        try:
+            font = pygame.font.Font(font_path, size)
+        except (OSError, pygame.error):
+            print("Jua.ttf 폰트를 찾을 수 없습니다. Pygame 기본 폰트를 사용합니다.")
+            font_path = None
+    if font is None:
+        font = pygame.font.Font(None, size)
+    fonts[name] = font
+    return font
+
+def get_profiler_font():
+    """프로파일러 오버레이용 고정폭 폰트 (시스템 폰트 검색이 느리므로 오버레이를 처음 그릴 때 찾습니다)"""
+    global font_profiler
+    if font_profiler is None:
+        font_profiler = pygame.font.SysFont("monospace", 14)
+    return font_profiler
+
+def get_tile_sprites():
+    """타일 스프라이트 캐시를 반환합니다 (처음 쓸 때 타일 폰트와 함께 만듭니다)."""
+    global tile_sprite_cache
+    if tile_sprite_cache is None:
+        tile_sprite_cache = tile_sprites.TileSpriteCache(get_font('tile'), TILE_SIZE, get_tile_color, TEXT_COLOR,
+                                                         TILE_FRAMES)
+    return tile_sprite_cache
+
+def warm_up_assets():
+    """
+    시작 화면을 띄운 뒤 게임 화면에 필요한 자원 (배경 레이어, 타일 스프라이트, 폰트, 종료 화면)을
+    한 단계씩 미리 준비하는 제너레이터입니다. game_loop()가 프레임 사이에 WARM_UP_SLICE만큼씩 진행합니다.
+    """
+    get_background_layer('game')
+    yield
+    sprites = get_tile_sprites()
+    value = 2
+    while value <= 2048:
+        sprites.sheet(value)
+        yield
+        value *= 2
+    get_font('subliminal')
+    yield
+    for status in ('win', 'lose'):
+        get_end_overlay(status)
+        yield
+
+def report_startup():
+    """--measure-startup: 모듈 실행 시작부터 각 단계까지 걸린 시간을 출력합니다."""
+    launch = startup_times['launch']
+    previous = launch
+    for stage, label in (('imports', "모듈 import"), ('display', "창 열기"), ('first_frame', "첫 프레임"),
+                         ('warm_up', "자원 준비 완료")):
+        if stage in startup_times:
+            at = startup_times[stage]
+            print("+%7.1f ms  (누적 %7.1f ms)  %s" % ((at - previous) * 1000, (at - launch) * 1000, label))
+            previous = at
 
 # --- 헬퍼 함수 ---
 
@@ -128,293 +264,293 @@ def get_tile_color(value):
         return SUPER_TILE_COLOR
     return TILE_COLORS.get(value, TILE_COLORS[0]) # 기본적으로 빈 셀 색상 반환
 
-# --- 게임 로직 함수 ---
-
-def initialize_game():
-    """게임 보드와 상태를 초기화합니다."""
-    global game_board_state, is_game_over, is_game_won, active_subliminal_messages, next_tile_id, all_active_tiles, is_game_started 
-    game_board_state = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
-    is_game_over = False
-    is_game_won = False
-    is_game_started = False 
-    active_subliminal_messages = []
-    all_active_tiles = []
-    next_tile_id = 0
-
-def add_random_tile():
-    """무작위 빈 공간에 새 타일 (2 또는 4)을 추가합니다."""
-    global next_tile_id 
-    empty_cells = []
-    for r in range(BOARD_SIZE):
-        for c in range(BOARD_SIZE):
-            if game_board_state[r][c] is None:
-                empty_cells.append((r, c))
-
-    if empty_cells:
-        r, c = random.choice(empty_cells)
-        value = 2 if random.random() < 0.9 else 4
-        new_tile = Tile(value, r, c, next_tile_id) 
-        game_board_state[r][c] = new_tile
-        all_active_tiles.append(new_tile) 
-        next_tile_id += 1 
-        return True
-    return False
-
-def is_board_full():
-    """보드가 완전히 채워졌는지 확인합니다."""
-    for r in range(BOARD_SIZE):
-        for c in range(BOARD_SIZE):
-            if game_board_state[r][c] is None:
-                return False
-    return True
-
-def can_move():
-    """이동 가능한 타일이 있는지 확인합니다 (게임 오버 조건)."""
-    if not is_board_full():
-        return True # 빈 공간이 있으면 이동 가능
+# --- 게임 화면 상태 (규칙 상태는 game.Game) ---
 
-    for r in range(BOARD_SIZE):
-        for c in range(BOARD_SIZE):
-            current_tile = game_board_state[r][c]
-            if current_tile is None: continue
-
-            # 오른쪽 타일과 비교
-            if c < BOARD_SIZE - 1:
-                other_tile = game_board_state[r][c+1]
-                if other_tile is None or other_tile.value == current_tile.value:
-                    return True
-            # 아래쪽 타일과 비교
-            if r < BOARD_SIZE - 1:
-                other_tile = game_board_state[r+1][c]
-                if other_tile is None or other_tile.value == current_tile.value:
-                    return True
-    return False # 이동할 수 있는 타일이 없음
-
-def slide_and_merge_line(line_of_tiles, is_reverse):
+class GameScreen:
     """
-    한 줄 (행 또는 열)의 타일을 이동하고 합칩니다.
-    Tile 객체를 직접 처리하며, 병합된 타일과 사라지는 타일을 반환합니다.
+    게임 하나 (game.Game)를 화면에 보여 주는 상태입니다: 타일 상태 배열 (tile_store.TileStore), 애니메이션 타임라인,
+    서브리미널 메시지, 자동 진행/힌트 표시. 규칙 상태는 모두 self.game에 있고, 이 객체는 Game이 알려 준 이동 정보로
+    애니메이션만 만듭니다.
     """
-    filtered_tiles = [tile for tile in line_of_tiles if tile is not None]
-
-    processed_tiles = []
-    merged_results_for_animation = [] 
-    disappearing_tiles_for_animation = [] 
-
-    if is_reverse: # 오른쪽 또는 아래로 이동 (moves to end of list)
-        i = len(filtered_tiles) - 1
-        while i >= 0:
-            current_tile = filtered_tiles[i]
-            if i > 0 and filtered_tiles[i-1].value == current_tile.value:
-                # 병합
-                merged_value = current_tile.value * 2
-                kept_tile = filtered_tiles[i-1] 
-                
-                # kept_tile의 속성 업데이트
-                kept_tile.value = merged_value
-                kept_tile.is_merged_result = True
-                kept_tile.animation_start_time = time.time() 
-
-                # 사라지는 타일
-                disappearing_tile = current_tile
-                disappearing_tile.is_disappearing = True
-                disappearing_tile.animation_start_time = time.time()
-                disappearing_tiles_for_animation.append(disappearing_tile)
-
-                processed_tiles.insert(0, kept_tile) 
-                merged_results_for_animation.append(kept_tile)
-                i -= 2 
-            else:
-                processed_tiles.insert(0, current_tile) 
-                i -= 1
-        new_line = [None] * (BOARD_SIZE - len(processed_tiles)) + processed_tiles 
-    else: # 왼쪽 또는 위로 이동 (moves to beginning of list)
-        i = 0
-        while i < len(filtered_tiles):
-            current_tile = filtered_tiles[i]
-            if i + 1 < len(filtered_tiles) and filtered_tiles[i+1].value == current_tile.value:
-                # 병합
-                merged_value = current_tile.value * 2
-                kept_tile = current_tile 
-                
-                # kept_tile의 속성 업데이트
-                kept_tile.value = merged_value
-                kept_tile.is_merged_result = True
-                kept_tile.animation_start_time = time.time()
-
-                # 사라지는 타일
-                disappearing_tile = filtered_tiles[i+1]
-                disappearing_tile.is_disappearing = True
-                disappearing_tile.animation_start_time = time.time()
-                disappearing_tiles_for_animation.append(disappearing_tile)
-
-                processed_tiles.append(kept_tile)
-                merged_results_for_animation.append(kept_tile)
-                i += 2 
-            else:
-                processed_tiles.append(current_tile)
-                i += 1
-        new_line = processed_tiles + [None] * (BOARD_SIZE - len(processed_tiles))
-    return new_line, merged_results_for_animation, disappearing_tiles_for_animation
-
-def move(direction):
-    """방향에 따라 타일 이동을 처리합니다."""
-    global game_board_state, all_active_tiles, active_subliminal_messages
-    
-    # 이동 전 보드 상태를 깊은 복사하여 저장 (타일 객체 참조 유지)
-    old_board_state = [[game_board_state[r][c] for c in range(BOARD_SIZE)] for r in range(BOARD_SIZE)]
-    
-    moved_anything = False
-    merged_result_tiles_for_messages = []
-    
-    # 모든 활성 타일의 애니메이션 시작 위치를 현재 위치로 설정하고 플래그 초기화
-    for tile in all_active_tiles:
-        # 현재 논리적 위치를 기반으로 start_x, start_y를 다시 계산
-        tile.start_x, tile.start_y = get_tile_pixel_pos(tile.current_row, tile.current_col)
-        tile.animation_start_time = time.time()
-        tile.is_new = False
-        tile.is_merged_result = False
-        tile.is_disappearing = False
-
-    # 임시 새 보드 상태 생성
-    temp_new_board_state = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
-    
-    # 사라질 타일들을 임시로 저장 (all_active_tiles에 추가될 것임)
-    temp_disappearing_tiles = []
-
-    if direction == 'left':
-        for r in range(BOARD_SIZE):
-            line_of_tiles = [old_board_state[r][c] for c in range(BOARD_SIZE)]
-            # 'left' 방향은 is_reverse=False (시작점 방향으로 이동)
-            new_line, merged_results, disappearing = slide_and_merge_line(line_of_tiles, False) 
-            for c in range(BOARD_SIZE):
-                temp_new_board_state[r][c] = new_line[c]
-                if new_line[c] is not None:
-                    new_line[c].current_row = r
-                    new_line[c].current_col = c
-                    new_line[c].end_x, new_line[c].end_y = get_tile_pixel_pos(r, c)
-            merged_result_tiles_for_messages.extend(merged_results)
-            temp_disappearing_tiles.extend(disappearing)
-
-    elif direction == 'right':
-        for r in range(BOARD_SIZE):
-            line_of_tiles = [old_board_state[r][c] for c in range(BOARD_SIZE)]
-            # 'right' 방향은 is_reverse=True (끝점 방향으로 이동)
-            new_line, merged_results, disappearing = slide_and_merge_line(line_of_tiles, True) 
-            for c in range(BOARD_SIZE):
-                temp_new_board_state[r][c] = new_line[c]
-                if new_line[c] is not None:
-                    new_line[c].current_row = r
-                    new_line[c].current_col = c
-                    new_line[c].end_x, new_line[c].end_y = get_tile_pixel_pos(r, c)
-            merged_result_tiles_for_messages.extend(merged_results)
-            temp_disappearing_tiles.extend(disappearing)
-
-    elif direction == 'up':
-        for c in range(BOARD_SIZE):
-            line_of_tiles = [old_board_state[r][c] for r in range(BOARD_SIZE)]
-            # 'up' 방향은 is_reverse=False (시작점 방향으로 이동)
-            new_col, merged_results, disappearing = slide_and_merge_line(line_of_tiles, False) 
-            for r in range(BOARD_SIZE):
-                temp_new_board_state[r][c] = new_col[r]
-                if new_col[r] is not None:
-                    new_col[r].current_row = r
-                    new_col[r].current_col = c
-                    new_col[r].end_x, new_col[r].end_y = get_tile_pixel_pos(r, c)
-            merged_result_tiles_for_messages.extend(merged_results)
-            temp_disappearing_tiles.extend(disappearing)
-
-    elif direction == 'down':
-        for c in range(BOARD_SIZE):
-            line_of_tiles = [old_board_state[r][c] for r in range(BOARD_SIZE)]
-            # 'down' 방향은 is_reverse=True (끝점 방향으로 이동)
-            new_col, merged_results, disappearing = slide_and_merge_line(line_of_tiles, True) 
-            for r in range(BOARD_SIZE):
-                temp_new_board_state[r][c] = new_col[r]
-                if new_col[r] is not None:
-                    new_col[r].current_row = r
-                    new_col[r].current_col = c
-                    new_col[r].end_x, new_col[r].end_y = get_tile_pixel_pos(r, c)
-            merged_result_tiles_for_messages.extend(merged_results)
-            temp_disappearing_tiles.extend(disappearing)
-
-    # 보드에 변화가 있었는지 확인 (이동 또는 병합)
-    old_tile_ids = set()
-    for r in range(BOARD_SIZE):
-        for c in range(BOARD_SIZE):
-            if old_board_state[r][c] is not None:
-                old_tile_ids.add(old_board_state[r][c].id)
-    
-    new_tile_ids = set()
-    for r in range(BOARD_SIZE):
-        for c in range(BOARD_SIZE):
-            if temp_new_board_state[r][c] is not None:
-                new_tile_ids.add(temp_new_board_state[r][c].id)
-
-    if old_tile_ids != new_tile_ids: 
-        moved_anything = True
-    else: 
-        for r in range(BOARD_SIZE):
-            for c in range(BOARD_SIZE):
-                old_tile = old_board_state[r][c]
-                new_tile = temp_new_board_state[r][c]
-                if (old_tile is None and new_tile is not None) or \
-                   (old_tile is not None and new_tile is None) or \
-                   (old_tile is not None and new_tile is not None and \
-                    (old_tile.id != new_tile.id or old_tile.value != new_tile.value)):
-                    moved_anything = True
-                    break
-            if moved_anything:
-                break
 
-    if moved_anything:
-        game_board_state = temp_new_board_state 
-        add_random_tile() 
+    __slots__ = ('game', 'tiles', 'cell_slots', 'active_subliminal_messages',
+                 'is_game_started', 'animation_timeline', 'is_autoplay', 'hint_direction', 'last_autoplay_time',
+                 'effect_rng', 'corpus_moves', 'is_ai_assisted')
+
+    def __init__(self):
+        self.game = None # 현재 게임 (시작 화면에서는 None)
+        cells = [get_tile_pixel_pos(*divmod(i, BOARD_SIZE)) for i in range(BOARD_SIZE * BOARD_SIZE)]
+        self.tiles = tile_store.TileStore(tuple(x for x, _ in cells), tuple(y for _, y in cells),
+                                          FADE_FRAMES, PULSE_FRAMES) # 화면에 그릴 모든 타일 (이동 중, 사라지는 중 포함)
+        self.animation_timeline = timeline.Timeline() # 모든 애니메이션 트윈
+        self.effect_rng = random.Random() # 서브리미널 메시지 등 연출용 난수 생성기 (새 타일 순서에 영향을 주지 않도록 분리)
+        self.last_autoplay_time = 0 # 마지막 자동 진행 수의 시각
+        self.corpus_moves = None # --corpus일 때 현재 게임의 수 (corpus.MoveBuffer, 게임을 떠날 때 말뭉치에 덧붙임)
+        self.is_ai_assisted = False # 현재 게임에서 자동 진행이 한 수라도 두었는지 (말뭉치 출처)
+        self.reset()
+
+    def reset(self):
+        """시작 화면으로 돌아갑니다 (게임과 애니메이션을 버림)."""
+        self.commit_corpus_game()
+        self.game = None
+        self.tiles.clear()
+        self.cell_slots = [-1] * (BOARD_SIZE * BOARD_SIZE) # 칸 번호 -> 그 칸에 있는 타일의 슬롯 (없으면 -1, 애니메이션용)
+        self.active_subliminal_messages = {} # 활성화된 서브리미널 메시지 {id(메시지): 메시지}
+        self.is_game_started = False
+        self.animation_timeline.clear()
+        self.is_autoplay = False # 자동 진행 모드 (A 키)
+        self.hint_direction = None # 힌트로 표시할 방향 (H 키)
+
+    def start(self):
+        """새 게임을 시작합니다 (시작 화면 숨기기, 시드 정하기, 처음 두 타일 페이드인)."""
+        self.reset()
+        self.game = game.Game(BOARD_SIZE, fixed_seed)
+        self.effect_rng = random.Random(self.game.seed)
+        if corpus_writer is not None:
+            self.corpus_moves = corpus.MoveBuffer()
+            self.game.recorder = self.corpus_moves.recorder(self.game)
+            self.is_ai_assisted = False
+        self.is_game_started = True
+        self.rebuild_tiles()
+        for slot in self.tiles.slots():
+            self.animation_timeline.add(slot, self.tiles.tween_fade_in, MOVE_ANIMATION_DURATION, TILE_TWEENS)
+
+    @property
+    def is_game_over(self):
+        return self.game is not None and self.game.status == 'lose'
+
+    @property
+    def is_game_won(self):
+        return self.game is not None and self.game.status == 'win'
+
+    def add_tile(self, r, c, value):
+        """(r, c)에 타일을 추가하고 슬롯 번호를 반환합니다 (빈 슬롯을 다시 씀)."""
+        cell = r * BOARD_SIZE + c
+        slot = self.tiles.add(value, cell, TILE_FRAME_FULL)
+        self.cell_slots[cell] = slot
+        return slot
+
+    def move(self, direction):
+        """방향에 따라 타일 이동을 처리합니다. 보드가 바뀌었으면 True를 반환합니다."""
+        if self.game is None or not self.game.board.is_legal(direction):
+            return False # 보드가 바뀌지 않는 방향은 O(1)에 건너뜁니다
+        was_over = self.game.status is not None
+        trace = [] # 각 타일이 어디로 갔는지 (애니메이션용)
+        if self.game.move(direction, trace) is None:
+            return False
+
+        # 이하 타일 배열 갱신은 애니메이션 용도입니다.
+        self.hint_direction = None # 보드가 바뀌었으므로 이전 힌트는 무효
+        animation_timeline = self.animation_timeline
+        tiles = self.tiles
+
+        # 이전 이동의 애니메이션은 즉시 끝내고 (사라지는 타일은 이때 제거됨), 현재 위치에서 새로 시작합니다.
+        animation_timeline.finish_group(TILE_TWEENS)
+        tiles.settle()
+
+        cell_slots = self.cell_slots
+        new_cell_slots = [-1] * len(cell_slots)
+        merged_cells = []
+        for src_r, src_c, dst_r, dst_c, kind in trace:
+            slot = cell_slots[src_r * BOARD_SIZE + src_c]
+            if kind == game_core.TRACE_VANISH:
+                # 사라지는 타일은 제자리에서 페이드아웃한 뒤 슬롯을 돌려줌
+                animation_timeline.add(slot, tiles.tween_fade_out, MOVE_ANIMATION_DURATION, TILE_TWEENS, tiles.remove)
+                continue
+            dst = dst_r * BOARD_SIZE + dst_c
+            if kind == game_core.TRACE_MERGE:
+                tiles.value[slot] *= 2
+                animation_timeline.add(slot, tiles.tween_pulse, MERGE_ANIMATION_DURATION, TILE_TWEENS)
+                merged_cells.append((dst_r, dst_c))
+            if tiles.cell[slot] != dst:
+                tiles.cell[slot] = dst
+                animation_timeline.add(slot, tiles.tween_move, MOVE_ANIMATION_DURATION, TILE_TWEENS)
+            new_cell_slots[dst] = slot
+        self.cell_slots = new_cell_slots
+
+        # 새 타일 (위치와 값은 Game이 게임 시드와 타일 번호로 정함)
+        if self.game.last_spawn is not None:
+            new_slot = self.add_tile(*self.game.last_spawn)
+            animation_timeline.add(new_slot, tiles.tween_fade_in, MOVE_ANIMATION_DURATION, TILE_TWEENS)
 
         # 병합된 타일에 대한 서브리미널 메시지 트리거
-        for tile in merged_result_tiles_for_messages:
-            show_subliminal_message(tile.current_row, tile.current_col)
-        
-        # all_active_tiles 목록을 재구성:
-        updated_active_tiles = []
-        for r in range(BOARD_SIZE):
-            for c in range(BOARD_SIZE):
-                if game_board_state[r][c] is not None:
-                    updated_active_tiles.append(game_board_state[r][c])
-        
-        # 사라지는 타일 중 애니메이션이 끝나지 않은 타일만 추가
-        for tile in temp_disappearing_tiles:
-            if tile.is_disappearing: 
-                updated_active_tiles.append(tile)
-        
-        all_active_tiles = updated_active_tiles
+        for r, c in merged_cells:
+            self.show_subliminal_message(r, c)
+        if not was_over and self.game.status is not None:
+            self.save_replay() # 게임이 끝난 순간의 리플레이를 남깁니다
         return True
-    return False
 
-def check_game_status():
-    """승리/패배 조건을 확인합니다."""
-    global is_game_over, is_game_won
-    for r in range(BOARD_SIZE):
-        for c in range(BOARD_SIZE):
-            current_tile = game_board_state[r][c]
-            if current_tile is not None and current_tile.value == 2048:
-                is_game_won = True
-                end_game('win')
-                return
-
-    if not can_move():
-        is_game_over = True
-        end_game('lose')
-
-def end_game(status):
-    """게임 종료 및 결과 메시지를 표시합니다."""
-    global is_game_started 
-    is_game_started = False 
-    
-    game_result_text = ''
-    game_result_color = None
-    try_again_button_text = "다시 시도" # 기본 텍스트
+    def rebuild_tiles(self):
+        """진행 중인 타일 애니메이션을 버리고 현재 보드에서 타일 배열을 다시 채웁니다 (시작, 되돌리기 후)."""
+        for tween in [t for t in self.animation_timeline.tweens if t.group == TILE_TWEENS]:
+            self.animation_timeline.cancel(tween)
+        self.tiles.clear()
+        self.cell_slots = [-1] * (BOARD_SIZE * BOARD_SIZE)
+        for r, row in enumerate(self.game.values()):
+            for c, value in enumerate(row):
+                if value:
+                    self.add_tile(r, c, value)
+
+    def undo(self):
+        """마지막 수를 되돌립니다 (게임 종료 화면에서도 동작). 되돌렸으면 True를 반환합니다."""
+        if self.game is None or not self.game.undo():
+            return False
+        self.rebuild_tiles()
+        self.hint_direction = None
+        return True
+
+    def redo(self):
+        """되돌린 수를 다시 둡니다 (같은 방향으로 이동하면 같은 새 타일이 나옵니다). 다시 뒀으면 True를 반환합니다."""
+        direction = self.game.redo_direction() if self.game is not None else None
+        if direction is None:
+            return False
+        return self.move(direction)
+
+    def choose_ai_move(self):
+        """
+        탐색이 추천하는 방향을 반환합니다. 테이블베이스가 있으면 그 보드 크기에서는 완벽한 수를 고르고,
+        expectimax는 4x4 비트보드에서만 동작하므로 그 외 크기에서는 None입니다.
+        """
+        board = self.game.board
+        if ai_tablebase is not None:
+            return ai_tablebase.best_move(self.game.values())
+        if not isinstance(board, game_core.BitBoard):
+            return None
+        legal = board.legal_moves()
+        if len(legal) <= 1:
+            return legal[0] if legal else None # 고를 것이 없으면 탐색하지 않음
+        if ai_network is not None:
+            return ai_network.best_move(board.bits)
+        if ai_searcher is not None:
+            return ai_searcher.best_move(board.bits, AI_TIME_BUDGET * 1000)
+        return expectimax.best_move(board.bits, AI_MAX_DEPTH, AI_TIME_BUDGET)
+
+    def show_hint(self):
+        """현재 보드에서 탐색이 추천하는 방향을 힌트로 표시합니다."""
+        self.hint_direction = self.choose_ai_move()
+
+    def autoplay_step(self):
+        """자동 진행 모드에서 간격이 지났으면 탐색이 고른 방향으로 한 수 둡니다. 수를 뒀으면 True를 반환합니다."""
+        now = self.animation_timeline.now
+        if now - self.last_autoplay_time < AUTOPLAY_MOVE_INTERVAL:
+            return False
+        self.last_autoplay_time = now
+        direction = self.choose_ai_move()
+        if direction is None or not self.move(direction):
+            return False
+        self.is_ai_assisted = True
+        return True
+
+    def commit_corpus_game(self):
+        """
+        --corpus일 때 현재 게임의 수를 말뭉치에 덧붙이고 커밋합니다 (새 게임을 시작하거나 종료할 때).
+        되돌린 뒤 이어서 둘 수 있으므로 게임이 끝난 순간이 아니라 게임을 떠날 때 한 번만 덧붙이고,
+        자동 진행이 한 수라도 두었으면 봇 게임 (SOURCE_BOT)으로 기록합니다.
+        """
+        if self.corpus_moves is None:
+            return
+        corpus_writer.extend(self.corpus_moves, corpus.SOURCE_BOT if self.is_ai_assisted else corpus.SOURCE_HUMAN)
+        corpus_writer.flush()
+        self.corpus_moves = None
+
+    def save_replay(self):
+        """--record로 경로를 지정했으면 현재 게임의 리플레이를 저장합니다."""
+        if replay_path is not None and self.game is not None:
+            self.game.replay.save(replay_path)
+
+    def show_subliminal_message(self, row, col):
+        """활성화된 메시지 목록에 서브리미널 메시지를 추가합니다."""
+        message_text = self.effect_rng.choice(SUBLIMINAL_MESSAGES)
+        x, y = get_tile_pixel_pos(row, col) # 타일의 실제 픽셀 위치
+
+        # 메시지가 타일 중앙에서 살짝 위로 나타나도록 조정
+        message_x = x + TILE_SIZE // 2
+        message_y = y + TILE_SIZE // 2 - 20
+        message = {
+            'text': message_text,
+            'x': message_x,
+            'y': message_y,
+            'alpha': 255,
+            'initial_y': message_y # 위로 움직임을 위한 초기 Y 좌표 저장
+        }
+        self.active_subliminal_messages[id(message)] = message
+        self.animation_timeline.add(message, tween_subliminal_message, SUBLIMINAL_MESSAGE_DURATION,
+                                    on_finish=self.remove_subliminal_message)
+
+    def remove_subliminal_message(self, message):
+        """애니메이션이 끝난 메시지를 목록에서 제거합니다 (O(1))."""
+        self.active_subliminal_messages.pop(id(message), None)
+
+    # --- 화면 갱신 영역 계산 ---
+
+    def is_animation_active(self):
+        """
+        화면에 움직이는 요소 (타임라인의 트윈, 자동 진행)가 있는지 확인합니다.
+        자동 진행은 게임이 끝나면 (status가 None이 아니면) 더 두지 않으므로 세지 않습니다 (대기 상태로 돌아감).
+        """
+        return self.is_game_started and (self.animation_timeline.is_active()
+                                         or (self.is_autoplay and self.game.status is None))
+
+    def get_dirty_rects(self):
+        """
+        이번 프레임에 바뀔 수 있는 화면 영역 목록을 반환합니다.
+        진행 중인 트윈과 이번 프레임에 끝난 트윈 (마지막 모습을 그려야 하므로)의 대상을 포함합니다.
+        """
+        if not self.is_game_started:
+            return []
+        rects = []
+        tiles = self.tiles
+        cell_x, cell_y = tiles.cell_x, tiles.cell_y
+        for tween in self.animation_timeline.tweens + self.animation_timeline.finished:
+            target = tween.target
+            if type(target) is int:
+                # 타일 (슬롯 번호): 이동 경로 전체 (시작 ~ 끝 칸)와 펄스로 커지는 여유 공간
+                start, end = tiles.start_cell[target], tiles.cell[target]
+                rect = pygame.Rect(cell_x[start], cell_y[start], TILE_SIZE, TILE_SIZE)
+                rect.union_ip(pygame.Rect(cell_x[end], cell_y[end], TILE_SIZE, TILE_SIZE))
+                rects.append(rect.inflate(MERGE_PULSE_MARGIN, MERGE_PULSE_MARGIN))
+            else:
+                # 서브리미널 메시지가 떠오르는 경로 전체
+                width, height = get_font('subliminal').size(target['text'])
+                rect = pygame.Rect(0, 0, width, height + SUBLIMINAL_MESSAGE_RISE)
+                rect.midbottom = (target['x'], target['initial_y'] + height // 2 + 1)
+                rects.append(rect)
+        return rects
+
+def quit_game(view):
+    """리플레이, 말뭉치와 프로파일 히스토그램을 저장하고 (탐색 작업자를 멈춘 뒤) 종료합니다."""
+    view.save_replay()
+    if corpus_writer is not None:
+        view.commit_corpus_game()
+        corpus_writer.close()
+    if profile_dump_path is not None:
+        profiler.dump(profile_dump_path)
+    if ai_searcher is not None:
+        ai_searcher.close()
+    if ai_network is not None:
+        ai_network.close()
+    if ai_tablebase is not None:
+        ai_tablebase.close()
+    pygame.quit()
+    sys.exit()
+
+def get_try_again_button_rect():
+    """게임 종료 화면의 '다시 시도' 버튼 영역을 반환합니다."""
+    try_again_button_rect = pygame.Rect(0, 0, 200, 60)
+    try_again_button_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50)
+    return try_again_button_rect
+
+def get_end_overlay(status):
+    """
+    게임 종료 화면 (반투명 덮개 + 테두리 있는 결과 문구 + '다시 시도' 버튼)을 한 장의 Surface로 반환합니다.
+    상태와 화면 크기별로 처음 한 번만 합성하고, 이후에는 매 프레임 타일 위에 그대로 덮어 그립니다.
+    """
+    key = (status, screen.get_size())
+    overlay = end_overlays.get(key)
+    if overlay is not None:
+        return overlay
 
+    try_again_button_text = "다시 시도" # 기본 텍스트
     if status == 'win':
         game_result_text = 'I\'ve grown up perfectly!'
         game_result_color = WIN_COLOR
@@ -422,71 +558,40 @@ def end_game(status):
         game_result_text = 'I\'ve grown up one more time!'
         game_result_color = LOSE_COLOR
         try_again_button_text = "Growing Up Again" # 패배 시 문구 변경
-    
+
     # 화면을 반투명하게 덮습니다.
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
     overlay.fill((255, 255, 255, 150)) # 흰색에 투명도 150
-    screen.blit(overlay, (0, 0))
 
-    # 메시지 텍스트 렌더링 (폰트 크기 font_jua_medium으로 변경)
-    # 테두리 효과를 위해 검은색 텍스트를 여러 번 오프셋하여 그립니다.
+    # 테두리 효과: 검은색 문구를 한 번만 렌더링하고 주변 오프셋에 여러 번 찍습니다.
+    text_center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50)
+    border_text_surface = get_font('medium').render(game_result_text, True, BLACK)
     border_offset = 2 # 테두리 두께 조절
     for dx in range(-border_offset, border_offset + 1):
         for dy in range(-border_offset, border_offset + 1):
             if dx != 0 or dy != 0: # 중앙은 제외
-                border_text_surface = font_jua_medium.render(game_result_text, True, BLACK)
-                border_text_rect = border_text_surface.get_rect(center=(SCREEN_WIDTH // 2 + dx, SCREEN_HEIGHT // 2 - 50 + dy))
-                screen.blit(border_text_surface, border_text_rect)
+                overlay.blit(border_text_surface, border_text_surface.get_rect(center=(text_center[0] + dx, text_center[1] + dy)))
+    text_surface = get_font('medium').render(game_result_text, True, game_result_color)
+    overlay.blit(text_surface, text_surface.get_rect(center=text_center))
 
-    # 실제 텍스트를 그립니다.
-    text_surface = font_jua_medium.render(game_result_text, True, game_result_color) 
-    text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-    screen.blit(text_surface, text_rect)
+    # '다시 시도' 버튼
+    try_again_button_rect = get_try_again_button_rect()
+    draw_rounded_rect(overlay, BUTTON_COLOR, try_again_button_rect, 10)
+    try_again_text_surface = get_font('small').render(try_again_button_text, True, WHITE)
+    overlay.blit(try_again_text_surface, try_again_text_surface.get_rect(center=try_again_button_rect.center))
 
-    # '다시 시도' 버튼 렌더링 (폰트 크기 font_jua_small으로 변경)
-    try_again_button_rect = pygame.Rect(0, 0, 200, 60)
-    try_again_button_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50)
-    draw_rounded_rect(screen, BUTTON_COLOR, try_again_button_rect, 10)
-    try_again_text_surface = font_jua_small.render(try_again_button_text, True, WHITE) # 변경된 텍스트 사용
-    try_again_text_rect = try_again_text_surface.get_rect(center=try_again_button_rect.center)
-    screen.blit(try_again_text_surface, try_again_text_rect)
-    pygame.display.flip() # 화면 업데이트
-
-    # 버튼 클릭 또는 종료 대기
-    waiting_for_input = True
-    while waiting_for_input:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if try_again_button_rect.collidepoint(event.pos):
-                    waiting_for_input = False
-                    start_game() # 게임 재시작
-
-def show_subliminal_message(row, col):
-    """활성화된 메시지 목록에 서브리미널 메시지를 추가합니다."""
-    message_text = random.choice(SUBLIMINAL_MESSAGES)
-    x, y = get_tile_pixel_pos(row, col) # 타일의 실제 픽셀 위치
-    
-    # 메시지가 타일 중앙에서 살짝 위로 나타나도록 조정
-    message_x = x + TILE_SIZE // 2
-    message_y = y + TILE_SIZE // 2 - 20 
-    active_subliminal_messages.append({
-        'text': message_text,
-        'x': message_x,
-        'y': message_y,
-        'start_time': time.time(),
-        'initial_y': message_y # 위로 움직임을 위한 초기 Y 좌표 저장
-    })
+    end_overlays[key] = overlay
+    return overlay
 
 # --- 그리기 함수 ---
 
-def draw_background_text():
-    """배경에 'You're valuable.' 텍스트를 반복해서 그립니다."""
+def draw_background_text(surface=None):
+    """배경에 'You're valuable.' 텍스트를 반복해서 그립니다 (기본 대상은 screen)."""
+    if surface is None:
+        surface = screen
     text_content = "You're valuable."
     # 텍스트 표면을 한 번만 생성하고 회전
-    text_surface_raw = font_jua_small.render(text_content, True, (255, 165, 0)) # 오렌지색
+    text_surface_raw = get_font('small').render(text_content, True, (255, 165, 0)) # 오렌지색
     rotated_text_surface = pygame.transform.rotate(text_surface_raw, 45) # 45도 회전
     
     # 투명도 조절을 위해 알파 채널이 있는 새 Surface 생성
@@ -506,238 +611,313 @@ def draw_background_text():
     # 화면 경계를 넘어가는 부분도 그리기 위해 시작점을 음수로 설정합니다.
     for x_offset in range(-rotated_text_rect.width, SCREEN_WIDTH + rotated_text_rect.width, spacing_x):
         for y_offset in range(-rotated_text_rect.height, SCREEN_HEIGHT + rotated_text_rect.height, spacing_y):
-            screen.blit(alpha_surface, (x_offset, y_offset))
+            surface.blit(alpha_surface, (x_offset, y_offset))
 
+def get_game_container_rect():
+    """게임 컨테이너 (주황색 배경) 영역을 반환합니다."""
+    return pygame.Rect(
+        (SCREEN_WIDTH - BOARD_WIDTH) // 2, 
+        (SCREEN_HEIGHT - BOARD_HEIGHT) // 2 + 30, # 헤더 공간을 위해 조정
+        BOARD_WIDTH, 
+        BOARD_HEIGHT + 70 # 헤더 공간 추가
+    )
+
+def get_reset_button_rect():
+    """'Reset' 버튼 영역을 반환합니다."""
+    game_container_rect = get_game_container_rect()
+    reset_button_rect = pygame.Rect(0, 0, 150, 40)
+    reset_button_rect.topright = (game_container_rect.right - 20, game_container_rect.top + 20)
+    return reset_button_rect
 
-def draw_game_board_elements():
-    """2048 게임 보드 요소 (격자 셀과 타일)를 그립니다."""
-    current_time = time.time()
+def draw_game_backdrop(surface):
+    """게임 화면에서 변하지 않는 부분 (컨테이너, 'Reset' 버튼, 빈 격자 셀)을 그립니다."""
+    draw_rounded_rect(surface, LIGHT_ORANGE_BG, get_game_container_rect(), 15)
 
-    board_offset_x = (SCREEN_WIDTH - BOARD_WIDTH) // 2
-    board_offset_y = (SCREEN_HEIGHT - BOARD_HEIGHT) // 2 + 30 + 60
+    # 헤더 (버튼) 그리기
+    reset_button_rect = get_reset_button_rect()
+    draw_rounded_rect(surface, BUTTON_COLOR, reset_button_rect, 10)
+    reset_text = get_font('small').render("Reset", True, WHITE) 
+    reset_text_rect = reset_text.get_rect(center=reset_button_rect.center)
+    surface.blit(reset_text, reset_text_rect)
 
     # 격자 셀 그리기
     for r in range(BOARD_SIZE):
         for c in range(BOARD_SIZE):
-            x = board_offset_x + GAP + c * (TILE_SIZE + GAP)
-            y = board_offset_y + GAP + r * (TILE_SIZE + GAP)
-            # 투명한 색상으로 둥근 사각형을 직접 그립니다.
-            draw_rounded_rect(screen, GRID_CELL_COLOR, pygame.Rect(x, y, TILE_SIZE, TILE_SIZE), 8)
-
-    # Draw and animate tiles
-    tiles_to_remove_from_active_list = []
-    # 먼저 사라지는 타일을 그립니다 (다른 타일 위에 그려지지 않도록)
-    for tile in all_active_tiles:
-        if tile.is_disappearing:
-            progress = (current_time - tile.animation_start_time) / MOVE_ANIMATION_DURATION
-            progress = min(1.0, max(0.0, progress)) # 0과 1 사이로 클램프
-
-            tile.alpha = int(255 * (1 - progress)) # 페이드 아웃
-            
-            # 사라지는 타일은 움직이지 않고 제자리에서 사라지게
-            interp_x = tile.start_x
-            interp_y = tile.start_y
-
-            if progress >= 1.0:
-                tiles_to_remove_from_active_list.append(tile) # 애니메이션 완료 시 제거
-
-            if tile.alpha > 0: # 완전히 투명해지기 전까지만 그림
-                tile_color = get_tile_color(tile.value)
-                tile_surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-                draw_rounded_rect(tile_surface, tile_color, tile_surface.get_rect(), 8, border_width=1, border_color=(0,0,0,30))
-                tile_surface.set_alpha(tile.alpha)
-                
-                tile_rect = tile_surface.get_rect(topleft=(interp_x, interp_y))
-                screen.blit(tile_surface, tile_rect)
-
-                # 숫자도 함께 페이드 아웃
-                text_surface = font_jua_large.render(str(tile.value), True, TEXT_COLOR)
-                text_surface.set_alpha(tile.alpha)
-                text_rect = text_surface.get_rect(center=tile_rect.center)
-                screen.blit(text_surface, text_rect)
-
-    # 그 다음 움직이거나 새로 생성된 타일을 그립니다.
-    for tile in all_active_tiles:
-        if not tile.is_disappearing: # 사라지는 타일은 위에서 이미 그림
-            progress = (current_time - tile.animation_start_time) / MOVE_ANIMATION_DURATION
-            progress = min(1.0, max(0.0, progress)) # 0과 1 사이로 클램프
-
-            # 이동 애니메이션
-            interp_x = tile.start_x + (tile.end_x - tile.start_x) * progress
-            interp_y = tile.start_y + (tile.end_y - tile.start_y) * progress
-
-            # 새로 생성된 타일 페이드인
-            if tile.is_new:
-                tile.alpha = int(255 * progress)
-                if progress >= 1.0:
-                    tile.is_new = False # 애니메이션 완료
-                    tile.alpha = 255 # 페이드인 완료 후 완전히 불투명하게 설정
-            else:
-                tile.alpha = 255 # 기본적으로 완전히 불투명하게 설정
-
-            # 병합 결과 타일 애니메이션 (크기 펄스)
-            scale_factor = 1.0
-            if tile.is_merged_result:
-                merge_progress = (current_time - tile.animation_start_time) / MERGE_ANIMATION_DURATION
-                merge_progress = min(1.0, max(0.0, merge_progress))
-                if merge_progress < 0.5:
-                    scale_factor = 1.0 + 0.2 * merge_progress # 커짐
-                else:
-                    scale_factor = 1.1 - 0.2 * (merge_progress - 0.5) # 작아짐
-                if merge_progress >= 1.0:
-                    tile.is_merged_result = False # 애니메이션 완료
-
-            tile_color = get_tile_color(tile.value)
-            
-            # 타일 표면 생성 및 알파 적용
-            tile_surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-            draw_rounded_rect(tile_surface, tile_color, tile_surface.get_rect(), 8, border_width=1, border_color=(0,0,0,30))
-            tile_surface.set_alpha(tile.alpha)
-
-            # 병합 결과 타일 크기 조정
-            if scale_factor != 1.0:
-                scaled_width = int(TILE_SIZE * scale_factor)
-                scaled_height = int(TILE_SIZE * scale_factor)
-                tile_surface = pygame.transform.scale(tile_surface, (scaled_width, scaled_height))
-            
-            # 그리기 위치 조정 (중앙 정렬)
-            tile_rect = tile_surface.get_rect(center=(interp_x + TILE_SIZE // 2, interp_y + TILE_SIZE // 2))
-            screen.blit(tile_surface, tile_rect)
-
-            # 타일 값 그리기
-            text_surface = font_jua_large.render(str(tile.value), True, TEXT_COLOR)
-            text_rect = text_surface.get_rect(center=(interp_x + TILE_SIZE // 2, interp_y + TILE_SIZE // 2))
-            screen.blit(text_surface, text_rect)
-
-    # 애니메이션이 끝난 사라지는 타일 제거
-    for tile in tiles_to_remove_from_active_list:
-        if tile in all_active_tiles: # 중복 제거 방지
-            all_active_tiles.remove(tile)
+            x, y = get_tile_pixel_pos(r, c)
+            draw_rounded_rect(surface, GRID_CELL_COLOR, pygame.Rect(x, y, TILE_SIZE, TILE_SIZE), 8)
 
+def get_background_layer(kind):
+    """
+    정적 배경 레이어를 반환합니다 ('start': 배경 텍스트, 'game': 배경 텍스트 + 게임 컨테이너).
+    처음 요청될 때 한 번만 그리고, 화면 크기가 바뀌거나 invalidate_background_layers()가 호출될 때까지 재사용합니다.
+    """
+    key = (kind, screen.get_size())
+    layer = background_layers.get(key)
+    if layer is None:
+        layer = pygame.Surface(screen.get_size()).convert()
+        layer.fill(WHITE)
+        draw_background_text(layer)
+        if kind == 'game':
+            draw_game_backdrop(layer)
+        background_layers[key] = layer
+    return layer
+
+def invalidate_background_layers():
+    """화면 크기나 배경 색상/폰트가 바뀌었을 때 배경 레이어와 종료 화면을 다시 그리도록 비웁니다."""
+    background_layers.clear()
+    end_overlays.clear()
+
+
+def draw_game_board_elements(view):
+    """2048 게임 보드의 타일과 서브리미널 메시지를 그립니다 (위치와 애니메이션 프레임은 타임라인이 갱신)."""
+    # 격자 셀은 배경 레이어 (get_background_layer('game'))에 이미 그려져 있습니다.
+    # 타일은 값별 스프라이트 시트에서 프레임 (페이드/펄스 단계) 영역을 찾아 blit 한 번으로 그립니다.
+    # 타일 상태 배열을 층마다 슬롯 순서로 나란히 훑고, 빈 슬롯 (값 0)은 건너뜁니다.
+    # 사라지는 타일, 멈춰 있거나 움직이는 타일, 페이드인 중인 새 타일 순서입니다 (완전히 투명한 프레임은 건너뜀).
+    sheet = get_tile_sprites().sheet
+    tiles = view.tiles
+    columns = (tiles.value, tiles.frame, tiles.x, tiles.y, tiles.layer)
+    for layer in tile_store.LAYERS:
+        if layer not in tiles.layer:
+            continue # 대부분의 프레임에는 멈춰 있는 층만 있습니다
+        for value, frame, x, y, tile_layer in zip(*columns):
+            if value and tile_layer == layer:
+                sheet(value).blit(screen, frame, x, y)
+    profiler.mark('tiles')
 
     # 서브리미널 메시지 그리기
-    messages_to_remove = []
-    for msg in active_subliminal_messages:
-        elapsed = current_time - msg['start_time']
-        if elapsed < SUBLIMINAL_MESSAGE_DURATION:
-            alpha = max(0, int(255 * (1 - (elapsed / SUBLIMINAL_MESSAGE_DURATION))))
-            current_y = msg['initial_y'] - (elapsed / SUBLIMINAL_MESSAGE_DURATION) * 50
-            
-            text_surface = font_jua_subliminal.render(msg['text'], True, (76, 175, 80))
-            text_surface.set_alpha(alpha)
-            text_rect = text_surface.get_rect(center=(msg['x'], current_y))
-            screen.blit(text_surface, text_rect)
-        else:
-            messages_to_remove.append(msg)
-    
-    for msg in messages_to_remove:
-        active_subliminal_messages.remove(msg)
+    for msg in view.active_subliminal_messages.values():
+        text_surface = get_font('subliminal').render(msg['text'], True, (76, 175, 80))
+        text_surface.set_alpha(msg['alpha'])
+        text_rect = text_surface.get_rect(center=(msg['x'], msg['y']))
+        screen.blit(text_surface, text_rect)
+    profiler.mark('messages')
 
 
 def draw_start_screen():
     """초기 시작 화면을 그립니다."""
-    screen.fill(WHITE)
-    draw_background_text() # 배경 텍스트 그리기
+    screen.blit(get_background_layer('start'), (0, 0)) # 배경 + 배경 텍스트
 
-    title_surface = font_jua_title.render("2048", True, (76, 175, 80)) # #4CAF50
+    title_surface = get_font('title').render("2048", True, (76, 175, 80)) # #4CAF50
     title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
     screen.blit(title_surface, title_rect)
 
     start_button_rect = pygame.Rect(0, 0, 250, 80)
     start_button_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50)
     draw_rounded_rect(screen, START_BUTTON_COLOR, start_button_rect, 15)
-    start_text = font_jua_medium.render("Let's growth!", True, WHITE) 
+    start_text = get_font('medium').render("Let's growth!", True, WHITE) 
     start_text_rect = start_text.get_rect(center=start_button_rect.center)
     screen.blit(start_text, start_text_rect)
+    profiler.mark('background')
 
-    pygame.display.flip() # 화면 업데이트
     return start_button_rect
 
-def draw_game_screen():
+def draw_game_screen(view):
     """메인 게임 화면을 그립니다."""
-    screen.fill(WHITE) # 메인 배경
-    draw_background_text() # 배경 텍스트
-    
-    # 게임 컨테이너 배경 그리기
-    game_container_rect = pygame.Rect(
-        (SCREEN_WIDTH - BOARD_WIDTH) // 2, 
-        (SCREEN_HEIGHT - BOARD_HEIGHT) // 2 + 30, # 헤더 공간을 위해 조정
-        BOARD_WIDTH, 
-        BOARD_HEIGHT + 70 # 헤더 공간 추가
-    )
-    draw_rounded_rect(screen, LIGHT_ORANGE_BG, game_container_rect, 15)
-
-    # 헤더 (버튼) 그리기
-    reset_button_rect = pygame.Rect(0, 0, 150, 40)
-    reset_button_rect.topright = (game_container_rect.right - 20, game_container_rect.top + 20)
-    draw_rounded_rect(screen, BUTTON_COLOR, reset_button_rect, 10)
-    reset_text = font_jua_small.render("Reset", True, WHITE) 
-    reset_text_rect = reset_text.get_rect(center=reset_button_rect.center)
-    screen.blit(reset_text, reset_text_rect)
+    # 배경, 배경 텍스트, 게임 컨테이너, 'Reset' 버튼, 빈 격자 셀은 미리 그려 둔 레이어 하나로 그립니다.
+    screen.blit(get_background_layer('game'), (0, 0))
+    game_container_rect = get_game_container_rect()
+    reset_button_rect = get_reset_button_rect()
+
+    # 자동 진행 / 힌트 상태 표시
+    status_texts = []
+    if view.is_autoplay:
+        status_texts.append("AUTO")
+    if view.hint_direction is not None:
+        status_texts.append("Hint: " + DIRECTION_LABELS[view.hint_direction])
+    if status_texts:
+        status_surface = get_font('small').render("  ".join(status_texts), True, TEXT_COLOR)
+        status_rect = status_surface.get_rect(midleft=(game_container_rect.left + 20, reset_button_rect.centery))
+        screen.blit(status_surface, status_rect)
+    profiler.mark('background')
 
     # 실제 게임 보드와 타일 그리기
-    draw_game_board_elements() 
+    draw_game_board_elements(view)
+
+    # 게임이 끝났으면 마지막 애니메이션 위에 종료 화면을 덮습니다.
+    if view.game.status is not None:
+        screen.blit(get_end_overlay(view.game.status), (0, 0))
     
     return reset_button_rect
 
 # --- 메인 게임 루프 ---
-def game_loop():
-    global is_game_started, is_game_over, is_game_won
-
+def game_loop(view):
+    """게임 화면 하나 (GameScreen)를 이벤트에 따라 움직이고 그립니다."""
+
+    # 첫 프레임을 그리기 전에 들어온 클릭도 처리할 수 있도록 버튼 영역을 미리 구합니다.
+    start_button_rect = draw_start_screen()
+    reset_button_rect = get_reset_button_rect()
+    needs_full_redraw = True # 화면 전체를 다시 그리고 flip해야 하는지
+    previous_dirty_rects = [] # 지난 프레임에 갱신한 영역 (지워진 자리도 갱신하기 위해)
+    warm_up = None # 첫 프레임 뒤 남은 자원 준비 (warm_up_assets())
     running = True
     while running:
-        for event in pygame.event.get():
+        if warm_up is not None:
+            # 시작 화면을 띄운 채로 남은 자원을 프레임마다 조금씩 준비합니다 (입력은 계속 받음).
+            slice_end = time.perf_counter() + WARM_UP_SLICE
+            try:
+                while time.perf_counter() < slice_end:
+                    next(warm_up)
+            except StopIteration:
+                warm_up = None
+                startup_times['warm_up'] = time.perf_counter()
+                if measure_startup:
+                    report_startup()
+                    break
+
+        if DIRTY_RECT_RENDERING and not needs_full_redraw and not view.is_animation_active() and warm_up is None:
+            # 움직이는 것이 없으면 다음 이벤트가 올 때까지 CPU를 쓰지 않고 기다립니다.
+            events = [pygame.event.wait()] + pygame.event.get()
+        else:
+            events = pygame.event.get()
+        profiler.begin_frame() # 이벤트를 기다린 시간은 프레임 시간에 넣지 않습니다
+        view.animation_timeline.advance() # 이번 프레임의 시각으로 모든 애니메이션 진행
+        profiler.mark('logic')
+
+        for event in events:
+            if event.type != pygame.MOUSEMOTION:
+                needs_full_redraw = True # 키 입력, 클릭, 창 이벤트는 화면 전체를 다시 그립니다
             if event.type == pygame.QUIT:
                 running = False
+            if event.type == pygame.VIDEORESIZE:
+                invalidate_background_layers()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profiler.toggle_overlay(keep_enabled=profile_dump_path is not None)
             
-            if not is_game_started:
+            if not view.is_game_started:
                 # 시작 화면 이벤트 처리
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     if start_button_rect.collidepoint(event.pos):
-                        initialize_game()
-                        start_game()
+                        view.start()
             else:
                 # 게임 이벤트 처리
                 if event.type == pygame.KEYDOWN:
-                    if not is_game_over and not is_game_won:
+                    if event.key == pygame.K_z:
+                        # 되돌리기는 게임 종료 화면에서도 동작합니다 (마지막 수를 무르고 계속하기).
+                        profiler.mark('events')
+                        view.undo()
+                        profiler.mark('logic')
+                    elif view.game.status is None:
+                        profiler.mark('events')
                         if event.key == pygame.K_LEFT:
-                            move('left') 
+                            view.move('left')
                         elif event.key == pygame.K_RIGHT:
-                            move('right')
+                            view.move('right')
                         elif event.key == pygame.K_UP:
-                            move('up')
+                            view.move('up')
                         elif event.key == pygame.K_DOWN:
-                            move('down') 
-                        check_game_status() 
+                            view.move('down')
+                        elif event.key == pygame.K_h:
+                            view.show_hint()
+                        elif event.key == pygame.K_a:
+                            view.is_autoplay = not view.is_autoplay
+                        elif event.key == pygame.K_y:
+                            view.redo()
+                        profiler.mark('logic')
 
                 if event.type == pygame.MOUSEBUTTONDOWN:
-                    # '다시 시작' 버튼 클릭 처리
-                    if reset_button_rect.collidepoint(event.pos):
-                        initialize_game()
-                        start_game()
-        
-        # 화면 그리기
-        screen.fill(WHITE) 
-        draw_background_text() 
+                    # 종료 화면의 '다시 시도' 버튼 또는 '다시 시작' 버튼 클릭 처리
+                    if view.game.status is not None and get_try_again_button_rect().collidepoint(event.pos):
+                        view.start()
+                    elif reset_button_rect.collidepoint(event.pos):
+                        view.start()
 
-        if is_game_started:
-            reset_button_rect = draw_game_screen() 
-        else:
-            start_button_rect = draw_start_screen() 
+        profiler.mark('events')
 
-        pygame.display.flip() 
-        clock.tick(60) 
+        # 자동 진행 모드이면 탐색으로 한 수 진행
+        if view.is_game_started and view.is_autoplay and view.game.status is None:
+            if view.autoplay_step():
+                needs_full_redraw = True # 힌트/상태 표시도 바뀌므로 전체 갱신
+        profiler.mark('logic')
 
-    pygame.quit()
-    sys.exit()
+        if DIRTY_RECT_RENDERING and not needs_full_redraw and not view.is_animation_active():
+            continue # 바뀐 것이 없으면 그리지 않습니다
 
-def start_game():
-    """게임을 시작합니다 (시작 화면 숨기기, 초기 타일 추가)."""
-    global is_game_started 
-    is_game_started = True
-    add_random_tile()
-    add_random_tile()
+        dirty_rects = view.get_dirty_rects() if DIRTY_RECT_RENDERING else []
+        
+        # 화면 그리기 (배경은 각 화면 함수가 배경 레이어로 그립니다)
+        if view.is_game_started:
+            reset_button_rect = draw_game_screen(view)
+        else:
+            start_button_rect = draw_start_screen() 
+        overlay_rect = profiler.draw(screen, get_profiler_font() if profiler.visible else None)
+        if overlay_rect is not None:
+            dirty_rects.append(overlay_rect)
+        profiler.mark('overlay')
 
-# 초기 게임 설정 및 루프 시작
-initialize_game()
-game_loop()
+        if not DIRTY_RECT_RENDERING or needs_full_redraw:
+            pygame.display.flip() 
+        else:
+            pygame.display.update(previous_dirty_rects + dirty_rects)
+        profiler.mark('present')
+        profiler.end_frame()
+        if 'first_frame' not in startup_times:
+            startup_times['first_frame'] = time.perf_counter()
+            warm_up = warm_up_assets()
+        previous_dirty_rects = dirty_rects
+        needs_full_redraw = False
+        clock.tick(FPS) 
+
+    quit_game(view)
+
+# 초기 게임 설정 및 루프 시작 (직접 실행할 때만)
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="2048 게임")
+    parser.add_argument('--size', type=int, default=BOARD_SIZE,
+                        help="보드 한 변의 칸 수 (%d~%d, 예: 4, 6, 8, 16)" % (game_core.MIN_BOARD_SIZE, game_core.MAX_BOARD_SIZE))
+    parser.add_argument('--seed', type=int, default=None, help="모든 게임을 이 시드로 시작합니다 (게임 재현용)")
+    parser.add_argument('--record', metavar='PATH', default=None, help="게임이 끝나면 리플레이를 이 파일에 저장합니다")
+    parser.add_argument('--profile', action='store_true', help="프레임 프로파일러 오버레이를 켠 채로 시작합니다 (F3로 켜고 끔)")
+    parser.add_argument('--profile-dump', metavar='PATH', default=None, help="종료할 때 프레임 단계별 히스토그램을 JSON으로 저장합니다")
+    parser.add_argument('--search-workers', type=int, default=None, metavar='N',
+                        help="자동 진행/힌트 탐색을 N개의 작업자 프로세스로 나눕니다 (0: 코어 수만큼)")
+    parser.add_argument('--ntuple', metavar='PATH', default=None,
+                        help="자동 진행/힌트에 이 n-튜플 체크포인트 (ntuple.py로 학습)를 씁니다")
+    parser.add_argument('--tablebase', metavar='PATH', default=None,
+                        help="작은 보드 (--size 2, 3)의 자동 진행/힌트에 이 테이블베이스 (tablebase.py로 해석)를 씁니다")
+    parser.add_argument('--corpus', metavar='DIR', default=None,
+                        help="4x4 게임의 모든 수를 이 말뭉치 (corpus.py)에 덧붙입니다")
+    parser.add_argument('--measure-startup', action='store_true',
+                        help="첫 프레임과 자원 준비까지 걸린 시간을 출력하고 종료합니다")
+    args = parser.parse_args()
+    try:
+        configure_board(args.size)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.seed is not None and not 0 <= args.seed <= replay.MAX_SEED:
+        parser.error("시드는 0 이상 2^64 미만이어야 합니다: %d" % args.seed)
+    fixed_seed = args.seed
+    replay_path = args.record
+    profile_dump_path = args.profile_dump
+    profiler.enabled = args.profile or profile_dump_path is not None
+    profiler.visible = args.profile
+    measure_startup = args.measure_startup
+    if args.ntuple is not None:
+        import ntuple # 학습된 n-튜플 네트워크 정책
+        try:
+            ai_network = ntuple.NTupleNetwork.load(args.ntuple)
+        except (OSError, ntuple.CheckpointError) as e:
+            parser.error(str(e))
+    if args.tablebase is not None:
+        import tablebase # 작은 보드의 완전 해석 결과
+        try:
+            ai_tablebase = tablebase.Tablebase.load(args.tablebase)
+        except (OSError, tablebase.TablebaseError) as e:
+            parser.error(str(e))
+        if not ai_tablebase.fits(BOARD_SIZE, BOARD_SIZE):
+            parser.error("테이블베이스는 %dx%d 보드용입니다: %s"
+                         % (ai_tablebase.shape.rows, ai_tablebase.shape.cols, args.tablebase))
+    if args.corpus is not None:
+        if BOARD_SIZE != game_core.BOARD_SIZE:
+            parser.error("말뭉치는 %dx%d 게임만 기록합니다" % (game_core.BOARD_SIZE, game_core.BOARD_SIZE))
+        import corpus # 열 단위 수 말뭉치
+        try:
+            corpus_writer = corpus.CorpusWriter(args.corpus)
+        except (OSError, corpus.CorpusError) as e:
+            parser.error(str(e))
+    if args.search_workers is not None:
+        import parallel_search # 여러 코어를 쓰는 탐색
+        ai_searcher = parallel_search.ParallelSearcher(args.search_workers or None)
+    init_display()
+    game_loop(GameScreen())